@@ -38,7 +38,10 @@ __all__ = [
     "fibonacci_sequence",
     "is_perfect_number",
     "euler_totient",
+    "totient_sieve",
+    "collatz_iter",
     "collatz_sequence",
+    "collatz_lengths",
     "twin_primes",
     "verify_goldbach_conjecture",
     "NumberTheoryUtils",
@@ -61,6 +64,7 @@ __all__ = [
     "FUNCTIONS",
     # Linear algebra
     "Vector",
+    "VectorBatch",
     "MatrixOperations",
     "LinearAlgebra",
     # Visualization
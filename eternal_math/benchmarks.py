@@ -5,23 +5,47 @@ This module provides benchmarking tools to measure and analyze the performance
 of mathematical algorithms implemented in eternal-math.
 """
 
+import json
+import math
+import os
 import statistics
 import time
-from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional
+import timeit
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
 
 import matplotlib.pyplot as plt
+import numpy as np
 
 from .core import gcd, is_prime
 from .number_theory import (
     fibonacci_sequence,
-    is_perfect_number,
     sieve_of_eratosthenes,
 )
 
+# Shortest duration of a single timing sample, in nanoseconds
+_MIN_SAMPLE_NS = 10_000
 
-@dataclass
-class BenchmarkResult:
+# Upper bound on the number of calls batched into one sample
+_MAX_BATCH = 1000
+
+# Input size of the common first-argument types, looked up by exact type
+# before falling back to isinstance/__len__ checks
+_SIZE_EXTRACTORS: Dict[type, Callable[[Any], int]] = {
+    int: int,
+    list: len,
+    tuple: len,
+    dict: len,
+    str: len,
+}
+
+# Keyword arguments that name an input size, in order of preference
+_SIZE_KEYWORDS = ("n", "limit", "max_value", "size")
+
+
+class BenchmarkResult(NamedTuple):
     """Container for benchmark results."""
 
     function_name: str
@@ -34,6 +58,26 @@ class BenchmarkResult:
     max_time: float
 
 
+def _time_job(job: Tuple[Callable[..., Any], int, int]) -> BenchmarkResult:
+    """Time one (function, size, iterations) job in a worker process."""
+    func, size, iterations = job
+    return PerformanceBenchmark().time_function(func, size, iterations=iterations)
+
+
+def _euclid_gcd(a: int, b: int) -> int:
+    """Interpreted Euclidean algorithm, the baseline for the C math.gcd."""
+    while b:
+        a, b = b, a % b
+    return abs(a)
+
+
+def _gcd_batch(
+    gcd_func: Callable[[int, int], int], lefts: List[int], rights: List[int]
+) -> List[int]:
+    """Apply a GCD implementation pairwise over two lists of operands."""
+    return list(map(gcd_func, lefts, rights))
+
+
 class PerformanceBenchmark:
     """Performance benchmarking system for mathematical algorithms."""
 
@@ -41,13 +85,29 @@ class PerformanceBenchmark:
         """Initialize the benchmark system."""
         self.results: List[BenchmarkResult] = []
 
-    def find_perfect_numbers(self, limit: int) -> List[int]:
-        """Helper function to find perfect numbers up to a limit."""
-        perfect_nums = []
-        for i in range(1, limit + 1):
-            if is_perfect_number(i):
-                perfect_nums.append(i)
-        return perfect_nums
+    @staticmethod
+    def find_perfect_numbers(limit: int) -> List[int]:
+        """
+        Helper function to find perfect numbers up to a limit.
+
+        Divisor sums for the whole range are accumulated in one NumPy array:
+        each d <= sqrt(limit) adds the pair (d, m // d) to every multiple
+        m >= d * d, so only sqrt(limit) vectorized updates are needed.
+        """
+        if limit < 2:
+            return []
+
+        # numbers[k] == k serves both as the cofactors m // d of the multiples
+        # of d (as views, no per-d allocation) and as the targets below
+        numbers = np.arange(limit + 1, dtype=np.int64)
+        divisor_sums = np.zeros(limit + 1, dtype=np.int64)
+        for d in range(1, math.isqrt(limit) + 1):
+            divisor_sums[d * d :: d] += d + numbers[d : limit // d + 1]
+            divisor_sums[d * d] -= d  # d * d has d as a divisor only once
+
+        # n is perfect when the sum of all its divisors is 2n
+        perfect = np.flatnonzero(divisor_sums[2:] == 2 * numbers[2:]) + 2
+        return perfect.tolist()
 
     def time_function(
         self, func: Callable[..., Any], *args: Any, iterations: int = 10, **kwargs: Any
@@ -64,13 +124,40 @@ class PerformanceBenchmark:
         Returns:
             BenchmarkResult containing timing statistics
         """
-        times = []
-
-        for _ in range(iterations):
-            start_time = time.perf_counter()
-            func(*args, **kwargs)  # Execute function without storing result
-            end_time = time.perf_counter()
-            times.append(end_time - start_time)
+        # Samples are integer nanoseconds; they are converted to seconds only
+        # once the statistics are computed
+        call = partial(func, *args, **kwargs)
+
+        # Functions memoized with functools.lru_cache are timed cold: the cache
+        # is cleared (untimed) before every single-call sample, since a batch
+        # or a repeat would otherwise only measure cache hits
+        cache_clear = getattr(func, "cache_clear", None)
+        if callable(cache_clear):
+            timer = timeit.Timer(call, setup=cache_clear, timer=time.perf_counter_ns)
+            number = 1
+            samples = [int(t) for t in timer.repeat(repeat=iterations, number=1)]
+        else:
+            timer = timeit.Timer(call, timer=time.perf_counter_ns)
+
+            # Calls much faster than the timer overhead are batched so that
+            # each sample lasts at least _MIN_SAMPLE_NS. A slow first call is
+            # already a valid sample and is kept, so expensive functions run
+            # exactly `iterations` times.
+            first_call = int(timer.timeit(number=1))
+            if first_call >= _MIN_SAMPLE_NS:
+                number = 1
+                samples = [first_call]
+                samples += [
+                    int(t) for t in timer.repeat(repeat=iterations - 1, number=1)
+                ]
+            else:
+                number = min(math.ceil(_MIN_SAMPLE_NS / max(first_call, 1)), _MAX_BATCH)
+                samples = [
+                    int(t) for t in timer.repeat(repeat=iterations, number=number)
+                ]
+
+        # Seconds per call
+        scale = 1e-9 / number
 
         # Determine input size for common patterns
         input_size = self._extract_input_size(args, kwargs)
@@ -78,28 +165,55 @@ class PerformanceBenchmark:
         benchmark_result = BenchmarkResult(
             function_name=func.__name__,
             input_size=input_size,
-            execution_time=sum(times),
+            execution_time=sum(samples) * scale,
             iterations=iterations,
-            mean_time=statistics.mean(times),
-            std_dev=statistics.stdev(times) if len(times) > 1 else 0.0,
-            min_time=min(times),
-            max_time=max(times),
+            mean_time=statistics.fmean(samples) * scale,
+            std_dev=statistics.stdev(samples) * scale if len(samples) > 1 else 0.0,
+            min_time=min(samples) * scale,
+            max_time=max(samples) * scale,
         )
 
         self.results.append(benchmark_result)
         return benchmark_result
 
+    def _time_sizes(
+        self, func: Callable[..., Any], sizes: List[int], iterations: int
+    ) -> List[BenchmarkResult]:
+        """
+        Time a single-argument function for each input size.
+
+        Sizes are independent CPU-bound jobs, so on multi-core machines they
+        run in a process pool (one size per worker); results keep the order
+        of ``sizes`` and are recorded in ``self.results`` as usual.
+        """
+        workers = min(len(sizes), os.cpu_count() or 1)
+        if workers <= 1:
+            return [
+                self.time_function(func, size, iterations=iterations) for size in sizes
+            ]
+
+        jobs = [(func, size, iterations) for size in sizes]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_time_job, jobs))
+
+        self.results.extend(results)
+        return results
+
     def _extract_input_size(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> int:
         """Extract a representative input size from function arguments."""
         # For most number theory functions, the first argument is the size/limit
         if args:
-            if isinstance(args[0], int):
-                return args[0]
-            elif hasattr(args[0], "__len__"):
-                return len(args[0])
+            first = args[0]
+            extractor = _SIZE_EXTRACTORS.get(type(first))
+            if extractor is not None:
+                return extractor(first)
+            if isinstance(first, int):
+                return first
+            elif hasattr(first, "__len__"):
+                return len(first)
 
         # Check for common keyword arguments
-        for key in ["n", "limit", "max_value", "size"]:
+        for key in _SIZE_KEYWORDS:
             if key in kwargs:
                 return int(kwargs[key])
 
@@ -126,9 +240,10 @@ class PerformanceBenchmark:
         }
 
         # Benchmark Sieve of Eratosthenes
-        for size in sizes:
-            result = self.time_function(sieve_of_eratosthenes, size, iterations=5)
-            results["sieve_of_eratosthenes"].append(result)
+        results["sieve_of_eratosthenes"] = self._time_sizes(
+            sieve_of_eratosthenes, sizes, iterations=5
+        )
+        for size, result in zip(sizes, results["sieve_of_eratosthenes"]):
             print(
                 f"Sieve of Eratosthenes (n={size}): "
                 f"{result.mean_time:.4f}s ± {result.std_dev:.4f}s"
@@ -161,11 +276,9 @@ class PerformanceBenchmark:
         if sizes is None:
             sizes = [10, 50, 100, 500, 1000]
 
-        results = []
+        results = self._time_sizes(fibonacci_sequence, sizes, iterations=10)
 
-        for size in sizes:
-            result = self.time_function(fibonacci_sequence, size, iterations=10)
-            results.append(result)
+        for size, result in zip(sizes, results):
             print(
                 f"Fibonacci sequence (n={size}): "
                 f"{result.mean_time:.4f}s ± {result.std_dev:.4f}s"
@@ -197,10 +310,10 @@ class PerformanceBenchmark:
         # Perfect numbers (smaller sizes due to computational complexity)
         print("3. Perfect Numbers:")
         perfect_sizes = [100, 500, 1000]
-        perfect_results = []
-        for size in perfect_sizes:
-            result = self.time_function(self.find_perfect_numbers, size, iterations=3)
-            perfect_results.append(result)
+        perfect_results = self._time_sizes(
+            self.find_perfect_numbers, perfect_sizes, iterations=3
+        )
+        for size, result in zip(perfect_sizes, perfect_results):
             print(
                 f"Perfect numbers (limit={size}): "
                 f"{result.mean_time:.4f}s ± {result.std_dev:.4f}s"
@@ -233,19 +346,26 @@ class PerformanceBenchmark:
             results: Dictionary of benchmark results
             title: Plot title
         """
-        plt.figure(figsize=(12, 8))
+        fig = plt.figure(figsize=(12, 8))
 
         for algorithm, benchmark_list in results.items():
             if not benchmark_list:
                 continue
 
-            input_sizes = [r.input_size for r in benchmark_list if r.input_size > 0]
-            mean_times = [r.mean_time for r in benchmark_list if r.input_size > 0]
+            count = len(benchmark_list)
+            input_sizes = np.fromiter(
+                (r.input_size for r in benchmark_list), dtype=np.int64, count=count
+            )
+            mean_times = np.fromiter(
+                (r.mean_time for r in benchmark_list), dtype=np.float64, count=count
+            )
 
-            if input_sizes and mean_times:
+            # Results without an input size cannot be placed on the x-axis
+            sized = input_sizes > 0
+            if sized.any():
                 plt.loglog(
-                    input_sizes,
-                    mean_times,
+                    input_sizes[sized],
+                    mean_times[sized],
                     "o-",
                     label=algorithm,
                     linewidth=2,
@@ -261,10 +381,14 @@ class PerformanceBenchmark:
 
         # Save the plot
         plot_filename = f"benchmark_{title.lower().replace(' ', '_')}.png"
-        plt.savefig(f"math_plots/{plot_filename}", dpi=300, bbox_inches="tight")
+        # Same resolution as MathVisualizer; 300 dpi quadrupled the pixels
+        # rasterized and deflated for every saved plot
+        plt.savefig(f"math_plots/{plot_filename}", dpi=150, bbox_inches="tight")
         print(f"Performance plot saved as: math_plots/{plot_filename}")
 
         plt.show()
+        # Release the figure so repeated benchmark runs don't accumulate them
+        plt.close(fig)
 
     def generate_performance_report(self) -> str:
         """
@@ -281,9 +405,7 @@ class PerformanceBenchmark:
         # Group results by function
         by_function: Dict[str, List[BenchmarkResult]] = {}
         for result in self.results:
-            if result.function_name not in by_function:
-                by_function[result.function_name] = []
-            by_function[result.function_name].append(result)
+            by_function.setdefault(result.function_name, []).append(result)
 
         for func_name, func_results in by_function.items():
             report.append(f"Function: {func_name}")
@@ -292,13 +414,15 @@ class PerformanceBenchmark:
             for result in func_results:
                 if result.input_size > 0:
                     report.append(f"  Input Size: {result.input_size}")
-                report.append(f"  Mean Time: {result.mean_time:.6f}s")
-                report.append(f"  Std Dev: {result.std_dev:.6f}s")
-                report.append(
-                    f"  Min/Max: {result.min_time:.6f}s / {result.max_time:.6f}s"
+                report.extend(
+                    [
+                        f"  Mean Time: {result.mean_time:.6f}s",
+                        f"  Std Dev: {result.std_dev:.6f}s",
+                        f"  Min/Max: {result.min_time:.6f}s / {result.max_time:.6f}s",
+                        f"  Iterations: {result.iterations}",
+                        "",
+                    ]
                 )
-                report.append(f"  Iterations: {result.iterations}")
-                report.append("")
 
             report.append("")
 
@@ -311,10 +435,19 @@ class PerformanceBenchmark:
         Args:
             filename: Output filename
         """
-        report = self.generate_performance_report()
+        Path(filename).write_text(self.generate_performance_report(), encoding="utf-8")
 
-        with open(filename, "w") as f:
-            f.write(report)
+        print(f"Benchmark results saved to: {filename}")
+
+    def save_results_json(self, filename: str) -> None:
+        """
+        Save benchmark results as newline-delimited JSON (one result per line).
+
+        Args:
+            filename: Output filename
+        """
+        lines = [json.dumps(result._asdict()) + "\n" for result in self.results]
+        Path(filename).write_text("".join(lines), encoding="utf-8")
 
         print(f"Benchmark results saved to: {filename}")
 
@@ -398,6 +531,26 @@ class PerformanceBenchmark:
             "algorithm": "Optimized Sieve (Auto-selects Implementation)",
         }
 
+        # Compare the interpreted Euclidean loop against the C math.gcd that
+        # core.gcd delegates to, over a fixed batch of input pairs
+        lefts = [limit + k * 7919 for k in range(1000)]
+        rights = [k * 104_729 + 1 for k in range(1000)]
+        gcd_funcs: List[Tuple[str, Callable[[int, int], int], str]] = [
+            ("euclid_gcd", _euclid_gcd, "Python Euclidean GCD (1000 pairs)"),
+            ("math_gcd", math.gcd, "C math.gcd (1000 pairs)"),
+        ]
+        for key, gcd_func, algorithm in gcd_funcs:
+            gcd_times = timeit.repeat(
+                partial(_gcd_batch, gcd_func, lefts, rights), number=1, repeat=3
+            )
+            results[key] = {
+                "mean_time": statistics.mean(gcd_times),
+                "std_dev": statistics.stdev(gcd_times),
+                "min_time": min(gcd_times),
+                "max_time": max(gcd_times),
+                "algorithm": algorithm,
+            }
+
         # Calculate performance improvements
         standard_mean = results["standard_sieve"]["mean_time"]
         optimized_mean = results["optimized_sieve"]["mean_time"]
@@ -438,6 +591,7 @@ def run_performance_analysis() -> PerformanceBenchmark:
     # Generate and save report
     print("\n" + benchmark.generate_performance_report())
     benchmark.save_results("performance_report.txt")
+    benchmark.save_results_json("performance_report.ndjson")
 
     return benchmark
 
@@ -16,6 +16,7 @@ from eternal_math import (
     PerformanceBenchmark,
     SymbolicMath,
     Vector,
+    collatz_lengths,
     collatz_sequence,
     create_fundamental_theorem_of_arithmetic,
     create_output_directory,
@@ -739,18 +740,17 @@ class EternalMathCLI:
                         float(x) for x in fibonacci_sequence(min(n, 15))
                     ]
                 elif seq_type == "primes":
-                    primes = sieve_of_eratosthenes(n * 10)  # Get more primes
-                    sequences["Primes"] = [float(x) for x in primes[: min(n, 15)]]
+                    # Get more primes; slicing the array is a view, not a copy
+                    primes = sieve_of_eratosthenes(n * 10, as_array=True)
+                    sequences["Primes"] = primes[: min(n, 15)].astype(float).tolist()
                 elif seq_type == "euler":
                     sequences["Euler φ(n)"] = [
                         float(euler_totient(i)) for i in range(1, min(n, 15) + 1)
                     ]
                 elif seq_type == "collatz":
                     # Use length of Collatz sequences
-                    sequences["Collatz Steps"] = [
-                        float(len(collatz_sequence(i)))
-                        for i in range(1, min(n, 15) + 1)
-                    ]
+                    lengths = collatz_lengths(range(1, min(n, 15) + 1))
+                    sequences["Collatz Steps"] = lengths.astype(float).tolist()
                 else:
                     print(f"Unknown sequence type: {seq_type}")
                     return
@@ -862,7 +862,7 @@ class EternalMathCLI:
             vector = Vector(components)
             print(f"\n📐 Vector: {vector}")
             print(f"   Dimension: {vector.dimension}")
-            print(f"   Magnitude: {vector.magnitude():.6f}\n")
+            print(f"   Magnitude: {vector.magnitude_f():.6f}\n")
         except Exception as e:
             print(f"Error creating vector: {e}\n")
 
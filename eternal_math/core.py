@@ -189,9 +189,7 @@ def gcd(a: int, b: int) -> int:
     if a == 0 and b == 0:
         raise ValueError("GCD is undefined when both arguments are zero")
 
-    while b:
-        a, b = b, a % b
-    return abs(a)
+    return math.gcd(a, b)
 
 
 def lcm(a: int, b: int) -> int:
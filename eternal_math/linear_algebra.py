@@ -2,21 +2,307 @@
 Linear algebra operations and matrix computations for Eternal Math.
 """
 
-from typing import List, Tuple, Union
+import math
+from functools import lru_cache
+from typing import List, Optional, Tuple, Union, cast, overload
 
+import numpy as np
 import sympy as sp
-from sympy import Matrix, eye, zeros
+from sympy import ImmutableMatrix, Matrix, eye, zeros
+from sympy.matrices.exceptions import NonInvertibleMatrixError
+
+# Relative norm below which a float vector is treated as linearly dependent
+_DEPENDENCE_TOL = 1e-12
+
+# Largest per-dimension deviation of A @ A^-1 from the identity accepted from
+# the LAPACK inverse
+_INVERSE_RESIDUAL_TOL = 1e-10
+
+# Float vectors up to this dimension use closed forms on Python floats, which
+# beat NumPy's per-call dispatch overhead for so few entries
+_SMALL_DIMENSION = 3
+
+
+def _sympify_entries(
+    entries: List[Union[int, float, sp.Expr]],
+) -> List[sp.Expr]:
+    """
+    Convert raw entries to SymPy objects.
+
+    Plain ``int``/``float`` input (the common case) is wrapped directly in
+    ``sp.Integer``/``sp.Float``, skipping the type dispatch of ``sp.sympify``.
+    """
+    if all(type(e) is int or type(e) is float for e in entries):
+        return [sp.Integer(e) if type(e) is int else sp.Float(e) for e in entries]
+    return [sp.sympify(e) for e in entries]
+
+
+def _float_array(components: List[sp.Expr]) -> Optional[np.ndarray]:
+    """
+    Return the components as a float64 array if every entry is a ``Float``.
+
+    Double-precision ``Float`` entries already compute in double precision
+    under SymPy, so NumPy gives the same results. Vectors with any exact
+    (integer or rational) or symbolic entry return ``None`` and stay on the
+    SymPy path, which keeps those entries exact.
+    """
+    if not all(c.is_Float and c._prec <= 53 for c in components):
+        return None
+    return np.array([float(c) for c in components], dtype=np.float64)
+
+
+def _gram_schmidt_array(rows: np.ndarray) -> np.ndarray:
+    """
+    Gram-Schmidt orthogonalization of the rows of a 2-D float64 array.
+
+    Each vector's projections onto all previously accepted vectors are
+    removed with one matrix-vector product against the stacked basis. The
+    projection is applied twice ("twice is enough" reorthogonalization), which
+    keeps the basis orthogonal to working precision like modified Gram-Schmidt
+    while staying a pair of BLAS calls per vector. Vectors left with
+    (relatively) negligible norm are dropped as linearly dependent.
+    """
+    basis = np.empty_like(rows)
+    squared_norms = np.empty(len(rows), dtype=np.float64)
+    count = 0
+
+    for v in rows:
+        accepted = basis[:count]
+        u = v - ((accepted @ v) / squared_norms[:count]) @ accepted
+        u -= ((accepted @ u) / squared_norms[:count]) @ accepted
+        u_squared = float(u @ u)
+        if u_squared > (_DEPENDENCE_TOL**2) * float(v @ v):
+            basis[count] = u
+            squared_norms[count] = u_squared
+            count += 1
+
+    return basis[:count]
+
+
+def _rref_array(array: np.ndarray) -> np.ndarray:
+    """
+    Reduced row echelon form of a 2-D float64 array.
+
+    Gauss-Jordan elimination with partial pivoting; each pivot clears its
+    whole column with one rank-1 update. Pivot candidates below the tolerance
+    used by ``numpy.linalg.matrix_rank`` are treated as zero.
+    """
+    result = array.copy()
+    rows, cols = result.shape
+    tol = max(rows, cols) * np.finfo(np.float64).eps * np.abs(result).max(initial=0.0)
+
+    pivot_row = 0
+    for col in range(cols):
+        if pivot_row == rows:
+            break
+        pivot = pivot_row + int(np.argmax(np.abs(result[pivot_row:, col])))
+        if abs(result[pivot, col]) <= tol:
+            result[pivot_row:, col] = 0.0
+            continue
+
+        result[[pivot_row, pivot]] = result[[pivot, pivot_row]]
+        result[pivot_row] /= result[pivot_row, col]
+        others = np.arange(rows) != pivot_row
+        result[others] -= np.outer(result[others, col], result[pivot_row])
+        result[others, col] = 0.0
+        pivot_row += 1
+
+    return result
+
+
+def _pair_gram(a: np.ndarray, b: np.ndarray) -> Tuple[float, float, float]:
+    """
+    Return ``(a·b, a·a, b·b)`` for two float64 vectors.
+
+    All three products come from a single 2x2 Gram matrix, so each vector is
+    read once.
+    """
+    stacked = np.vstack((a, b))
+    (aa, ab), (_, bb) = (stacked @ stacked.T).tolist()
+    return ab, aa, bb
+
+
+def _float_matrix(matrix: Matrix) -> Optional[np.ndarray]:
+    """
+    Return a float64 array for a matrix of only ``Float`` entries, else ``None``.
+
+    SymPy stores entries row by row, so the array is built in C (row-major)
+    order directly and row-wise kernels read it sequentially.
+    """
+    array = _float_array(list(matrix))
+    return None if array is None else array.reshape(matrix.shape)
+
+
+def _symmetric_eigenvectors(
+    array: np.ndarray,
+) -> List[Tuple[sp.Expr, int, List[Matrix]]]:
+    """
+    Eigen-decompose a symmetric float64 array in SymPy's ``eigenvects`` layout.
+
+    ``eigh`` returns eigenvalues in ascending order, so (numerically) repeated
+    eigenvalues are adjacent and are grouped with their eigenvectors.
+    """
+    values, vectors = np.linalg.eigh(array)
+    scale = max(1.0, float(np.abs(values).max()))
+
+    groups: List[Tuple[float, List[int]]] = []
+    for i, value in enumerate(values.tolist()):
+        if groups and abs(value - groups[-1][0]) <= _DEPENDENCE_TOL * scale:
+            groups[-1][1].append(i)
+        else:
+            groups.append((value, [i]))
+
+    return [
+        (
+            sp.Float(value),
+            len(indices),
+            [_matrix_from_array(vectors[:, [i]]) for i in indices],
+        )
+        for value, indices in groups
+    ]
+
+
+def _matrix_from_array(array: np.ndarray) -> Matrix:
+    """Wrap a 2-D float64 array as a SymPy Matrix of ``Float`` entries."""
+    rows, cols = array.shape
+    return Matrix(rows, cols, [sp.Float(x) for x in array.ravel().tolist()])
+
+
+def _integer_rank(matrix: Matrix) -> Optional[int]:
+    """
+    Exact rank of an integer matrix, else ``None``.
+
+    Fraction-free elimination on Python ints; each updated row is divided by
+    the gcd of its entries to keep the numbers small.
+    """
+    if not all(e.is_Integer for e in matrix):
+        return None
+
+    rows = [[int(e) for e in matrix.row(i)] for i in range(matrix.rows)]
+    rank = 0
+    for col in range(matrix.cols):
+        pivot = next((i for i in range(rank, len(rows)) if rows[i][col]), None)
+        if pivot is None:
+            continue
+        rows[rank], rows[pivot] = rows[pivot], rows[rank]
+        pivot_row = rows[rank]
+        for i in range(rank + 1, len(rows)):
+            factor = rows[i][col]
+            if factor:
+                row = [
+                    pivot_row[col] * x - factor * y for x, y in zip(rows[i], pivot_row)
+                ]
+                divisor = math.gcd(*row) or 1
+                rows[i] = [x // divisor for x in row]
+        rank += 1
+    return rank
+
+
+def _small_determinant(matrix: Matrix) -> Optional[sp.Expr]:
+    """
+    Closed-form determinant of a numeric 2x2 or 3x3 matrix, else ``None``.
+
+    Expanding directly (rule of Sarrus for 3x3) skips the dispatch overhead of
+    a general elimination, which dominates for matrices this small.
+    """
+    if matrix.rows not in (2, 3) or not all(
+        e.is_Rational or e.is_Float for e in matrix
+    ):
+        return None
+    if matrix.rows == 2:
+        a, b, c, d = matrix
+        return a * d - b * c
+    a, b, c, d, e, f, g, h, i = matrix
+    return a * (e * i - f * h) - b * (d * i - f * g) + c * (d * h - e * g)
+
+
+def _rational_key(matrix: Matrix) -> Optional[ImmutableMatrix]:
+    """Return a hashable copy of a square matrix of rationals, else ``None``."""
+    if matrix.is_square and all(e.is_Rational for e in matrix):
+        return ImmutableMatrix(matrix)
+    return None
+
+
+@lru_cache(maxsize=64)
+def _rational_lu(
+    matrix: ImmutableMatrix,
+) -> Tuple[ImmutableMatrix, ImmutableMatrix, List[List[int]], sp.Expr]:
+    """
+    Exact LU factorization of a square rational matrix, with its determinant.
+
+    The factors are cached so that ``determinant``, ``inverse`` and
+    ``solve_system`` on the same matrix share a single elimination.
+
+    Returns:
+        Tuple (L, U, row swaps, determinant)
+    """
+    lower, upper, swaps = matrix.LUdecomposition()
+    det = sp.Mul(*[upper[i, i] for i in range(upper.rows)])
+    return lower, upper, swaps, -det if len(swaps) % 2 else det
+
+
+def _lu_solve(key: ImmutableMatrix, rhs: Matrix) -> Matrix:
+    """
+    Solve ``key * x = rhs`` with the cached LU factors of ``key``.
+
+    Raises:
+        NonInvertibleMatrixError: If the matrix is singular
+    """
+    lower, upper, swaps, det = _rational_lu(key)
+    if det == 0:
+        raise NonInvertibleMatrixError("Matrix det == 0; not invertible.")
+    forward = lower.lower_triangular_solve(rhs.permute_rows(swaps))
+    return Matrix(upper.upper_triangular_solve(forward))
 
 
 class Vector:
-    """Represents a mathematical vector with operations."""
+    """
+    Represents a mathematical vector with operations.
 
-    def __init__(self, components: List[Union[int, float, sp.Expr]]):
-        """Initialize a vector with components."""
+    Vectors whose entries are all floating-point are additionally backed by a float64
+    NumPy array, and their arithmetic runs as vectorized array operations.
+    """
+
+    def __init__(self, components: Union[List[Union[int, float, sp.Expr]], np.ndarray]):
+        """
+        Initialize a vector with components.
+
+        A 1-D floating-point ``ndarray`` is adopted as the float64 backing
+        array directly; integer arrays are converted to exact components.
+        """
+        self._components: Optional[List[sp.Expr]] = None
+        self._array: Optional[np.ndarray] = None
+        if isinstance(components, np.ndarray):
+            if components.ndim != 1:
+                raise ValueError("Vector components must be one-dimensional")
+            if np.issubdtype(components.dtype, np.floating) and len(components):
+                self._array = np.ascontiguousarray(components, dtype=np.float64)
+                self.dimension = len(components)
+                return
+            components = components.tolist()
         if not components:
             raise ValueError("Vector must have at least one component")
-        self.components = [sp.sympify(c) for c in components]
+        self._components = _sympify_entries(list(components))
         self.dimension = len(components)
+        self._array = _float_array(self._components)
+
+    @classmethod
+    def _from_array(cls, array: np.ndarray) -> "Vector":
+        """Wrap a float64 array without converting its entries to SymPy."""
+        vector = cls.__new__(cls)
+        vector._components = None
+        vector._array = np.ascontiguousarray(array, dtype=np.float64)
+        vector.dimension = len(array)
+        return vector
+
+    @property
+    def components(self) -> List[sp.Expr]:
+        """Vector components as SymPy objects."""
+        if self._components is None:
+            # Only array-backed vectors defer building their components
+            array = cast(np.ndarray, self._array)
+            self._components = [sp.Float(x) for x in array.tolist()]
+        return self._components
 
     def __repr__(self) -> str:
         return f"Vector({self.components})"
@@ -37,6 +323,9 @@ class Vector:
         if self.dimension != other.dimension:
             raise ValueError("Vectors must have same dimension for addition")
 
+        if self._array is not None and other._array is not None:
+            return Vector._from_array(self._array + other._array)
+
         result = [a + b for a, b in zip(self.components, other.components)]
         return Vector(result)
 
@@ -47,12 +336,18 @@ class Vector:
         if self.dimension != other.dimension:
             raise ValueError("Vectors must have same dimension for subtraction")
 
+        if self._array is not None and other._array is not None:
+            return Vector._from_array(self._array - other._array)
+
         result = [a - b for a, b in zip(self.components, other.components)]
         return Vector(result)
 
     def __mul__(self, scalar: Union[int, float, sp.Expr]) -> "Vector":
         """Multiply vector by a scalar."""
         scalar = sp.sympify(scalar)
+        if self._array is not None and (scalar.is_Float or scalar.is_Rational):
+            return Vector._from_array(self._array * float(scalar))
+
         result = [scalar * c for c in self.components]
         return Vector(result)
 
@@ -67,7 +362,17 @@ class Vector:
         if self.dimension != other.dimension:
             raise ValueError("Vectors must have same dimension for dot product")
 
-        return sum(a * b for a, b in zip(self.components, other.components))
+        if self._array is not None and other._array is not None:
+            if self.dimension <= _SMALL_DIMENSION:
+                return sp.Float(
+                    sum(
+                        a * b
+                        for a, b in zip(self._array.tolist(), other._array.tolist())
+                    )
+                )
+            return sp.Float(float(self._array @ other._array))
+
+        return sp.Add(*[a * b for a, b in zip(self.components, other.components)])
 
     def cross(self, other: "Vector") -> "Vector":
         """Compute cross product (only for 3D vectors)."""
@@ -76,18 +381,69 @@ class Vector:
         if self.dimension != 3 or other.dimension != 3:
             raise ValueError("Cross product is only defined for 3D vectors")
 
+        if self._array is not None and other._array is not None:
+            # Closed form on Python floats; np.cross has high per-call overhead
+            a, b, c = self._array.tolist()
+            d, e, f = other._array.tolist()
+            return Vector._from_array(
+                np.array([b * f - c * e, c * d - a * f, a * e - b * d])
+            )
+
         a, b, c = self.components
         d, e, f = other.components
 
         result = [b * f - c * e, c * d - a * f, a * e - b * d]
         return Vector(result)
 
+    def perp_dot(self, other: "Vector") -> sp.Expr:
+        """
+        Compute the 2D perp-dot product ``a.x * b.y - a.y * b.x``.
+
+        This is the z-component of the cross product of the vectors embedded
+        in the xy-plane: twice the signed area of the triangle they span.
+        """
+        if not isinstance(other, Vector):
+            raise TypeError("Perp-dot product requires another Vector")
+        if self.dimension != 2 or other.dimension != 2:
+            raise ValueError("Perp-dot product is only defined for 2D vectors")
+
+        if self._array is not None and other._array is not None:
+            (a, b), (c, d) = self._array.tolist(), other._array.tolist()
+            return sp.Float(a * d - b * c)
+
+        (a, b), (c, d) = self.components, other.components
+        return a * d - b * c
+
     def magnitude(self) -> sp.Expr:
         """Compute the magnitude (norm) of the vector."""
-        return sp.sqrt(sum(c**2 for c in self.components))
+        if self._array is not None:
+            return sp.Float(self.magnitude_f())
+        return sp.sqrt(sp.Add(*[c**2 for c in self.components]))
+
+    def magnitude_f(self) -> float:
+        """
+        Compute the magnitude as a Python float.
+
+        Cheaper than ``float(v.magnitude())`` because no exact square root is
+        built first.
+
+        Raises:
+            TypeError: If a component is symbolic
+        """
+        if self._array is not None:
+            if self.dimension <= _SMALL_DIMENSION:
+                return math.hypot(*self._array.tolist())
+            return float(np.linalg.norm(self._array))
+        return math.hypot(*[float(c) for c in self.components])
 
     def normalize(self) -> "Vector":
         """Return a unit vector in the same direction."""
+        if self._array is not None:
+            norm = np.linalg.norm(self._array)
+            if norm == 0:
+                raise ValueError("Cannot normalize zero vector")
+            return Vector._from_array(self._array / norm)
+
         mag = self.magnitude()
         if mag == 0:
             raise ValueError("Cannot normalize zero vector")
@@ -98,6 +454,91 @@ class Vector:
         return Matrix(self.components)
 
 
+class VectorBatch:
+    """
+    A batch of vectors of equal dimension stored as rows of one float64 array.
+
+    Keeping the vectors contiguous lets batch algorithms such as
+    ``LinearAlgebra.gram_schmidt`` work on whole rows with NumPy instead of
+    going through individual ``Vector`` objects.
+    """
+
+    def __init__(self, rows: Union[np.ndarray, List[List[float]]]):
+        """Initialize a batch from a 2-D array-like of shape (count, dimension)."""
+        array = np.array(rows, dtype=np.float64)
+        if array.ndim != 2:
+            raise ValueError("VectorBatch requires a 2-D array of rows")
+        self.array = array
+
+    @classmethod
+    def from_vectors(cls, vectors: List[Vector]) -> "VectorBatch":
+        """
+        Stack vectors into a batch.
+
+        Raises:
+            ValueError: If the vectors are missing or differ in dimension
+            TypeError: If a component is symbolic
+        """
+        if not vectors:
+            raise ValueError("VectorBatch requires at least one vector")
+        if any(v.dimension != vectors[0].dimension for v in vectors):
+            raise ValueError("All vectors must have the same dimension")
+
+        rows = [
+            v._array if v._array is not None else [float(c) for c in v.components]
+            for v in vectors
+        ]
+        return cls(np.vstack(rows))
+
+    @property
+    def dimension(self) -> int:
+        """Dimension shared by all vectors in the batch."""
+        return int(self.array.shape[1])
+
+    def __repr__(self) -> str:
+        return f"VectorBatch({self.array.tolist()})"
+
+    def __len__(self) -> int:
+        return int(self.array.shape[0])
+
+    def __getitem__(self, index: int) -> Vector:
+        return Vector._from_array(self.array[index].copy())
+
+    def to_vectors(self) -> List[Vector]:
+        """Convert the batch back to a list of vectors."""
+        return [Vector._from_array(row) for row in self.array.copy()]
+
+    def dot(self, other: "VectorBatch") -> np.ndarray:
+        """
+        Row-wise dot products with another batch of the same shape.
+
+        Returns:
+            Float64 array with one dot product per pair of rows
+        """
+        if not isinstance(other, VectorBatch):
+            raise TypeError("Batch dot product requires another VectorBatch")
+        if self.array.shape != other.array.shape:
+            raise ValueError("Vector batches must have the same shape")
+        products: np.ndarray = np.einsum("ij,ij->i", self.array, other.array)
+        return products
+
+    def magnitudes(self) -> np.ndarray:
+        """Euclidean norm of every vector in the batch."""
+        return np.linalg.norm(self.array, axis=1)
+
+    def normalize(self) -> "VectorBatch":
+        """
+        Return a batch of unit vectors in the same directions.
+
+        Raises:
+            ValueError: If the batch contains a zero vector
+        """
+        norms = self.magnitudes()
+        if not norms.all():
+            raise ValueError("Cannot normalize zero vector")
+        return VectorBatch(self.array / norms[:, np.newaxis])
+
+
 class MatrixOperations:
     """Class for matrix operations and linear algebra computations."""
 
@@ -112,7 +553,8 @@ class MatrixOperations:
         if not all(len(row) == row_length for row in data):
             raise ValueError("All rows must have the same length")
 
-        return Matrix([[sp.sympify(elem) for elem in row] for row in data])
+        entries = [elem for row in data for elem in row]
+        return Matrix(len(data), row_length, _sympify_entries(entries))
 
     @staticmethod
     def identity_matrix(size: int) -> Matrix:
@@ -133,19 +575,79 @@ class MatrixOperations:
         """Compute the transpose of a matrix."""
         return matrix.T
 
+    @staticmethod
+    def multiply(matrix_a: Matrix, matrix_b: Matrix) -> Matrix:
+        """
+        Compute the matrix product A × B.
+
+        Floating-point matrices are multiplied by NumPy (BLAS); exact and
+        symbolic matrices use SymPy.
+        """
+        if matrix_a.cols != matrix_b.rows:
+            raise ValueError("Matrix dimensions are incompatible for multiplication")
+
+        array_a = _float_matrix(matrix_a)
+        array_b = _float_matrix(matrix_b)
+        if array_a is not None and array_b is not None:
+            return _matrix_from_array(array_a @ array_b)
+
+        return matrix_a * matrix_b
+
     @staticmethod
     def determinant(matrix: Matrix) -> sp.Expr:
-        """Compute the determinant of a square matrix."""
+        """
+        Compute the determinant of a square matrix.
+
+        Numeric 2x2 and 3x3 matrices use the closed-form expansion; larger
+        rational matrices take the determinant from their cached LU factors.
+        """
         if matrix.rows != matrix.cols:
             raise ValueError("Determinant is only defined for square matrices")
+
+        small = _small_determinant(matrix)
+        if small is not None:
+            return small
+
+        key = _rational_key(matrix)
+        if key is not None:
+            return _rational_lu(key)[3]
+
         return matrix.det()
 
     @staticmethod
     def inverse(matrix: Matrix) -> Matrix:
-        """Compute the inverse of a matrix."""
+        """
+        Compute the inverse of a matrix.
+
+        Floating-point matrices are inverted by LAPACK, solving against the
+        identity with one LU factorization (``numpy.linalg.solve``), and the
+        result has ``Float`` entries. The inverse is accepted only if
+        ``A @ A^-1`` is within a small tolerance of the identity; otherwise
+        (e.g. a nearly singular matrix) SymPy's inverse is used. Rational
+        matrices are solved against the identity with their cached exact LU
+        factors, so callers need no simplification to verify the result.
+        """
         if matrix.rows != matrix.cols:
             raise ValueError("Inverse is only defined for square matrices")
 
+        array = _float_matrix(matrix)
+        if array is not None:
+            identity = np.eye(matrix.rows)
+            try:
+                inverse = np.linalg.solve(array, identity)
+            except np.linalg.LinAlgError:
+                raise ValueError("Matrix is singular (determinant is zero)")
+            residual = np.abs(array @ inverse - identity).max()
+            if residual <= _INVERSE_RESIDUAL_TOL * matrix.rows:
+                return _matrix_from_array(inverse)
+
+        key = _rational_key(matrix)
+        if key is not None:
+            try:
+                return _lu_solve(key, eye(matrix.rows))
+            except NonInvertibleMatrixError:
+                raise ValueError("Matrix is singular (determinant is zero)")
+
         det = matrix.det()
         if det == 0:
             raise ValueError("Matrix is singular (determinant is zero)")
@@ -154,7 +656,20 @@ class MatrixOperations:
 
     @staticmethod
     def rank(matrix: Matrix) -> int:
-        """Compute the rank of a matrix."""
+        """
+        Compute the rank of a matrix.
+
+        Floating-point matrices use the SVD-based ``numpy.linalg.matrix_rank``
+        and integer matrices an exact fraction-free elimination on Python
+        ints; rational and symbolic matrices use SymPy's row reduction.
+        """
+        array = _float_matrix(matrix)
+        if array is not None:
+            return int(np.linalg.matrix_rank(array))
+
+        rank = _integer_rank(matrix)
+        if rank is not None:
+            return rank
         return int(matrix.rank())
 
     @staticmethod
@@ -166,28 +681,46 @@ class MatrixOperations:
 
     @staticmethod
     def eigenvalues(matrix: Matrix) -> List[sp.Expr]:
-        """Compute eigenvalues of a square matrix."""
+        """
+        Compute eigenvalues of a square matrix.
+
+        Floating-point matrices are handled by LAPACK: symmetric ones by
+        ``numpy.linalg.eigvalsh`` (ascending order), general ones by the QR
+        algorithm in ``numpy.linalg.eigvals`` (sorted by real, then imaginary
+        part). Exact and symbolic matrices use SymPy.
+        """
         if matrix.rows != matrix.cols:
             raise ValueError("Eigenvalues are only defined for square matrices")
 
-        eigenvals = matrix.eigenvals()
-        # Convert to list, accounting for multiplicities
-        result = []
-        for eigenval, multiplicity in eigenvals.items():
-            result.extend([eigenval] * multiplicity)
-        return result
+        array = _float_matrix(matrix)
+        if array is not None:
+            if np.array_equal(array, array.T):
+                return [sp.Float(w) for w in np.linalg.eigvalsh(array).tolist()]
+            values = np.sort_complex(np.linalg.eigvals(array)).tolist()
+            return [sp.Float(w.real) + sp.Float(w.imag) * sp.I for w in values]
+
+        # multiple=True lists each eigenvalue once per algebraic multiplicity
+        return list(matrix.eigenvals(multiple=True))
 
     @staticmethod
     def eigenvectors(matrix: Matrix) -> List[Tuple[sp.Expr, int, List[Matrix]]]:
         """
         Compute eigenvectors of a square matrix.
 
+        Symmetric floating-point matrices are diagonalized by LAPACK
+        (``numpy.linalg.eigh``), returning orthonormal eigenvectors; all other
+        matrices use SymPy.
+
         Returns:
             List of tuples (eigenvalue, multiplicity, eigenvectors)
         """
         if matrix.rows != matrix.cols:
             raise ValueError("Eigenvectors are only defined for square matrices")
 
+        array = _float_matrix(matrix)
+        if array is not None and np.array_equal(array, array.T):
+            return _symmetric_eigenvectors(array)
+
         return list(matrix.eigenvects())
 
     @staticmethod
@@ -195,6 +728,10 @@ class MatrixOperations:
         """
         Solve the linear system Ax = b.
 
+        Square floating-point systems are solved by LAPACK LU factorization
+        (``numpy.linalg.solve``) and square rational systems reuse the cached
+        exact LU factors; all other systems use SymPy's ``LUsolve``.
+
         Args:
             matrix: Coefficient matrix A
             vector: Right-hand side vector b
@@ -205,11 +742,31 @@ class MatrixOperations:
         if matrix.rows != vector.rows:
             raise ValueError("Matrix and vector dimensions are incompatible")
 
+        array_a = _float_matrix(matrix) if matrix.is_square else None
+        array_b = _float_matrix(vector)
+        if array_a is not None and array_b is not None:
+            try:
+                return _matrix_from_array(np.linalg.solve(array_a, array_b))
+            except np.linalg.LinAlgError:
+                raise NonInvertibleMatrixError("Matrix det == 0; not invertible.")
+
+        key = _rational_key(matrix)
+        if key is not None:
+            return _lu_solve(key, vector)
+
         return matrix.LUsolve(vector)
 
     @staticmethod
     def row_echelon_form(matrix: Matrix) -> Matrix:
-        """Compute row echelon form of a matrix."""
+        """
+        Compute the reduced row echelon form of a matrix.
+
+        Floating-point matrices are reduced in float64 with NumPy; exact and
+        symbolic matrices use SymPy's ``rref``.
+        """
+        array = _float_matrix(matrix)
+        if array is not None:
+            return _matrix_from_array(_rref_array(array))
         return matrix.rref()[0]
 
     @staticmethod
@@ -238,10 +795,23 @@ class LinearAlgebra:
 
     @staticmethod
     def vector_angle(v1: Vector, v2: Vector) -> sp.Expr:
-        """Compute angle between two vectors in radians."""
+        """
+        Compute angle between two vectors in radians.
+
+        For float vectors the dot product and both squared norms come from one
+        2x2 Gram matrix product.
+        """
         if v1.dimension != v2.dimension:
             raise ValueError("Vectors must have same dimension")
 
+        if v1._array is not None and v2._array is not None:
+            dot_product_f, squared_1, squared_2 = _pair_gram(v1._array, v2._array)
+            if squared_1 == 0 or squared_2 == 0:
+                raise ValueError("Cannot compute angle with zero vector")
+            # Clamp rounding excursions outside acos's domain
+            cos_angle_f = dot_product_f / math.sqrt(squared_1 * squared_2)
+            return sp.Float(math.acos(min(1.0, max(-1.0, cos_angle_f))))
+
         dot_product = v1.dot(v2)
         magnitude_product = v1.magnitude() * v2.magnitude()
 
@@ -253,15 +823,51 @@ class LinearAlgebra:
 
     @staticmethod
     def are_orthogonal(v1: Vector, v2: Vector) -> bool:
-        """Check if two vectors are orthogonal."""
+        """
+        Check if two vectors are orthogonal.
+
+        Float vectors count as orthogonal when the cosine of their angle is
+        negligible (within the Gram-Schmidt dependence tolerance); exact
+        vectors compare the dot product with zero exactly.
+        """
+        if (
+            v1._array is not None
+            and v2._array is not None
+            and v1.dimension == v2.dimension
+        ):
+            dot_product_f, squared_1, squared_2 = _pair_gram(v1._array, v2._array)
+            return (
+                dot_product_f * dot_product_f
+                <= _DEPENDENCE_TOL**2 * squared_1 * squared_2
+            )
         return bool(v1.dot(v2) == 0)
 
     @staticmethod
     def are_parallel(v1: Vector, v2: Vector) -> bool:
-        """Check if two vectors are parallel."""
+        """
+        Check if two vectors are parallel.
+
+        Numeric vectors use the equality case of Cauchy-Schwarz,
+        ``(v1·v2)² == |v1|²|v2|²``, which needs neither square roots nor
+        component ratios; float vectors compare it to a relative tolerance.
+        As before, a nonzero vector is not parallel to a zero ``v2``.
+        """
         if v1.dimension != v2.dimension:
             return False
 
+        if v1._array is not None and v2._array is not None:
+            dot_product_f, squared_1, squared_2 = _pair_gram(v1._array, v2._array)
+            if squared_2 == 0:
+                return squared_1 == 0
+            gap = squared_1 * squared_2 - dot_product_f * dot_product_f
+            return gap <= _DEPENDENCE_TOL * squared_1 * squared_2
+
+        if all(c.is_Rational for c in v1.components + v2.components):
+            squared_2 = v2.dot(v2)
+            if squared_2 == 0:
+                return bool(v1.dot(v1) == 0)
+            return bool(v1.dot(v2) ** 2 == v1.dot(v1) * squared_2)
+
         # Vectors are parallel if one is a scalar multiple of the other
         # Find first non-zero component to get the ratio
         ratio = None
@@ -276,12 +882,36 @@ class LinearAlgebra:
 
         return True
 
+    @overload
+    @staticmethod
+    def gram_schmidt(vectors: List[Vector]) -> List[Vector]: ...
+
+    @overload
     @staticmethod
-    def gram_schmidt(vectors: List[Vector]) -> List[Vector]:
-        """Apply Gram-Schmidt orthogonalization to a list of vectors."""
+    def gram_schmidt(vectors: VectorBatch) -> VectorBatch: ...
+
+    @staticmethod
+    def gram_schmidt(
+        vectors: Union[List[Vector], VectorBatch],
+    ) -> Union[List[Vector], VectorBatch]:
+        """
+        Apply Gram-Schmidt orthogonalization to a list of vectors.
+
+        A ``VectorBatch`` is orthogonalized in float64 and returned as a new
+        batch holding the linearly independent part.
+        """
+        if isinstance(vectors, VectorBatch):
+            return VectorBatch(_gram_schmidt_array(vectors.array))
         if not vectors:
             return []
 
+        arrays = [v._array for v in vectors if v._array is not None]
+        if len(arrays) == len(vectors) and all(
+            a.shape == arrays[0].shape for a in arrays
+        ):
+            basis = _gram_schmidt_array(np.vstack(arrays))
+            return [Vector._from_array(row) for row in basis]
+
         orthogonal_vectors: List[Vector] = []
 
         for v in vectors:
@@ -303,12 +933,14 @@ class LinearAlgebra:
     @staticmethod
     def project_vector(v: Vector, onto: Vector) -> Vector:
         """Project vector v onto vector 'onto'."""
-        if onto.magnitude() == 0:
+        squared_norm = onto.dot(onto)
+        # is_zero also catches Float(0.0), which does not compare equal to 0
+        if squared_norm.is_zero:
             raise ValueError("Cannot project onto zero vector")
 
-        projection_coeff = v.dot(onto) / onto.dot(onto)
-        return Vector(projection_coeff * onto)
+        projection: Vector = (v.dot(onto) / squared_norm) * onto
+        return projection
 
 
 # Export main classes and functions
-__all__ = ["Vector", "MatrixOperations", "LinearAlgebra"]
+__all__ = ["Vector", "VectorBatch", "MatrixOperations", "LinearAlgebra"]
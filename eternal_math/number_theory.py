@@ -2,83 +2,129 @@
 Number theory utilities and theorems.
 """
 
-from typing import List, Tuple
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from math import isqrt
+from threading import Lock
+from typing import (
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    overload,
+)
+
+import numpy as np
 
 from .core import gcd, prime_factorization
 from .proofs import Axiom, LogicalStatement, Proof, ProofStep, Theorem
 
+# Values covered per segment: 2**19 values are 2**18 odd-only cells, a 256 KiB
+# bool array that stays cache-resident while amortising the per-prime loop.
+_SEGMENT_SPAN = 1 << 19
 
-def sieve_of_eratosthenes(limit: int) -> List[int]:
+
+@overload
+def sieve_of_eratosthenes(
+    limit: int, *, as_array: Literal[False] = False
+) -> List[int]: ...
+
+
+@overload
+def sieve_of_eratosthenes(limit: int, *, as_array: Literal[True]) -> np.ndarray: ...
+
+
+def sieve_of_eratosthenes(
+    limit: int, *, as_array: bool = False
+) -> Union[List[int], np.ndarray]:
     """
     Generate all prime numbers up to a given limit using the Sieve of Eratosthenes.
 
     For limits > 1,000,000, automatically uses segmented sieve for better memory
      efficiency.
+
+    With ``as_array=True`` the primes are returned as a NumPy integer array,
+    skipping the conversion to a list of Python ints.
     """
     if limit < 2:
-        return []
-
-    # Use segmented sieve for large limits for better memory efficiency
-    if limit > 1_000_000:
-        return _segmented_sieve(limit)
-
-    # Standard sieve for smaller limits
-    sieve = [True] * (limit + 1)
-    sieve[0] = sieve[1] = False
+        primes = np.empty(0, dtype=np.int64)
+    elif limit > 1_000_000:
+        # Use segmented sieve for large limits for better memory efficiency
+        primes = _segmented_sieve(limit)
+    else:
+        # Standard sieve for smaller limits
+        sieve = np.ones(limit + 1, dtype=np.bool_)
+        sieve[:2] = False
+
+        for i in range(2, isqrt(limit) + 1):
+            if sieve[i]:
+                sieve[i * i :: i] = False
 
-    for i in range(2, int(limit**0.5) + 1):
-        if sieve[i]:
-            for j in range(i * i, limit + 1, i):
-                sieve[j] = False
+        primes = np.flatnonzero(sieve)
 
-    return [i for i in range(2, limit + 1) if sieve[i]]
+    return primes if as_array else primes.tolist()
 
 
-def _segmented_sieve(limit: int) -> List[int]:
+def _segmented_sieve(limit: int) -> np.ndarray:
     """
     Segmented Sieve of Eratosthenes for memory-efficient prime generation.
     Uses O(sqrt(n)) memory instead of O(n).
     """
-    import math
-
-    sqrt_limit = int(math.sqrt(limit))
+    sqrt_limit = isqrt(limit)
 
     # Generate primes up to sqrt(limit) using standard sieve
-    base_primes = []
-    if sqrt_limit >= 2:
-        sieve = [True] * (sqrt_limit + 1)
-        sieve[0] = sieve[1] = False
-
-        for i in range(2, int(sqrt_limit**0.5) + 1):
-            if sieve[i]:
-                for j in range(i * i, sqrt_limit + 1, i):
-                    sieve[j] = False
-
-        base_primes = [i for i in range(2, sqrt_limit + 1) if sieve[i]]
-
-    # Process segments
-    segment_size = max(sqrt_limit, 32768)  # At least 32KB segments
-    primes = base_primes[:]
-
-    for segment_start in range(sqrt_limit + 1, limit + 1, segment_size):
-        segment_end = min(segment_start + segment_size - 1, limit)
-        segment = [True] * (segment_end - segment_start + 1)
-
-        for prime in base_primes:
-            # Find first multiple of prime in this segment
-            start = max(prime * prime, (segment_start + prime - 1) // prime * prime)
+    base_primes = sieve_of_eratosthenes(sqrt_limit, as_array=True)
+
+    # Segments are independent once the base primes are known, so they are
+    # sieved on a thread pool when more than one core is available. NumPy
+    # drops the GIL for the large strided stores that dominate each segment.
+    segment_size = max(sqrt_limit, _SEGMENT_SPAN)
+    odd_primes = base_primes[1:].tolist()
+    bounds = [
+        (start, min(start + segment_size - 1, limit))
+        for start in range(sqrt_limit + 1, limit + 1, segment_size)
+    ]
+
+    workers = min(os.cpu_count() or 1, len(bounds))
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            segments = list(
+                executor.map(lambda b: _sieve_segment(b[0], b[1], odd_primes), bounds)
+            )
+    else:
+        segments = [_sieve_segment(lo, hi, odd_primes) for lo, hi in bounds]
+
+    return np.concatenate([base_primes, *segments])
+
+
+def _sieve_segment(
+    segment_start: int, segment_end: int, odd_primes: List[int]
+) -> np.ndarray:
+    """
+    Return the primes in [segment_start, segment_end] as an integer array.
 
-            for multiple in range(start, segment_end + 1, prime):
-                segment[multiple - segment_start] = False
+    The segment stores odd numbers only (index i maps to low + 2*i), so even
+    composites are never allocated or marked. ``odd_primes`` must contain every
+    odd prime up to sqrt(segment_end).
+    """
+    low = segment_start | 1
+    if low > segment_end:
+        return np.empty(0, dtype=np.int64)
+    segment = np.ones((segment_end - low) // 2 + 1, dtype=np.bool_)
 
-        # Collect primes from this segment
-        for i in range(len(segment)):
-            if segment[i]:
-                candidate = segment_start + i
-                if candidate > sqrt_limit:  # Avoid duplicates
-                    primes.append(candidate)
+    for prime in odd_primes:
+        # Find first odd multiple of prime in this segment
+        start = max(prime * prime, (low + prime - 1) // prime * prime)
+        if not start & 1:
+            start += prime
+        # A step of 2*prime in value space is a step of prime in index space
+        segment[(start - low) // 2 :: prime] = False
 
-    return primes
+    return np.flatnonzero(segment) * 2 + low
 
 
 def fibonacci(n: int) -> int:
@@ -92,18 +138,28 @@ def fibonacci(n: int) -> int:
     return b
 
 
+# Shared prefix of the Fibonacci sequence, grown on demand up to
+# _FIBONACCI_CACHE_LIMIT terms (about 4 MB of integers at the limit)
+_FIBONACCI: List[int] = [0, 1]
+_FIBONACCI_CACHE_LIMIT = 10_000
+_FIBONACCI_LOCK = Lock()
+
+
 def fibonacci_sequence(count: int) -> List[int]:
     """Generate the first 'count' Fibonacci numbers."""
     if count <= 0:
         return []
-    elif count == 1:
-        return [0]
-    elif count == 2:
-        return [0, 1]
 
-    sequence = [0, 1]
-    for i in range(2, count):
-        sequence.append(sequence[i - 1] + sequence[i - 2])
+    if count > len(_FIBONACCI) and len(_FIBONACCI) < _FIBONACCI_CACHE_LIMIT:
+        with _FIBONACCI_LOCK:
+            target = min(count, _FIBONACCI_CACHE_LIMIT)
+            while len(_FIBONACCI) < target:
+                _FIBONACCI.append(_FIBONACCI[-1] + _FIBONACCI[-2])
+
+    # Slicing copies, so callers may modify their list
+    sequence = _FIBONACCI[:count]
+    while len(sequence) < count:
+        sequence.append(sequence[-1] + sequence[-2])
 
     return sequence
 
@@ -135,16 +191,16 @@ def is_perfect_number(n: int) -> bool:
             ):
                 return True
 
-    # General case with optimized divisor sum calculation
-    divisor_sum = 1  # 1 is always a proper divisor
-    sqrt_n = int(n**0.5)
+    # General case with optimized divisor sum calculation. For perfect squares
+    # the root is counted once up front and excluded from the loop, so the loop
+    # body always adds both divisors of a pair without a per-divisor check.
+    sqrt_n = isqrt(n)
+    is_square = sqrt_n * sqrt_n == n
+    divisor_sum = 1 + (sqrt_n if is_square else 0)  # 1 is always a proper divisor
 
-    for i in range(2, sqrt_n + 1):
+    for i in range(2, sqrt_n + (not is_square)):
         if n % i == 0:
-            divisor_sum += i
-            complement = n // i
-            if i != complement:  # Avoid double-counting perfect squares
-                divisor_sum += complement
+            divisor_sum += i + n // i
 
             # Early termination if sum already exceeds n
             if divisor_sum > n:
@@ -153,22 +209,44 @@ def is_perfect_number(n: int) -> bool:
     return divisor_sum == n
 
 
+# Witnesses that make Miller-Rabin deterministic for n < 3.3 * 10**24
+_MILLER_RABIN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+
 def _is_prime(n: int) -> bool:
-    """Fast primality test for moderate-sized numbers."""
+    """
+    Fast primality test using the Miller-Rabin strong probable prime test.
+
+    Exact for n < 3.3 * 10**24; larger n are reported prime only if they pass
+    every witness in ``_MILLER_RABIN_BASES``. Modular exponentiation runs in
+    the built-in ``pow``, so the cost grows with the bit length of n rather
+    than with sqrt(n) as in trial division.
+    """
     if n < 2:
         return False
-    if n == 2:
-        return True
-    if n % 2 == 0:
-        return False
-
-    # Check odd divisors up to sqrt(n)
-    for i in range(3, int(n**0.5) + 1, 2):
-        if n % i == 0:
+    for p in _MILLER_RABIN_BASES:
+        if n % p == 0:
+            return n == p
+
+    # Write n - 1 as d * 2**s with d odd
+    d = n - 1
+    s = (d & -d).bit_length() - 1
+    d >>= s
+
+    for a in _MILLER_RABIN_BASES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
             return False
     return True
 
 
+@lru_cache(maxsize=4096)
 def euler_totient(n: int) -> int:
     """
     Calculate Euler's totient function φ(n) - count of integers up to n
@@ -177,44 +255,113 @@ def euler_totient(n: int) -> int:
     if n == 1:
         return 1
 
+    # prime_factorization returns factors in ascending order, so repeated
+    # primes are adjacent and can be skipped without building a set
     result = n
-    factors = set(prime_factorization(n))
-
-    for p in factors:
-        result = result * (p - 1) // p
+    previous = 0
+    for p in prime_factorization(n):
+        if p != previous:
+            result = result * (p - 1) // p
+            previous = p
 
     return result
 
 
-def collatz_sequence(n: int) -> List[int]:
-    """Generate the Collatz sequence starting from n until reaching 1."""
+def totient_sieve(limit: int) -> np.ndarray:
+    """
+    Compute Euler's totient φ(n) for every n from 0 to limit in one sieve pass.
+
+    Returns an integer array ``phi`` with ``phi[n] == euler_totient(n)`` for
+    1 <= n <= limit (and ``phi[0] == 0``). Much cheaper than calling
+    ``euler_totient`` for each n, which factorizes every value separately.
+    """
+    if limit < 0:
+        return np.empty(0, dtype=np.int64)
+
+    phi = np.arange(limit + 1, dtype=np.int64)
+    for p in sieve_of_eratosthenes(limit):
+        phi[p::p] -= phi[p::p] // p
+
+    return phi
+
+
+def collatz_iter(n: int) -> Iterator[int]:
+    """
+    Lazily yield the Collatz sequence starting from n until reaching 1.
+
+    Useful when only the length or maximum of a trajectory is needed, since
+    no list is allocated.
+    """
     if n <= 0:
-        return []
+        return
 
-    sequence = [n]
+    yield n
     while n != 1:
-        if n % 2 == 0:
-            n = n // 2
-        else:
-            n = 3 * n + 1
-        sequence.append(n)
+        n = n >> 1 if not n & 1 else 3 * n + 1
+        yield n
+
+
+def collatz_sequence(n: int) -> List[int]:
+    """Generate the Collatz sequence starting from n until reaching 1."""
+    return list(collatz_iter(n))
 
-    return sequence
 
+# Largest odd value whose 3n + 1 successor still fits in int64
+_COLLATZ_INT64_MAX = (np.iinfo(np.int64).max - 1) // 3
 
-def twin_primes(limit: int) -> List[Tuple[int, int]]:
+
+def collatz_lengths(starts: Sequence[int]) -> np.ndarray:
     """
-    Find all twin prime pairs (p, p+2) where both are prime, up to the given limit.
+    Return ``len(collatz_sequence(n))`` for every n in starts.
+
+    All trajectories advance together as int64 arrays. Each round strips a
+    whole run of halvings at once using the trailing-zero count of n, then
+    applies a single 3n + 1 step, so the Python-level loop runs once per odd
+    step of the longest trajectory rather than once per term of every one.
+    Values that would overflow int64 are finished with ``collatz_iter``.
     """
-    primes = sieve_of_eratosthenes(limit)
-    prime_set = set(primes)
+    values = np.asarray(starts, dtype=np.int64)
+    lengths = (values > 0).astype(np.int64)
+    active = np.flatnonzero(values > 1)
+    values = values[active]
+
+    while active.size:
+        # n & -n isolates the lowest set bit, an exact power of two in float64
+        trailing_zeros = np.log2(values & -values).astype(np.int64)
+        values >>= trailing_zeros
+        lengths[active] += trailing_zeros
 
-    twin_pairs = []
-    for p in primes:
-        if p + 2 in prime_set:
-            twin_pairs.append((p, p + 2))
+        overflow = values > _COLLATZ_INT64_MAX
+        for i in np.flatnonzero(overflow).tolist():
+            lengths[active[i]] += sum(1 for _ in collatz_iter(int(values[i]))) - 1
 
-    return twin_pairs
+        keep = (values != 1) & ~overflow
+        active = active[keep]
+        values = 3 * values[keep] + 1
+        lengths[active] += 1
+
+    return lengths
+
+
+def twin_primes(
+    limit: int, *, primes: Optional[Union[List[int], np.ndarray]] = None
+) -> List[Tuple[int, int]]:
+    """
+    Find all twin prime pairs (p, p+2) where both are prime, up to the given limit.
+
+    If ``primes`` is given it must be the ascending list (or array) of all
+    primes up to at least ``limit``, e.g. a previous ``sieve_of_eratosthenes``
+    result; it is used instead of sieving again.
+    """
+    if primes is None:
+        prime_array = sieve_of_eratosthenes(limit, as_array=True)
+    else:
+        prime_array = np.asarray(primes, dtype=np.int64)
+        prime_array = prime_array[prime_array <= limit]
+
+    # Consecutive primes two apart are exactly the twin pairs
+    lower = prime_array[:-1][np.diff(prime_array) == 2].tolist()
+    return [(p, p + 2) for p in lower]
 
 
 # Number theory theorems
@@ -378,16 +525,27 @@ def create_fundamental_theorem_of_arithmetic() -> Theorem:
     return theorem
 
 
-def verify_goldbach_conjecture(limit: int) -> bool:
-    """Verify Goldbach's conjecture for all even numbers up to the given limit."""
-    primes = set(sieve_of_eratosthenes(limit))
+def verify_goldbach_conjecture(
+    limit: int, *, primes: Optional[Union[List[int], np.ndarray]] = None
+) -> bool:
+    """
+    Verify Goldbach's conjecture for all even numbers up to the given limit.
+
+    If ``primes`` is given it must be the ascending list (or array) of all
+    primes up to at least ``limit``; it is used instead of sieving again.
+    """
+    if primes is None:
+        primes = sieve_of_eratosthenes(limit)
+    elif isinstance(primes, np.ndarray):
+        primes = primes.tolist()
+    prime_set = set(primes)
 
     for n in range(4, limit + 1, 2):  # Check all even numbers >= 4
         found_pair = False
         for p in primes:
             if p > n // 2:
                 break
-            if (n - p) in primes:
+            if (n - p) in prime_set:
                 found_pair = True
                 break
 
@@ -433,7 +591,10 @@ __all__ = [
     "fibonacci_sequence",
     "is_perfect_number",
     "euler_totient",
+    "totient_sieve",
+    "collatz_iter",
     "collatz_sequence",
+    "collatz_lengths",
     "twin_primes",
     "create_fundamental_theorem_of_arithmetic",
     "verify_goldbach_conjecture",
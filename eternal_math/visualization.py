@@ -6,13 +6,47 @@ sequences, and concepts using matplotlib.
 """
 
 import os
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Callable, List, Mapping, Optional, Tuple, Union
 
 import matplotlib.pyplot as plt
 import numpy as np
 import sympy as sp
 from sympy import lambdify
 
+try:
+    import numexpr
+except ImportError:  # pragma: no cover - optional accelerator
+    numexpr = None
+
+# Sequence data accepted by the plotting methods
+SequenceValues = Union[List[float], np.ndarray]
+
+
+@lru_cache(maxsize=128)
+def _compile_expression(expression: str, backend: str = "numpy") -> Callable[..., Any]:
+    """Parse an expression in x and compile it to a vectorized function."""
+    x = sp.Symbol("x")
+    func: Callable[..., Any] = lambdify(x, sp.sympify(expression), backend)
+    return func
+
+
+def _evaluate_expression(expression: str, x_vals: np.ndarray) -> Any:
+    """
+    Evaluate an expression in x over an array of samples.
+
+    When the optional ``numexpr`` package is installed the whole expression is
+    evaluated as one fused, chunked kernel instead of one NumPy temporary per
+    operator. Expressions numexpr cannot handle fall back to NumPy.
+    """
+    if numexpr is not None:
+        try:
+            return _compile_expression(expression, "numexpr")(x_vals)
+        except (TypeError, ValueError, KeyError, NotImplementedError):
+            # Unsupported function or construct (e.g. gamma, sign, Max)
+            return _compile_expression(expression)(x_vals)
+    return _compile_expression(expression)(x_vals)
+
 
 class MathVisualizer:
     """Class for creating mathematical visualizations."""
@@ -42,16 +76,9 @@ class MathVisualizer:
             bool: True if successful, False otherwise
         """
         try:
-            # Parse the expression
-            x = sp.Symbol("x")
-            expr = sp.sympify(expression)
-
-            # Convert to numerical function
-            func = lambdify(x, expr, "numpy")
-
-            # Generate x values
+            # Generate x values and evaluate the (cached, compiled) expression
             x_vals = np.linspace(x_range[0], x_range[1], 1000)
-            y_vals = func(x_vals)
+            y_vals = _evaluate_expression(expression, x_vals)
 
             # Create the plot
             plt.figure(figsize=self.figure_size)
@@ -84,7 +111,7 @@ class MathVisualizer:
 
     def plot_sequence(
         self,
-        sequence: List[float],
+        sequence: SequenceValues,
         title: Optional[str] = None,
         x_labels: Optional[List[float]] = None,
         save_path: Optional[str] = None,
@@ -93,7 +120,7 @@ class MathVisualizer:
         Plot a mathematical sequence.
 
         Args:
-            sequence: List of values to plot
+            sequence: List or 1-D array of values to plot
             title: Optional title for the plot
             x_labels: Optional labels for x-axis
             save_path: Optional path to save the plot
@@ -291,7 +318,7 @@ class MathVisualizer:
 
     def plot_comparative_sequences(
         self,
-        sequences_dict: Dict[str, List[float]],
+        sequences_dict: Mapping[str, SequenceValues],
         title: Optional[str] = None,
         save_path: Optional[str] = None,
     ) -> bool:
@@ -299,7 +326,8 @@ class MathVisualizer:
         Plot multiple sequences for comparison.
 
         Args:
-            sequences_dict: Dictionary with sequence names as keys and lists as values
+            sequences_dict: Dictionary with sequence names as keys and lists or
+                1-D arrays as values
             title: Optional title for the plot
             save_path: Optional path to save the plot
 
@@ -353,6 +381,5 @@ class MathVisualizer:
 def create_output_directory() -> str:
     """Create output directory for saving plots."""
     output_dir = "math_plots"
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
+    os.makedirs(output_dir, exist_ok=True)
     return output_dir
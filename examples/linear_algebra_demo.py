@@ -6,9 +6,29 @@ This example demonstrates the linear algebra capabilities of Eternal Math,
 including vector operations, matrix computations, and advanced linear algebra concepts.
 """
 
+import io
 import math
+import sys
+from contextlib import contextmanager, redirect_stdout
+from typing import Iterator
 
-from eternal_math import LinearAlgebra, MatrixOperations, Vector
+import numpy as np
+
+from eternal_math import LinearAlgebra, MatrixOperations, Vector, VectorBatch
+
+# Degrees per radian, for printing angles
+RAD2DEG = 180.0 / math.pi
+
+
+@contextmanager
+def buffered_section() -> Iterator[None]:
+    """Collect a section's printed lines and write them to stdout at once."""
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            yield
+    finally:
+        sys.stdout.write(buffer.getvalue())
 
 
 def vector_operations_demo() -> None:
@@ -24,8 +44,8 @@ def vector_operations_demo() -> None:
 
     print(f"   Vector v1: {v1}")
     print(f"   Vector v2: {v2}")
-    print(f"   Magnitude of v1: {float(v1.magnitude()):.3f}")
-    print(f"   Magnitude of v2: {float(v2.magnitude()):.3f}")
+    print(f"   Magnitude of v1: {v1.magnitude_f():.3f}")
+    print(f"   Magnitude of v2: {v2.magnitude_f():.3f}")
 
     # Basic operations
     print(f"\n   v1 + v2 = {v1 + v2}")
@@ -44,7 +64,7 @@ def vector_operations_demo() -> None:
     # Normalization
     normalized_v1 = v1.normalize()
     print(f"\n   Normalized v1: {normalized_v1}")
-    print(f"   Magnitude of normalized v1: {float(normalized_v1.magnitude()):.6f}")
+    print(f"   Magnitude of normalized v1: {normalized_v1.magnitude_f():.6f}")
 
     print()
 
@@ -74,7 +94,7 @@ def matrix_operations_demo() -> None:
     print(transpose_a)
 
     # Matrix multiplication
-    product = matrix_a * matrix_b
+    product = MatrixOperations.multiply(matrix_a, matrix_b)
     print("\n   A × B:")
     print(product)
 
@@ -101,12 +121,12 @@ def eigenvalue_demo() -> None:
     print("   Matrix M:")
     print(matrix)
 
-    # Compute eigenvalues
-    eigenvals = MatrixOperations.eigenvalues(matrix)
+    # Compute eigenvectors once and read the eigenvalues off the result,
+    # rather than solving the characteristic polynomial a second time
+    eigenvects = MatrixOperations.eigenvectors(matrix)
+    eigenvals = [eigenval for eigenval, mult, _ in eigenvects for _ in range(mult)]
     print(f"\n   Eigenvalues: {eigenvals}")
 
-    # Compute eigenvectors
-    eigenvects = MatrixOperations.eigenvectors(matrix)
     print("\n   Eigenvectors (eigenvalue, multiplicity, vectors):")
     for eigenval, mult, vects in eigenvects:
         print(f"   λ = {eigenval}, multiplicity = {mult}")
@@ -138,10 +158,16 @@ def linear_system_demo() -> None:
     print(solution)
 
     # Verify the solution
-    verification = coefficient_matrix * solution
+    verification = MatrixOperations.multiply(coefficient_matrix, solution)
     print("\n   Verification (Ax):")
     print(verification)
-    print(f"   Should equal b: {verification == constants}")
+    # One vectorized comparison instead of per-entry SymPy equality
+    matches = np.allclose(
+        np.array(verification, dtype=np.float64),
+        np.array(constants, dtype=np.float64),
+        atol=1e-12,
+    )
+    print(f"   Should equal b: {matches}")
 
     print()
 
@@ -166,11 +192,11 @@ def vector_geometry_demo() -> None:
 
     print(
         f"\n   Angle between v1 and v2: {float(angle_v1_v2):.4f} radians"
-        f" ({float(angle_v1_v2) * 180/math.pi:.1f}°)"
+        f" ({float(angle_v1_v2) * RAD2DEG:.1f}°)"
     )
     print(
         f"   Angle between v1 and v3: {float(angle_v1_v3):.4f} radians"
-        f" ({float(angle_v1_v3) * 180/math.pi:.1f}°)"
+        f" ({float(angle_v1_v3) * RAD2DEG:.1f}°)"
     )
 
     # Orthogonality and parallelism
@@ -199,20 +225,24 @@ def gram_schmidt_demo() -> None:
     for i, v in enumerate(vectors):
         print(f"   v{i+1} = {v}")
 
-    # Apply Gram-Schmidt
+    # Apply Gram-Schmidt exactly, so the results print as rationals
     orthogonal_vectors = LinearAlgebra.gram_schmidt(vectors)
 
     print("\n   Orthogonalized vectors:")
     for i, v in enumerate(orthogonal_vectors):
         print(f"   u{i+1} = {v}")
-        print(f"       Magnitude: {float(v.magnitude()):.6f}")
+        print(f"       Magnitude: {v.magnitude_f():.6f}")
 
-    # Verify orthogonality
+    # Verify orthogonality: stacked as rows of one float64 array, all
+    # pairwise dot products come from one Gram matrix product instead of
+    # separate dot() calls
+    orthogonal = VectorBatch.from_vectors(orthogonal_vectors)
+    gram = orthogonal.array @ orthogonal.array.T
     print("\n   Verification (dot products should be zero):")
-    for i in range(len(orthogonal_vectors)):
-        for j in range(i + 1, len(orthogonal_vectors)):
-            dot_prod = orthogonal_vectors[i].dot(orthogonal_vectors[j])
-            print(f"   u{i+1} · u{j+1} = {float(dot_prod):.10f}")
+    for row, col in zip(*np.triu_indices(len(orthogonal), k=1)):
+        print(f"   u{row+1} · u{col+1} = {gram[row, col]:.10f}")
+    off_diagonal = gram - np.diag(np.diag(gram))
+    print(f"   All orthogonal: {np.allclose(off_diagonal, 0.0, atol=1e-12)}")
 
     print()
 
@@ -281,14 +311,19 @@ def main() -> None:
     print("including vectors, matrices, eigenvalues, and geometric operations.")
     print("=" * 50)
 
-    vector_operations_demo()
-    matrix_operations_demo()
-    eigenvalue_demo()
-    linear_system_demo()
-    vector_geometry_demo()
-    gram_schmidt_demo()
-    advanced_matrix_demo()
-    integration_demo()
+    sections = [
+        vector_operations_demo,
+        matrix_operations_demo,
+        eigenvalue_demo,
+        linear_system_demo,
+        vector_geometry_demo,
+        gram_schmidt_demo,
+        advanced_matrix_demo,
+        integration_demo,
+    ]
+    for section in sections:
+        with buffered_section():
+            section()
 
     print("🎯 Demo completed! The linear algebra module provides:")
     print("• Vector operations (dot product, cross product, normalization)")
@@ -37,14 +37,16 @@ def main() -> None:
             perfect_nums.append(n)
     print(f"   {perfect_nums}\n")
 
-    # Twin primes
+    # Twin primes and Goldbach share one sieve up to the larger limit
+    primes_to_100 = sieve_of_eratosthenes(100)
+
     print("4. Twin Prime Pairs (up to 50):")
-    twins = twin_primes(50)
+    twins = twin_primes(50, primes=primes_to_100)
     print(f"   {twins}\n")
 
     # Goldbach conjecture verification
     print("5. Goldbach Conjecture Verification (up to 100):")
-    goldbach_holds = verify_goldbach_conjecture(100)
+    goldbach_holds = verify_goldbach_conjecture(100, primes=primes_to_100)
     print(
         "   Goldbach conjecture holds for all even numbers up to 100: "
         f"{goldbach_holds}\n"
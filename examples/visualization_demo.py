@@ -8,25 +8,38 @@ illustrations.
 """
 
 import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Tuple
+
+import numpy as np
 
 from eternal_math import (
     MathVisualizer,
     collatz_sequence,
     create_output_directory,
-    euler_totient,
     fibonacci_sequence,
     sieve_of_eratosthenes,
+    totient_sieve,
 )
 
+# Characters in expressions that are replaced when building plot filenames
+_FILENAME_SAFE = str.maketrans({"*": "x", "/": "div"})
+
+
+def _plot_function_job(job: Tuple[str, str, Tuple[float, float], str]) -> bool:
+    """Plot one function in a worker process with its own visualizer."""
+    expr, title, x_range, save_path = job
+    return MathVisualizer().plot_function(
+        expr, x_range=x_range, title=title, save_path=save_path
+    )
+
 
-def demo_function_plotting() -> None:
+def demo_function_plotting(visualizer: MathVisualizer, output_dir: Path) -> None:
     """Demonstrate function plotting capabilities."""
     print("🎨 Function Plotting Demo")
     print("=" * 40)
 
-    visualizer = MathVisualizer()
-    output_dir = create_output_directory()
-
     # Plot various mathematical functions
     functions = [
         ("x**2", "Quadratic Function"),
@@ -36,9 +49,8 @@ def demo_function_plotting() -> None:
         ("x**3 - 3*x + 1", "Cubic Polynomial"),
     ]
 
+    jobs = []
     for i, (expr, title) in enumerate(functions, 1):
-        print(f"\n{i}. Plotting {title}: f(x) = {expr}")
-
         # Determine appropriate range for each function
         if "exp" in expr:
             x_range = (-2.0, 3.0)
@@ -47,13 +59,27 @@ def demo_function_plotting() -> None:
         else:
             x_range = (-10.0, 10.0)
 
-        save_path = os.path.join(
-            output_dir, f"function_{i}_{expr.replace('*', 'x').replace('/', 'div')}.png"
-        )
-
-        success = visualizer.plot_function(
-            expr, x_range=x_range, title=title, save_path=save_path
+        save_path = str(
+            output_dir / f"function_{i}_{expr.translate(_FILENAME_SAFE)}.png"
         )
+        jobs.append((expr, title, x_range, save_path))
+
+    # Rendering and PNG encoding are CPU-bound, so independent plots are
+    # spread over processes; results are collected in submission order
+    workers = min(len(jobs), os.cpu_count() or 1)
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_plot_function_job, jobs))
+    else:
+        results = [
+            visualizer.plot_function(
+                expr, x_range=x_range, title=title, save_path=save_path
+            )
+            for expr, title, x_range, save_path in jobs
+        ]
+
+    for i, ((expr, title, _, _), success) in enumerate(zip(jobs, results), 1):
+        print(f"\n{i}. Plotting {title}: f(x) = {expr}")
 
         if success:
             print("   ✅ Successfully plotted and saved!")
@@ -61,23 +87,20 @@ def demo_function_plotting() -> None:
             print("   ❌ Failed to plot function")
 
 
-def demo_sequence_visualization() -> None:
+def demo_sequence_visualization(visualizer: MathVisualizer, output_dir: Path) -> None:
     """Demonstrate sequence visualization."""
     print("\n\n🔢 Sequence Visualization Demo")
     print("=" * 40)
 
-    visualizer = MathVisualizer()
-    output_dir = create_output_directory()
-
     # 1. Fibonacci sequence
     print("\n1. Fibonacci Sequence")
     fib_seq = fibonacci_sequence(15)
-    fib_floats = [float(x) for x in fib_seq]
+    fib_floats = np.fromiter(fib_seq, dtype=np.float64, count=len(fib_seq))
 
     success = visualizer.plot_sequence(
         fib_floats,
         title="First 15 Fibonacci Numbers",
-        save_path=os.path.join(output_dir, "fibonacci_sequence.png"),
+        save_path=str(output_dir / "fibonacci_sequence.png"),
     )
     print(f"   Fibonacci sequence: {fib_seq[:10]}...")
     print("   ✅ Plot saved!" if success else "   ❌ Plot failed!")
@@ -87,7 +110,7 @@ def demo_sequence_visualization() -> None:
     primes = sieve_of_eratosthenes(100)
 
     success = visualizer.plot_prime_distribution(
-        primes, 100, save_path=os.path.join(output_dir, "prime_distribution.png")
+        primes, 100, save_path=str(output_dir / "prime_distribution.png")
     )
     print(f"   Found {len(primes)} primes up to 100")
     print(f"   First 10 primes: {primes[:10]}")
@@ -95,25 +118,22 @@ def demo_sequence_visualization() -> None:
 
     # 3. Euler's totient function
     print("\n3. Euler's Totient Function φ(n)")
-    totients = [euler_totient(n) for n in range(1, 21)]
+    totients = totient_sieve(20)[1:]
 
     success = visualizer.plot_sequence(
-        [float(x) for x in totients],
+        totients.astype(np.float64),
         title="Euler's Totient Function φ(n) for n = 1 to 20",
-        save_path=os.path.join(output_dir, "euler_totient.png"),
+        save_path=str(output_dir / "euler_totient.png"),
     )
-    print(f"   φ(n) values: {totients}")
+    print(f"   φ(n) values: {totients.tolist()}")
     print("   ✅ Plot saved!" if success else "   ❌ Plot failed!")
 
 
-def demo_collatz_trajectories() -> None:
+def demo_collatz_trajectories(visualizer: MathVisualizer, output_dir: Path) -> None:
     """Demonstrate Collatz sequence visualization."""
     print("\n\n🌀 Collatz Conjecture Visualization")
     print("=" * 40)
 
-    visualizer = MathVisualizer()
-    output_dir = create_output_directory()
-
     # Generate Collatz sequences for different starting values
     starting_values = [3, 7, 15, 27, 31]
     sequences = []
@@ -127,40 +147,39 @@ def demo_collatz_trajectories() -> None:
     success = visualizer.plot_collatz_trajectory(
         sequences,
         starting_values,
-        save_path=os.path.join(output_dir, "collatz_trajectories.png"),
+        save_path=str(output_dir / "collatz_trajectories.png"),
     )
 
     print("\n   ✅ Collatz plot saved!" if success else "   ❌ Plot failed!")
     print("   Note: All sequences eventually reach 1 (conjecture holds)")
 
 
-def demo_comparative_analysis() -> None:
+def demo_comparative_analysis(visualizer: MathVisualizer, output_dir: Path) -> None:
     """Demonstrate comparative sequence analysis."""
     print("\n\n📊 Comparative Sequence Analysis")
     print("=" * 40)
 
-    visualizer = MathVisualizer()
-    output_dir = create_output_directory()
-
     # Compare different mathematical sequences
     n = 15
+    k = np.arange(1, n + 1)
+    primes = sieve_of_eratosthenes(n * 10, as_array=True)
 
     sequences = {
-        "Fibonacci": [float(x) for x in fibonacci_sequence(n)],
-        "Primes": [float(x) for x in sieve_of_eratosthenes(n * 10)[:n]],
-        "Euler φ(n)": [float(euler_totient(i)) for i in range(1, n + 1)],
-        "Powers of 2": [float(2**i) for i in range(n)],
-        "Triangular": [float(i * (i + 1) // 2) for i in range(1, n + 1)],
+        "Fibonacci": np.fromiter(fibonacci_sequence(n), dtype=np.float64, count=n),
+        "Primes": primes[:n].astype(np.float64),
+        "Euler φ(n)": totient_sieve(n)[1:].astype(np.float64),
+        "Powers of 2": np.ldexp(1.0, k - 1),
+        "Triangular": (k * (k + 1) // 2).astype(np.float64),
     }
 
     print(f"\nComparing sequences (first {n} terms):")
     for name, seq in sequences.items():
-        print(f"   {name}: {seq[:5]}...")
+        print(f"   {name}: {seq[:5].tolist()}...")
 
     success = visualizer.plot_comparative_sequences(
         sequences,
         title="Comparative Analysis of Mathematical Sequences",
-        save_path=os.path.join(output_dir, "sequence_comparison.png"),
+        save_path=str(output_dir / "sequence_comparison.png"),
     )
 
     print("\n   ✅ Comparative plot saved!" if success else "   ❌ Plot failed!")
@@ -173,11 +192,14 @@ def main() -> None:
     print("Demonstrating the new visualization capabilities!")
     print("All plots will be saved to the 'math_plots' directory.")
 
-    # Run all demonstrations
-    demo_function_plotting()
-    demo_sequence_visualization()
-    demo_collatz_trajectories()
-    demo_comparative_analysis()
+    # Share one visualizer and output directory across all demonstrations
+    visualizer = MathVisualizer()
+    output_dir = Path(create_output_directory())
+
+    demo_function_plotting(visualizer, output_dir)
+    demo_sequence_visualization(visualizer, output_dir)
+    demo_collatz_trajectories(visualizer, output_dir)
+    demo_comparative_analysis(visualizer, output_dir)
 
     print("\n\n🎉 Visualization Demo Complete!")
     print("=" * 50)
@@ -2,23 +2,35 @@
 Tests for the benchmarks module.
 """
 
+import json
+import math
 import os
 import tempfile
+import time
 import unittest
-from typing import Any
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, List
 from unittest.mock import patch
 
+import matplotlib.pyplot as plt
+
 from eternal_math.benchmarks import (
     BenchmarkResult,
     PerformanceBenchmark,
+    _euclid_gcd,
     run_performance_analysis,
 )
 from eternal_math.core import gcd
-from eternal_math.number_theory import fibonacci_sequence, sieve_of_eratosthenes
+from eternal_math.number_theory import (
+    fibonacci_sequence,
+    is_perfect_number,
+    sieve_of_eratosthenes,
+)
 
 
 class TestBenchmarkResult(unittest.TestCase):
-    """Test the BenchmarkResult dataclass."""
+    """Test the BenchmarkResult record."""
 
     def test_benchmark_result_creation(self) -> None:
         """Test BenchmarkResult initialization."""
@@ -33,14 +45,28 @@ class TestBenchmarkResult(unittest.TestCase):
             max_time=0.06,
         )
 
-        self.assertEqual(result.function_name, "test_func")
-        self.assertEqual(result.input_size, 100)
-        self.assertEqual(result.execution_time, 0.5)
-        self.assertEqual(result.iterations, 10)
-        self.assertEqual(result.mean_time, 0.05)
-        self.assertEqual(result.std_dev, 0.01)
-        self.assertEqual(result.min_time, 0.04)
-        self.assertEqual(result.max_time, 0.06)
+        self.assertEqual(
+            result._asdict(),
+            {
+                "function_name": "test_func",
+                "input_size": 100,
+                "execution_time": 0.5,
+                "iterations": 10,
+                "mean_time": 0.05,
+                "std_dev": 0.01,
+                "min_time": 0.04,
+                "max_time": 0.06,
+            },
+        )
+
+    def test_benchmark_result_is_immutable(self) -> None:
+        """Test BenchmarkResult is an immutable record."""
+        result = BenchmarkResult("test_func", 100, 0.5, 10, 0.05, 0.01, 0.04, 0.06)
+
+        self.assertFalse(hasattr(result, "__dict__"))
+        with self.assertRaises(AttributeError):
+            result.mean_time = 0.0  # type: ignore[misc]
+        self.assertEqual(result, BenchmarkResult._make(tuple(result)))
 
 
 class TestPerformanceBenchmark(unittest.TestCase):
@@ -63,20 +89,65 @@ class TestPerformanceBenchmark(unittest.TestCase):
 
         result = self.benchmark.time_function(simple_add, 5, 10, iterations=5)
 
-        self.assertEqual(result.function_name, "simple_add")
-        self.assertEqual(result.iterations, 5)
+        self.assertEqual((result.function_name, result.iterations), ("simple_add", 5))
         self.assertGreater(result.mean_time, 0)
         self.assertGreaterEqual(result.std_dev, 0)
         self.assertGreater(result.max_time, 0)
         self.assertGreater(result.min_time, 0)
         self.assertEqual(len(self.benchmark.results), 1)
 
+    def test_time_function_batches_fast_calls(self) -> None:
+        """Test that sub-microsecond calls are batched into each sample."""
+        calls: List[None] = []
+
+        def record() -> None:
+            calls.append(None)
+
+        result = self.benchmark.time_function(record, iterations=3)
+
+        self.assertEqual(result.iterations, 3)
+        # One calibration call plus more than one call per sample
+        self.assertGreater(len(calls), 1 + 3)
+        self.assertLess(result.mean_time, 1e-3)
+        self.assertAlmostEqual(result.execution_time, result.mean_time * 3)
+
+    def test_time_function_slow_calls_not_repeated(self) -> None:
+        """Test that a slow callee runs exactly `iterations` times."""
+        calls: List[None] = []
+
+        def slow() -> None:
+            calls.append(None)
+            time.sleep(0.001)
+
+        result = self.benchmark.time_function(slow, iterations=3)
+
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(result.iterations, 3)
+        self.assertGreaterEqual(result.min_time, 0.001)
+
+    def test_time_function_clears_cached_callee(self) -> None:
+        """Test that every sample of an lru_cache'd function starts cold."""
+
+        # cache_clear() also resets cache_info(), so count the real calls
+        computed: List[int] = []
+
+        @lru_cache(maxsize=None)
+        def cached_square(n: int) -> int:
+            computed.append(n)
+            return n * n
+
+        cached_square(7)
+        computed.clear()
+        self.benchmark.time_function(cached_square, 7, iterations=5)
+
+        self.assertEqual(len(computed), 5)
+        self.assertEqual(cached_square.cache_info().hits, 0)
+
     def test_time_gcd_function(self) -> None:
         """Test timing GCD function."""
         result = self.benchmark.time_function(gcd, 48, 18, iterations=10)
 
-        self.assertEqual(result.function_name, "gcd")
-        self.assertEqual(result.iterations, 10)
+        self.assertEqual((result.function_name, result.iterations), ("gcd", 10))
         self.assertGreater(result.mean_time, 0)
         # GCD should be very fast, so mean time should be small
         self.assertLess(result.mean_time, 0.001)  # Less than 1ms
@@ -99,6 +170,14 @@ class TestPerformanceBenchmark(unittest.TestCase):
         size = self.benchmark._extract_input_size((42.5,), {})
         self.assertEqual(size, 0)
 
+        # Unrecognized first argument falls back to size keywords
+        size = self.benchmark._extract_input_size((42.5,), {"limit": 7})
+        self.assertEqual(size, 7)
+
+        # Test with tuple argument
+        size = self.benchmark._extract_input_size(((1, 2),), {})
+        self.assertEqual(size, 2)
+
     def test_find_perfect_numbers(self) -> None:
         """Test the helper function for finding perfect numbers."""
         perfect_nums = self.benchmark.find_perfect_numbers(30)
@@ -109,22 +188,31 @@ class TestPerformanceBenchmark(unittest.TestCase):
         perfect_nums = self.benchmark.find_perfect_numbers(5)
         self.assertEqual(perfect_nums, [])
 
+    def test_find_perfect_numbers_matches_predicate(self) -> None:
+        """Test the divisor-sum sieve against is_perfect_number."""
+        limit = 10_000
+        expected = [n for n in range(1, limit + 1) if is_perfect_number(n)]
+        self.assertEqual(self.benchmark.find_perfect_numbers(limit), expected)
+        self.assertEqual(self.benchmark.find_perfect_numbers(496), [6, 28, 496])
+
     def test_benchmark_sieve_of_eratosthenes(self) -> None:
         """Test benchmarking the sieve algorithm."""
         result = self.benchmark.time_function(sieve_of_eratosthenes, 100, iterations=3)
 
-        self.assertEqual(result.function_name, "sieve_of_eratosthenes")
-        self.assertEqual(result.input_size, 100)
-        self.assertEqual(result.iterations, 3)
+        self.assertEqual(
+            (result.function_name, result.input_size, result.iterations),
+            ("sieve_of_eratosthenes", 100, 3),
+        )
         self.assertGreater(result.mean_time, 0)
 
     def test_benchmark_fibonacci_sequence(self) -> None:
         """Test benchmarking fibonacci sequence generation."""
         result = self.benchmark.time_function(fibonacci_sequence, 20, iterations=5)
 
-        self.assertEqual(result.function_name, "fibonacci_sequence")
-        self.assertEqual(result.input_size, 20)
-        self.assertEqual(result.iterations, 5)
+        self.assertEqual(
+            (result.function_name, result.input_size, result.iterations),
+            ("fibonacci_sequence", 20, 5),
+        )
         self.assertGreater(result.mean_time, 0)
 
     def test_benchmark_prime_algorithms_small(self) -> None:
@@ -152,6 +240,30 @@ class TestPerformanceBenchmark(unittest.TestCase):
             self.assertEqual(result.function_name, "fibonacci_sequence")
             self.assertGreater(result.mean_time, 0)
 
+    @patch("eternal_math.benchmarks.os.cpu_count", return_value=2)
+    def test_benchmark_fibonacci_algorithms_process_pool(
+        self, mock_cpu_count: Any
+    ) -> None:
+        """Test that sizes timed in worker processes keep their order."""
+        results = self.benchmark.benchmark_fibonacci_algorithms([5, 10, 15])
+
+        self.assertEqual([r.input_size for r in results], [5, 10, 15])
+        self.assertEqual(self.benchmark.results, results)
+        for result in results:
+            self.assertEqual(result.function_name, "fibonacci_sequence")
+            self.assertGreater(result.mean_time, 0)
+
+    @patch("eternal_math.benchmarks.os.cpu_count", return_value=2)
+    def test_time_sizes_perfect_numbers_process_pool(self, mock_cpu_count: Any) -> None:
+        """Test that the perfect-number helper can be timed in worker processes."""
+        results = self.benchmark._time_sizes(
+            self.benchmark.find_perfect_numbers, [100, 500], iterations=2
+        )
+
+        self.assertEqual([r.input_size for r in results], [100, 500])
+        for result in results:
+            self.assertEqual(result.function_name, "find_perfect_numbers")
+
     def test_generate_performance_report_empty(self) -> None:
         """Test generating report with no results."""
         report = self.benchmark.generate_performance_report()
@@ -214,6 +326,20 @@ class TestBenchmarkIntegration(unittest.TestCase):
         self.assertIn("Function: gcd", report)
 
 
+# Canned results standing in for the slow suite categories
+_PRIME_RESULTS = {
+    "sieve_of_eratosthenes": [
+        BenchmarkResult("sieve_of_eratosthenes", 100, 0.1, 5, 0.02, 0.001, 0.019, 0.021)
+    ],
+    "is_prime_checks": [
+        BenchmarkResult("is_prime", 97, 0.05, 100, 0.0005, 0.0001, 0.0004, 0.0006)
+    ],
+}
+_FIBONACCI_RESULTS = [
+    BenchmarkResult("fibonacci_sequence", 10, 0.01, 10, 0.001, 0.0001, 0.0009, 0.0011)
+]
+
+
 class TestBenchmarkSuite(unittest.TestCase):
     """Test the comprehensive benchmark suite methods."""
 
@@ -224,38 +350,23 @@ class TestBenchmarkSuite(unittest.TestCase):
     @patch("builtins.print")  # Suppress output during tests
     def test_benchmark_number_theory_suite(self, mock_print: Any) -> None:
         """Test the complete number theory benchmark suite."""
-        with (
-            patch.object(self.benchmark, "benchmark_prime_algorithms") as mock_prime,
-            patch.object(self.benchmark, "benchmark_fibonacci_algorithms") as mock_fib,
-        ):
-
-            # Mock return values
-            mock_prime.return_value = {
-                "sieve_of_eratosthenes": [
-                    BenchmarkResult(
-                        "sieve_of_eratosthenes", 100, 0.1, 5, 0.02, 0.001, 0.019, 0.021
-                    )
-                ],
-                "is_prime_checks": [
-                    BenchmarkResult(
-                        "is_prime", 97, 0.05, 100, 0.0005, 0.0001, 0.0004, 0.0006
-                    )
-                ],
-            }
-            mock_fib.return_value = [
-                BenchmarkResult(
-                    "fibonacci_sequence", 10, 0.01, 10, 0.001, 0.0001, 0.0009, 0.0011
-                )
-            ]
+        # Plain stubs shadow the slow prime and Fibonacci benchmarks
+        self.benchmark.benchmark_prime_algorithms = (  # type: ignore[method-assign]
+            lambda sizes=None: _PRIME_RESULTS
+        )
+        self.benchmark.benchmark_fibonacci_algorithms = (  # type: ignore[method-assign]
+            lambda sizes=None: _FIBONACCI_RESULTS
+        )
 
-            results = self.benchmark.benchmark_number_theory_suite()
+        results = self.benchmark.benchmark_number_theory_suite()
 
-            # Check that all expected categories are present
-            self.assertIn("sieve_of_eratosthenes", results)
-            self.assertIn("is_prime_checks", results)
-            self.assertIn("fibonacci", results)
-            self.assertIn("perfect_numbers", results)
-            self.assertIn("gcd", results)
+        # Check that all expected categories are present
+        self.assertIn("sieve_of_eratosthenes", results)
+        self.assertIn("is_prime_checks", results)
+        self.assertIn("fibonacci", results)
+        self.assertIn("perfect_numbers", results)
+        self.assertIn("gcd", results)
+        self.assertEqual(results["fibonacci"], _FIBONACCI_RESULTS)
 
     def test_save_results(self) -> None:
         """Test saving benchmark results to file."""
@@ -264,22 +375,37 @@ class TestBenchmarkSuite(unittest.TestCase):
 
         with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
             temp_filename = f.name
+        self.addCleanup(Path(temp_filename).unlink, missing_ok=True)
 
-        try:
-            # Save results
-            self.benchmark.save_results(temp_filename)
+        # Save results
+        self.benchmark.save_results(temp_filename)
 
-            # Read back and verify
-            with open(temp_filename, "r") as f:
-                content = f.read()
+        # Read back and verify
+        with open(temp_filename, "r") as f:
+            content = f.read()
 
-            self.assertIn("Eternal Math Performance Report", content)
-            self.assertIn("gcd", content)
+        self.assertIn("Eternal Math Performance Report", content)
+        self.assertIn("gcd", content)
 
-        finally:
-            # Clean up
-            if os.path.exists(temp_filename):
-                os.remove(temp_filename)
+    @patch("builtins.print")
+    def test_save_results_json(self, mock_print: Any) -> None:
+        """Test saving benchmark results as newline-delimited JSON."""
+        self.benchmark.time_function(gcd, 48, 18, iterations=3)
+        self.benchmark.time_function(fibonacci_sequence, 10, iterations=2)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filename = os.path.join(temp_dir, "results.ndjson")
+            self.benchmark.save_results_json(filename)
+
+            with open(filename, encoding="utf-8") as f:
+                records = [json.loads(line) for line in f]
+
+        self.assertEqual(
+            [r["function_name"] for r in records], ["gcd", "fibonacci_sequence"]
+        )
+        self.assertEqual(records[0]["iterations"], 3)
+        self.assertEqual(records[1]["input_size"], 10)
+        self.assertEqual(records[0], self.benchmark.results[0]._asdict())
 
     @patch("matplotlib.pyplot.show")
     @patch("matplotlib.pyplot.savefig")
@@ -311,6 +437,9 @@ class TestBenchmarkSuite(unittest.TestCase):
         expected_filename = "math_plots/benchmark_test_performance.png"
         self.assertEqual(args[0], expected_filename)
 
+        # The figure is released once shown
+        self.assertEqual(plt.get_fignums(), [])
+
     @patch("matplotlib.pyplot.legend")
     def test_plot_performance_comparison_empty_results(self, mock_legend: Any) -> None:
         """Test plotting with empty results."""
@@ -356,7 +485,7 @@ class TestBenchmarkSuite(unittest.TestCase):
         self.assertIn("performance_improvement", results)
 
         # Check structure of individual results
-        for key in ["standard_sieve", "optimized_sieve"]:
+        for key in ["standard_sieve", "optimized_sieve", "euclid_gcd", "math_gcd"]:
             self.assertIn("mean_time", results[key])
             self.assertIn("std_dev", results[key])
             self.assertIn("min_time", results[key])
@@ -370,6 +499,11 @@ class TestBenchmarkSuite(unittest.TestCase):
         self.assertIsInstance(improvement["percentage"], (int, float))
         self.assertIsInstance(improvement["speedup_factor"], (int, float))
 
+    def test_euclid_gcd_matches_math_gcd(self) -> None:
+        """Test the interpreted GCD baseline agrees with math.gcd."""
+        for a, b in [(48, 18), (0, 5), (7, 0), (-12, 18), (17, 13), (0, 0)]:
+            self.assertEqual(_euclid_gcd(a, b), math.gcd(a, b))
+
     @patch("builtins.print")
     def test_benchmark_algorithm_comparison_large_limit(self, mock_print: Any) -> None:
         """Test algorithm comparison with large limit to trigger segmented sieve."""
@@ -425,7 +559,10 @@ class TestRunPerformanceAnalysis(unittest.TestCase):
                 ],
             }
 
-            with patch.object(PerformanceBenchmark, "save_results") as mock_save:
+            with (
+                patch.object(PerformanceBenchmark, "save_results") as mock_save,
+                patch.object(PerformanceBenchmark, "save_results_json") as mock_json,
+            ):
                 benchmark = run_performance_analysis()
 
                 # Check that benchmark object is returned
@@ -437,6 +574,7 @@ class TestRunPerformanceAnalysis(unittest.TestCase):
                 # Verify plotting and saving were called
                 mock_savefig.assert_called()
                 mock_save.assert_called_with("performance_report.txt")
+                mock_json.assert_called_with("performance_report.ndjson")
 
 
 if __name__ == "__main__":
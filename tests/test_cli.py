@@ -2,19 +2,42 @@
 Tests for the CLI functionality.
 """
 
+import io
 import unittest
-from typing import Any
+from contextlib import redirect_stdout
+from typing import Any, Callable
 from unittest.mock import MagicMock, patch
 
+import pytest
+
+from eternal_math import CalculusUtils, SymbolicMath
 from eternal_math.cli import EternalMathCLI
 
 
-class TestEternalMathCLI(unittest.TestCase):
-    """Test cases for the CLI interface."""
+class _CLITestCase(unittest.TestCase):
+    """Shared CLI fixture and output capture for the CLI test cases."""
+
+    cli: EternalMathCLI
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Build one CLI instance shared by every test in the class."""
+        cls.cli = EternalMathCLI()
 
     def setUp(self) -> None:
-        """Set up test fixtures."""
-        self.cli = EternalMathCLI()
+        """Reset the shared CLI's mutable state."""
+        self.cli.running = True
+
+    def _capture(self, fn: Callable[..., Any], *args: Any) -> str:
+        """Call fn with args and return everything it printed."""
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            fn(*args)
+        return buf.getvalue()
+
+
+class TestEternalMathCLI(_CLITestCase):
+    """Test cases for the CLI interface."""
 
     def test_cli_initialization(self) -> None:
         """Test CLI initializes correctly."""
@@ -23,85 +46,71 @@ class TestEternalMathCLI(unittest.TestCase):
         self.assertIn("primes", self.cli.commands)
         self.assertIn("quit", self.cli.commands)
 
-    @patch("builtins.print")
-    def test_help_command(self, mock_print: Any) -> None:
+    def test_help_command(self) -> None:
         """Test help command displays correctly."""
-        self.cli._help([])
-        mock_print.assert_called()
-        # Check that help was called multiple times (for different sections)
-        self.assertGreater(mock_print.call_count, 5)
-
-    @patch("builtins.print")
-    def test_primes_command(self, mock_print: Any) -> None:
-        """Test primes command works correctly."""
-        self.cli._primes(["10"])
-        mock_print.assert_called()
-        # Check that output contains prime numbers
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
-        self.assertIn("[2, 3, 5, 7]", output)
-
-    @patch("builtins.print")
-    def test_primes_command_no_args(self, mock_print: Any) -> None:
-        """Test primes command with no arguments."""
-        self.cli._primes([])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
-        self.assertIn("Usage:", output)
-
-    @patch("builtins.print")
-    def test_fibonacci_command(self, mock_print: Any) -> None:
-        """Test fibonacci command works correctly."""
-        self.cli._fibonacci(["5"])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
-        self.assertIn("[0, 1, 1, 2, 3]", output)
-
-    @patch("builtins.print")
-    def test_perfect_numbers_command(self, mock_print: Any) -> None:
-        """Test perfect numbers command."""
-        self.cli._perfect_numbers(["10"])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
-        self.assertIn("[6]", output)
-
-    @patch("builtins.print")
-    def test_euler_totient_command(self, mock_print: Any) -> None:
-        """Test Euler's totient function command."""
-        self.cli._euler_totient(["12"])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
-        self.assertIn("φ(12)", output)
-
-    @patch("builtins.print")
-    def test_collatz_command(self, mock_print: Any) -> None:
-        """Test Collatz sequence command."""
-        self.cli._collatz(["7"])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
-        self.assertIn("Collatz sequence for 7", output)
-
-    @patch("builtins.print")
-    def test_theorem_command(self, mock_print: Any) -> None:
+        output = self._capture(self.cli._help, [])
+        # Check that help printed multiple lines (for different sections)
+        self.assertGreater(output.count("\n"), 5)
+
+    def test_number_theory_commands(self) -> None:
+        """Test number theory commands print their results."""
+        # Each command prints a blank line, a header, then its result line
+        cases = [
+            ("_primes", ["10"], "[2, 3, 5, 7]"),
+            ("_fibonacci", ["5"], "[0, 1, 1, 2, 3]"),
+            ("_perfect_numbers", ["10"], "[6]"),
+            ("_euler_totient", ["12"], "φ(12) = 4"),
+            (
+                "_collatz",
+                ["7"],
+                "[7, 22, 11, 34, 17, 52, 26, 13, 40, 20, 10, 5, 16, 8, 4, 2, 1]",
+            ),
+            ("_twin_primes", ["10"], "[(3, 5), (5, 7)]"),
+            ("_goldbach", ["10"], "Result: ✅ Holds"),
+        ]
+        for name, args, expected in cases:
+            with self.subTest(cmd=name, args=args):
+                output = self._capture(getattr(self.cli, name), args)
+                self.assertEqual(output.splitlines()[2].strip(), expected)
+
+    def test_commands_without_args_print_usage(self) -> None:
+        """Test commands that need arguments print usage when given none."""
+        names = [
+            "_primes",
+            "_fibonacci",
+            "_perfect_numbers",
+            "_euler_totient",
+            "_collatz",
+            "_twin_primes",
+            "_goldbach",
+            "_simplify",
+            "_expand",
+            "_factor",
+            "_solve",
+            "_differentiate",
+            "_integrate",
+            "_limit",
+            "_taylor_series",
+            "_substitute",
+            "_plot_function",
+            "_plot_sequence",
+            "_plot_primes",
+            "_plot_collatz",
+            "_plot_comparative",
+        ]
+        for name in names:
+            with self.subTest(cmd=name):
+                output = self._capture(getattr(self.cli, name), [])
+                self.assertIn("Usage:", output)
+
+    def test_theorem_command(self) -> None:
         """Test theorem display command."""
-        self.cli._show_theorem([])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
+        output = self._capture(self.cli._show_theorem, [])
         self.assertIn("integer greater than 1", output)
 
-    @patch("builtins.print")
-    def test_examples_command(self, mock_print: Any) -> None:
+    def test_examples_command(self) -> None:
         """Test examples display command."""
-        self.cli._show_examples([])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
+        output = self._capture(self.cli._show_examples, [])
         self.assertIn("Usage Examples", output)
 
     def test_quit_command(self) -> None:
@@ -110,11 +119,14 @@ class TestEternalMathCLI(unittest.TestCase):
         self.cli._quit([])
         self.assertFalse(self.cli.running)
 
-    @patch("builtins.print")
-    def test_invalid_command(self, mock_print: Any) -> None:
+    def test_invalid_command(self) -> None:
         """Test invalid command handling."""
         # Mock the input and running state
-        with patch("builtins.input", return_value="invalid_command"):
+        buf = io.StringIO()
+        with (
+            patch("builtins.input", return_value="invalid_command"),
+            redirect_stdout(buf),
+        ):
             self.cli.running = True
             # Simulate one iteration of the main loop
             user_input = "invalid_command"
@@ -127,473 +139,110 @@ class TestEternalMathCLI(unittest.TestCase):
                 print(f"Unknown command: {command}")
                 print("Type 'help' for available commands.\n")
 
-            mock_print.assert_called()
-            calls = [str(call) for call in mock_print.call_args_list]
-            output = " ".join(calls)
-            self.assertIn("Unknown command", output)
-
-    # Number Theory Commands Tests
-    @patch("builtins.print")
-    def test_twin_primes_command(self, mock_print: Any) -> None:
-        """Test twin primes command."""
-        self.cli._twin_primes(["10"])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
-        self.assertIn("(3, 5)", output)
-
-    @patch("builtins.print")
-    def test_twin_primes_command_no_args(self, mock_print: Any) -> None:
-        """Test twin primes command with no arguments."""
-        self.cli._twin_primes([])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
-        self.assertIn("Usage:", output)
-
-    @patch("builtins.print")
-    def test_goldbach_command(self, mock_print: Any) -> None:
-        """Test Goldbach conjecture command."""
-        self.cli._goldbach(["10"])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
-        self.assertIn("Goldbach conjecture", output)
-
-    @patch("builtins.print")
-    def test_goldbach_command_no_args(self, mock_print: Any) -> None:
-        """Test Goldbach conjecture command with no arguments."""
-        self.cli._goldbach([])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
-        self.assertIn("Usage:", output)
-
-    @patch("builtins.print")
-    def test_chinese_remainder_command(self, mock_print: Any) -> None:
+        self.assertIn("Unknown command", buf.getvalue())
+
+    def test_chinese_remainder_command(self) -> None:
         """Test Chinese Remainder Theorem command."""
-        self.cli._chinese_remainder(["2,3,2,3"])
-        self.assertTrue(mock_print.called)
+        self.assertNotEqual(self._capture(self.cli._chinese_remainder, ["2,3,2,3"]), "")
 
-    @patch("builtins.print")
-    def test_chinese_remainder_command_invalid_args(self, mock_print: Any) -> None:
+    def test_chinese_remainder_command_invalid_args(self) -> None:
         """Test Chinese Remainder Theorem command with invalid arguments."""
-        self.cli._chinese_remainder(["1,2,3"])  # Odd number of arguments
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
+        output = self._capture(
+            self.cli._chinese_remainder, ["1,2,3"]
+        )  # Odd number of arguments
         self.assertIn("exactly 4 comma-separated", output)
 
-    # Symbolic Math Commands Tests
-    @patch("builtins.print")
-    def test_simplify_command(self, mock_print: Any) -> None:
-        """Test simplify command."""
-        self.cli._simplify(["(x + 1)**2"])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
-        self.assertIn("Simplifying", output)
-
-    @patch("builtins.print")
-    def test_simplify_command_no_args(self, mock_print: Any) -> None:
-        """Test simplify command with no arguments."""
-        self.cli._simplify([])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
-        self.assertIn("Usage:", output)
-
-    @patch("builtins.print")
-    def test_expand_command(self, mock_print: Any) -> None:
-        """Test expand command."""
-        self.cli._expand(["(x + 1)**2"])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
-        self.assertIn("x**2 + 2*x + 1", output)
-
-    @patch("builtins.print")
-    def test_expand_command_no_args(self, mock_print: Any) -> None:
-        """Test expand command with no arguments."""
-        self.cli._expand([])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
-        self.assertIn("Usage:", output)
-
-    @patch("builtins.print")
-    def test_factor_command(self, mock_print: Any) -> None:
-        """Test factor command."""
-        self.cli._factor(["x**2 - 1"])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
-        self.assertIn("(x - 1)*(x + 1)", output)
-
-    @patch("builtins.print")
-    def test_factor_command_no_args(self, mock_print: Any) -> None:
-        """Test factor command with no arguments."""
-        self.cli._factor([])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
-        self.assertIn("Usage:", output)
-
-    @patch("builtins.print")
-    def test_solve_command(self, mock_print: Any) -> None:
-        """Test solve command."""
-        self.cli._solve(["x**2 - 4", "x"])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
-        self.assertIn("[-2, 2]", output)
-
-    @patch("builtins.print")
-    def test_solve_command_no_args(self, mock_print: Any) -> None:
-        """Test solve command with no arguments."""
-        self.cli._solve([])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
-        self.assertIn("Usage:", output)
-
-    @patch("builtins.print")
-    def test_differentiate_command(self, mock_print: Any) -> None:
-        """Test differentiate command."""
-        self.cli._differentiate(["x**2", "x"])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
-        self.assertIn("2*x", output)
-
-    @patch("builtins.print")
-    def test_differentiate_command_no_args(self, mock_print: Any) -> None:
-        """Test differentiate command with no arguments."""
-        self.cli._differentiate([])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
-        self.assertIn("Usage:", output)
-
-    @patch("builtins.print")
-    def test_integrate_command(self, mock_print: Any) -> None:
-        """Test integrate command."""
-        self.cli._integrate(["2*x", "x"])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
-        self.assertIn("x**2", output)
-
-    @patch("builtins.print")
-    def test_integrate_command_no_args(self, mock_print: Any) -> None:
-        """Test integrate command with no arguments."""
-        self.cli._integrate([])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
-        self.assertIn("Usage:", output)
-
-    @patch("builtins.print")
-    def test_limit_command(self, mock_print: Any) -> None:
-        """Test limit command."""
-        self.cli._limit(["sin(x)/x", "x", "0"])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
-        self.assertIn("1", output)
-
-    @patch("builtins.print")
-    def test_limit_command_no_args(self, mock_print: Any) -> None:
-        """Test limit command with no arguments."""
-        self.cli._limit([])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
-        self.assertIn("Usage:", output)
-
-    @patch("builtins.print")
-    def test_taylor_series_command(self, mock_print: Any) -> None:
-        """Test Taylor series command."""
-        self.cli._taylor_series(["exp(x)", "x", "0", "3"])
-        self.assertTrue(mock_print.called)
-
-    @patch("builtins.print")
-    def test_taylor_series_command_no_args(self, mock_print: Any) -> None:
-        """Test Taylor series command with no arguments."""
-        self.cli._taylor_series([])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
-        self.assertIn("Usage:", output)
-
-    @patch("builtins.print")
-    def test_substitute_command(self, mock_print: Any) -> None:
-        """Test substitute command."""
-        self.cli._substitute(["x**2 + y", "x=2", "y=3"])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
-        self.assertIn("7", output)
-
-    @patch("builtins.print")
-    def test_substitute_command_no_args(self, mock_print: Any) -> None:
-        """Test substitute command with no arguments."""
-        self.cli._substitute([])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
-        self.assertIn("Usage:", output)
-
-    # Visualization Commands Tests
-    @patch("matplotlib.pyplot.show")
-    @patch("builtins.print")
-    @patch("eternal_math.cli.MathVisualizer")
-    def test_plot_function_command(
-        self, mock_visualizer: Any, mock_print: Any, mock_show: Any
-    ) -> None:
-        """Test plot function command."""
-        mock_viz_instance = MagicMock()
-        mock_visualizer.return_value = mock_viz_instance
-
-        self.cli._plot_function(["sin(x)"])
-        self.assertTrue(mock_print.called)
-        self.assertTrue(mock_show.called)
-
-    @patch("builtins.print")
-    def test_plot_function_command_no_args(self, mock_print: Any) -> None:
-        """Test plot function command with no arguments."""
-        self.cli._plot_function([])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
-        self.assertIn("Usage:", output)
-
-    @patch("matplotlib.pyplot.show")
-    @patch("builtins.print")
-    def test_plot_sequence_command(self, mock_print: Any, mock_show: Any) -> None:
-        """Test plot sequence command."""
-        self.cli._plot_sequence(["fibonacci", "10"])
-        self.assertTrue(mock_print.called)
-        self.assertTrue(mock_show.called)
-
-    @patch("builtins.print")
-    def test_plot_sequence_command_no_args(self, mock_print: Any) -> None:
-        """Test plot sequence command with no arguments."""
-        self.cli._plot_sequence([])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
-        self.assertIn("Usage:", output)
-
-    @patch("matplotlib.pyplot.show")
-    @patch("builtins.print")
-    def test_plot_primes_command(self, mock_print: Any, mock_show: Any) -> None:
-        """Test plot primes command."""
-        self.cli._plot_primes(["50"])
-        self.assertTrue(mock_print.called)
-        self.assertTrue(mock_show.called)
-
-    @patch("builtins.print")
-    def test_plot_primes_command_no_args(self, mock_print: Any) -> None:
-        """Test plot primes command with no arguments."""
-        self.cli._plot_primes([])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
-        self.assertIn("Usage:", output)
-
-    @patch("matplotlib.pyplot.show")
-    @patch("builtins.print")
-    def test_plot_collatz_command(self, mock_print: Any, mock_show: Any) -> None:
-        """Test plot Collatz command."""
-        self.cli._plot_collatz(["7"])
-        self.assertTrue(mock_print.called)
-        self.assertTrue(mock_show.called)
-
-    @patch("builtins.print")
-    def test_plot_collatz_command_no_args(self, mock_print: Any) -> None:
-        """Test plot Collatz command with no arguments."""
-        self.cli._plot_collatz([])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
-        self.assertIn("Usage:", output)
-
-    @patch("matplotlib.pyplot.show")
-    @patch("builtins.print")
-    def test_plot_comparative_command(self, mock_print: Any, mock_show: Any) -> None:
-        """Test plot comparative command."""
-        self.cli._plot_comparative(["fibonacci", "primes", "10"])
-        self.assertTrue(mock_print.called)
-        self.assertTrue(mock_show.called)
-
-    @patch("builtins.print")
-    def test_plot_comparative_command_no_args(self, mock_print: Any) -> None:
-        """Test plot comparative command with no arguments."""
-        self.cli._plot_comparative([])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
-        self.assertIn("Usage:", output)
-
     # Benchmark Commands Tests
-    @patch("builtins.print")
-    def test_benchmark_command(self, mock_print: Any) -> None:
+    def test_benchmark_command(self) -> None:
         """Test benchmark command."""
-        self.cli._benchmark(["primes", "100"])
-        self.assertTrue(mock_print.called)
+        self.assertNotEqual(self._capture(self.cli._benchmark, ["primes", "100"]), "")
 
-    @patch("builtins.print")
-    def test_benchmark_command_no_args(self, mock_print: Any) -> None:
+    def test_benchmark_command_no_args(self) -> None:
         """Test benchmark command with no arguments."""
-        self.cli._benchmark([])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
+        output = self._capture(self.cli._benchmark, [])
         self.assertIn("Quick Benchmark", output)
 
     # Test error handling in commands
-    @patch("builtins.print")
-    def test_simplify_command_invalid_expression(self, mock_print: Any) -> None:
+    def test_simplify_command_invalid_expression(self) -> None:
         """Test simplify command with invalid expression."""
-        self.cli._simplify(["invalid^^expression"])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
+        output = self._capture(self.cli._simplify, ["invalid^^expression"])
         self.assertIn("Error", output)
 
-    @patch("builtins.print")
-    def test_fibonacci_command_invalid_input(self, mock_print: Any) -> None:
+    def test_fibonacci_command_invalid_input(self) -> None:
         """Test fibonacci command with invalid input."""
-        self.cli._fibonacci(["abc"])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
+        output = self._capture(self.cli._fibonacci, ["abc"])
         self.assertIn("valid integer", output)
 
     # Additional error handling tests for comprehensive coverage
 
-    @patch("builtins.print")
-    def test_primes_command_invalid_input(self, mock_print: Any) -> None:
+    def test_primes_command_invalid_input(self) -> None:
         """Test primes command with invalid input."""
-        self.cli._primes(["abc"])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
+        output = self._capture(self.cli._primes, ["abc"])
         self.assertIn("valid integer", output)
 
-    @patch("builtins.print")
-    def test_primes_command_negative_input(self, mock_print: Any) -> None:
+    def test_primes_command_negative_input(self) -> None:
         """Test primes command with negative input."""
-        self.cli._primes(["-5"])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
+        output = self._capture(self.cli._primes, ["-5"])
         self.assertIn("number >= 2", output)
 
-    @patch("builtins.print")
-    def test_fibonacci_command_negative_input(self, mock_print: Any) -> None:
+    def test_fibonacci_command_negative_input(self) -> None:
         """Test fibonacci command with negative input."""
-        self.cli._fibonacci(["-5"])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
+        output = self._capture(self.cli._fibonacci, ["-5"])
         self.assertIn("positive number", output)
 
-    @patch("builtins.print")
-    def test_perfect_numbers_command_invalid_input(self, mock_print: Any) -> None:
+    def test_perfect_numbers_command_invalid_input(self) -> None:
         """Test perfect numbers command with invalid input."""
-        self.cli._perfect_numbers(["abc"])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
+        output = self._capture(self.cli._perfect_numbers, ["abc"])
         self.assertIn("valid integer", output)
 
-    @patch("builtins.print")
-    def test_perfect_numbers_command_negative_input(self, mock_print: Any) -> None:
+    def test_perfect_numbers_command_negative_input(self) -> None:
         """Test perfect numbers command with negative input."""
-        self.cli._perfect_numbers(["-5"])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
+        output = self._capture(self.cli._perfect_numbers, ["-5"])
         self.assertIn("positive number", output)
 
-    @patch("builtins.print")
-    def test_euler_totient_command_invalid_input(self, mock_print: Any) -> None:
+    def test_euler_totient_command_invalid_input(self) -> None:
         """Test Euler totient command with invalid input."""
-        self.cli._euler_totient(["abc"])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
+        output = self._capture(self.cli._euler_totient, ["abc"])
         self.assertIn("valid integer", output)
 
-    @patch("builtins.print")
-    def test_collatz_command_invalid_input(self, mock_print: Any) -> None:
+    def test_collatz_command_invalid_input(self) -> None:
         """Test Collatz command with invalid input."""
-        self.cli._collatz(["abc"])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
+        output = self._capture(self.cli._collatz, ["abc"])
         self.assertIn("valid integer", output)
 
-    @patch("builtins.print")
-    def test_twin_primes_command_invalid_input(self, mock_print: Any) -> None:
+    def test_twin_primes_command_invalid_input(self) -> None:
         """Test twin primes command with invalid input."""
-        self.cli._twin_primes(["abc"])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
+        output = self._capture(self.cli._twin_primes, ["abc"])
         self.assertIn("valid integer", output)
 
-    @patch("builtins.print")
-    def test_twin_primes_command_small_input(self, mock_print: Any) -> None:
+    def test_twin_primes_command_small_input(self) -> None:
         """Test twin primes command with input less than 3."""
-        self.cli._twin_primes(["2"])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
+        output = self._capture(self.cli._twin_primes, ["2"])
         self.assertIn("number >= 3", output)
 
-    @patch("builtins.print")
-    def test_goldbach_command_invalid_input(self, mock_print: Any) -> None:
+    def test_goldbach_command_invalid_input(self) -> None:
         """Test Goldbach command with invalid input."""
-        self.cli._goldbach(["abc"])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
+        output = self._capture(self.cli._goldbach, ["abc"])
         self.assertIn("valid integer", output)
 
-    @patch("builtins.print")
-    def test_goldbach_command_small_input(self, mock_print: Any) -> None:
+    def test_goldbach_command_small_input(self) -> None:
         """Test Goldbach command with input less than 4."""
-        self.cli._goldbach(["2"])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
+        output = self._capture(self.cli._goldbach, ["2"])
         self.assertIn("number >= 4", output)
 
-    @patch("builtins.print")
-    def test_run_method_keyboard_interrupt(self, mock_print: Any) -> None:
+    def test_run_method_keyboard_interrupt(self) -> None:
         """Test run method handles KeyboardInterrupt."""
         with patch("builtins.input", side_effect=KeyboardInterrupt):
-            self.cli.run()
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
+            output = self._capture(self.cli.run)
         self.assertIn("Goodbye", output)
 
-    @patch("builtins.print")
-    def test_run_method_eof_error(self, mock_print: Any) -> None:
+    def test_run_method_eof_error(self) -> None:
         """Test run method handles EOFError."""
         with patch("builtins.input", side_effect=EOFError):
-            self.cli.run()
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
+            output = self._capture(self.cli.run)
         self.assertIn("Goodbye", output)
 
-    @patch("builtins.print")
-    def test_run_method_generic_exception(self, mock_print: Any) -> None:
+    def test_run_method_generic_exception(self) -> None:
         """Test run method handles generic exceptions."""
 
         def mock_input_side_effect(*args: Any, **kwargs: Any) -> str:
@@ -603,56 +252,224 @@ class TestEternalMathCLI(unittest.TestCase):
             return "quit"
 
         with patch("builtins.input", side_effect=mock_input_side_effect):
-            self.cli.run()
+            output = self._capture(self.cli.run)
 
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
         self.assertIn("Error: Test exception", output)
 
-    @patch("builtins.print")
-    def test_run_method_empty_input(self, mock_print: Any) -> None:
+    def test_run_method_empty_input(self) -> None:
         """Test run method handles empty input."""
         inputs = ["", "quit"]
         with patch("builtins.input", side_effect=inputs):
-            self.cli.run()
+            self._capture(self.cli.run)
         # Should not raise any exception and should continue to next input
 
-    @patch("builtins.print")
-    def test_fibonacci_command_no_args(self, mock_print: Any) -> None:
-        """Test fibonacci command with no arguments."""
-        self.cli._fibonacci([])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
-        self.assertIn("Usage:", output)
-
-    @patch("builtins.print")
-    def test_perfect_numbers_command_no_args(self, mock_print: Any) -> None:
-        """Test perfect numbers command with no arguments."""
-        self.cli._perfect_numbers([])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
-        self.assertIn("Usage:", output)
-
-    @patch("builtins.print")
-    def test_euler_totient_command_no_args(self, mock_print: Any) -> None:
-        """Test Euler totient command with no arguments."""
-        self.cli._euler_totient([])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
-        self.assertIn("Usage:", output)
-
-    @patch("builtins.print")
-    def test_collatz_command_no_args(self, mock_print: Any) -> None:
-        """Test Collatz command with no arguments."""
-        self.cli._collatz([])
-        mock_print.assert_called()
-        calls = [str(call) for call in mock_print.call_args_list]
-        output = " ".join(calls)
-        self.assertIn("Usage:", output)
+
+class TestPlotCommands(_CLITestCase):
+    """Test the plot commands against a stubbed MathVisualizer."""
+
+    _viz_patch: Any
+    mock_viz: MagicMock
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Patch MathVisualizer before the shared CLI is built."""
+        cls._viz_patch = patch("eternal_math.cli.MathVisualizer")
+        cls.mock_viz = cls._viz_patch.start()
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Restore the real MathVisualizer."""
+        cls._viz_patch.stop()
+        super().tearDownClass()
+
+    def setUp(self) -> None:
+        """Clear the calls recorded by the previous test."""
+        super().setUp()
+        self.mock_viz.reset_mock()
+        self.visualizer = self.mock_viz.return_value
+
+    def test_plot_function_command(self) -> None:
+        """Test plot picks an x range suited to the expression."""
+        cases = [("sin(x)", (-10, 10)), ("exp(x)", (-5, 5)), ("tan(x)", (-3, 3))]
+        for expression, x_range in cases:
+            with self.subTest(expression=expression):
+                self.visualizer.plot_function.reset_mock()
+                output = self._capture(self.cli._plot_function, [expression])
+                self.visualizer.plot_function.assert_called_once_with(
+                    expression, x_range=x_range, title=f"Graph of f(x) = {expression}"
+                )
+                self.assertIn("Plot displayed successfully", output)
+
+    def test_plot_function_command_failure(self) -> None:
+        """Test plot reports a visualizer failure."""
+        self.visualizer.plot_function.return_value = False
+        self.addCleanup(setattr, self.visualizer.plot_function, "return_value", True)
+        output = self._capture(self.cli._plot_function, ["x**2"])
+        self.assertIn("Failed to create plot", output)
+
+    def test_plot_sequence_command(self) -> None:
+        """Test plotseq passes the sequence values as floats."""
+        output = self._capture(self.cli._plot_sequence, ["fibonacci", "5"])
+        self.visualizer.plot_sequence.assert_called_once_with(
+            [0.0, 1.0, 1.0, 2.0, 3.0], title="First 5 Fibonacci Numbers"
+        )
+        self.assertIn("Sequence plot displayed successfully", output)
+
+    def test_plot_primes_command(self) -> None:
+        """Test plotprimes passes the primes up to n."""
+        output = self._capture(self.cli._plot_primes, ["10"])
+        self.visualizer.plot_prime_distribution.assert_called_once_with(
+            [2, 3, 5, 7], 10
+        )
+        self.assertIn("Found 4 primes up to 10", output)
+
+    def test_plot_collatz_command(self) -> None:
+        """Test plotcollatz passes one trajectory per starting value."""
+        self._capture(self.cli._plot_collatz, ["3,4"])
+        self.visualizer.plot_collatz_trajectory.assert_called_once_with(
+            [[3, 10, 5, 16, 8, 4, 2, 1], [4, 2, 1]], [3, 4]
+        )
+
+    def test_plot_comparative_command(self) -> None:
+        """Test plotcomp builds both named sequences."""
+        output = self._capture(self.cli._plot_comparative, ["fibonacci", "primes", "3"])
+        self.visualizer.plot_comparative_sequences.assert_called_once_with(
+            {"Fibonacci": [0.0, 1.0, 1.0], "Primes": [2.0, 3.0, 5.0]},
+            title="Comparison: Fibonacci vs Primes",
+        )
+        self.assertIn("Comparing fibonacci vs primes", output)
+
+
+class TestSymbolicCommands(_CLITestCase):
+    """Test the symbolic commands' CLI plumbing with SymPy stubbed out."""
+
+    def setUp(self) -> None:
+        """Stub the symbolic engines the CLI delegates to."""
+        super().setUp()
+        symbolic = patch("eternal_math.cli.SymbolicMath", autospec=True)
+        calculus = patch("eternal_math.cli.CalculusUtils", autospec=True)
+        self.symbolic = symbolic.start()
+        self.calculus = calculus.start()
+        self.addCleanup(symbolic.stop)
+        self.addCleanup(calculus.stop)
+
+    def test_expression_commands(self) -> None:
+        """Test single-expression commands forward the joined expression."""
+        cases = [
+            ("_simplify", "simplify_expression", "Simplifying: x + x"),
+            ("_expand", "expand_expression", "Expanding: x + x"),
+            ("_factor", "factor_expression", "Factoring: x + x"),
+        ]
+        for name, engine_method, header in cases:
+            with self.subTest(cmd=name):
+                engine = getattr(self.symbolic, engine_method)
+                engine.return_value = "RESULT"
+                output = self._capture(getattr(self.cli, name), ["x", "+", "x"])
+                engine.assert_called_once_with("x + x")
+                self.assertIn(header, output)
+                self.assertIn("Result: RESULT", output)
+
+    def test_solve_command(self) -> None:
+        """Test solve forwards the equation and optional variable."""
+        self.symbolic.solve_equation.return_value = ["S1", "S2"]
+        output = self._capture(self.cli._solve, ["x**2 - 4", "x"])
+        self.symbolic.solve_equation.assert_called_once_with("x**2 - 4", "x")
+        self.assertIn("For variable: x", output)
+        self.assertIn("Solutions: ['S1', 'S2']", output)
+
+        self.symbolic.solve_equation.reset_mock()
+        output = self._capture(self.cli._solve, ["x - 1"])
+        self.symbolic.solve_equation.assert_called_once_with("x - 1", None)
+        self.assertNotIn("For variable", output)
+
+    def test_calculus_commands(self) -> None:
+        """Test diff and integrate forward the expression and variable."""
+        self.symbolic.differentiate.return_value = "D"
+        self.symbolic.integrate.return_value = "I"
+        output = self._capture(self.cli._differentiate, ["x**2", "x"])
+        self.symbolic.differentiate.assert_called_once_with("x**2", "x")
+        self.assertIn("Result: D", output)
+        output = self._capture(self.cli._integrate, ["2*x", "x"])
+        self.symbolic.integrate.assert_called_once_with("2*x", "x")
+        self.assertIn("Result: I + C", output)
+
+    def test_limit_command(self) -> None:
+        """Test limit forwards expression, variable and point."""
+        self.calculus.limit.return_value = "L"
+        output = self._capture(self.cli._limit, ["sin(x)/x", "x", "0"])
+        self.calculus.limit.assert_called_once_with("sin(x)/x", "x", "0")
+        self.assertIn("As x approaches: 0", output)
+        self.assertIn("Result: L", output)
+
+    def test_taylor_series_command(self) -> None:
+        """Test taylor parses the point and order before forwarding."""
+        self.calculus.taylor_series.return_value = "T"
+        output = self._capture(self.cli._taylor_series, ["exp(x)", "x", "0", "3"])
+        self.calculus.taylor_series.assert_called_once_with("exp(x)", "x", 0.0, 3)
+        self.assertIn("Order: 3", output)
+
+        self.calculus.taylor_series.reset_mock()
+        self._capture(self.cli._taylor_series, ["sin(x)", "x"])
+        self.calculus.taylor_series.assert_called_once_with("sin(x)", "x", 0, 6)
+
+    def test_substitute_command(self) -> None:
+        """Test substitute parses numeric and symbolic values."""
+        self.symbolic.substitute.return_value = "7"
+        output = self._capture(self.cli._substitute, ["x**2 + y", "x=2", "y=z"])
+        self.symbolic.substitute.assert_called_once_with(
+            "x**2 + y", {"x": 2.0, "y": "z"}
+        )
+        self.assertIn("Result: 7", output)
+
+    def test_substitute_command_invalid_format(self) -> None:
+        """Test substitute rejects assignments without '='."""
+        output = self._capture(self.cli._substitute, ["x**2", "x2"])
+        self.assertIn("Invalid substitution format: x2", output)
+        self.symbolic.substitute.assert_not_called()
+
+    def test_engine_error_is_reported(self) -> None:
+        """Test exceptions from the engine are printed, not raised."""
+        self.symbolic.simplify_expression.side_effect = ValueError("bad input")
+        output = self._capture(self.cli._simplify, ["x"])
+        self.assertIn("Error simplifying expression: bad input", output)
+
+
+@pytest.mark.slow
+class TestSymbolicIntegration(_CLITestCase):
+    """End-to-end symbolic command tests against the real SymPy engine."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Warm SymPy's parser and caches once for the whole class."""
+        super().setUpClass()
+        SymbolicMath.expand_expression("(x + 1)**2")
+        SymbolicMath.differentiate("x**2", "x")
+        SymbolicMath.integrate("2*x", "x")
+        CalculusUtils.taylor_series("exp(x)", "x", 0, 3)
+
+    def test_symbolic_commands(self) -> None:
+        """Test each symbolic command's final result line."""
+        cases = [
+            ("_simplify", ["(x + 1)**2"], "Result: (x + 1)**2"),
+            ("_expand", ["(x + 1)**2"], "Result: x**2 + 2*x + 1"),
+            ("_factor", ["x**2 - 1"], "Result: (x - 1)*(x + 1)"),
+            ("_solve", ["x**2 - 4", "x"], "Solutions: [-2, 2]"),
+            ("_differentiate", ["x**2", "x"], "Result: 2*x"),
+            ("_integrate", ["2*x", "x"], "Result: x**2 + C"),
+            ("_limit", ["sin(x)/x", "x", "0"], "Result: 1"),
+            ("_taylor_series", ["exp(x)", "x", "0", "3"], "Result: x**2/2 + x + 1"),
+        ]
+        for name, args, expected in cases:
+            with self.subTest(cmd=name, args=args):
+                output = self._capture(getattr(self.cli, name), args)
+                self.assertEqual(output.rstrip().splitlines()[-1].strip(), expected)
+
+    def test_substitute_command(self) -> None:
+        """Test substitute command."""
+        output = self._capture(self.cli._substitute, ["x**2 + y", "x=2", "y=3"])
+        # The result is a SymPy Float, whose printed precision is not pinned
+        self.assertIn("Result: 7", output)
 
 
 if __name__ == "__main__":
@@ -5,75 +5,134 @@ These tests verify end-to-end functionality, entry points, and complete workflow
 that users would actually experience when using the CLI.
 """
 
+import runpy
+from contextlib import contextmanager
+from typing import Any, Iterator
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from eternal_math.cli import EternalMathCLI, main
 
+# Commands that should be available based on help text
+_EXPECTED_COMMANDS = frozenset(
+    {
+        "help",
+        "primes",
+        "fibonacci",
+        "perfect",
+        "twins",
+        "goldbach",
+        "euler",
+        "collatz",
+        "crt",
+        "theorem",
+        "examples",
+        "simplify",
+        "expand",
+        "factor",
+        "solve",
+        "diff",
+        "integrate",
+        "limit",
+        "taylor",
+        "substitute",
+        "plot",
+        "plotseq",
+        "plotprimes",
+        "plotcollatz",
+        "plotcomp",
+        "benchmark",
+        "quit",
+        "exit",
+    }
+)
+
+# Commands whose output does not depend on each other, run as one session
+_WORKFLOW_INPUTS = (
+    "help",
+    "primes 10",
+    "fibonacci 5",
+    "simplify x**2 + 2*x + 1",
+    "benchmark",
+    "theorem",
+    "examples",
+    "quit",
+)
+
+
+@contextmanager
+def cli_inputs(*items: Any) -> Iterator[MagicMock]:
+    """Script input() with items and capture print(), yielding the print mock."""
+    with (
+        patch("builtins.input", side_effect=iter(items)),
+        patch("builtins.print") as mock_print,
+    ):
+        yield mock_print
+
+
+def printed_text(mock_print: MagicMock) -> str:
+    """Join everything passed to a mocked print() into one string."""
+    return "\n".join(
+        " ".join(map(str, call.args)) for call in mock_print.call_args_list
+    )
+
+
+@pytest.fixture(scope="session")
+def shared_cli() -> EternalMathCLI:
+    """Build one CLI for the whole session; construction is deterministic."""
+    return EternalMathCLI()
+
+
+@pytest.fixture
+def cli(shared_cli: EternalMathCLI) -> EternalMathCLI:
+    """Hand each test the shared CLI with its running flag reset."""
+    shared_cli.running = True
+    return shared_cli
+
+
+@pytest.fixture(scope="class")
+def session_output(shared_cli: EternalMathCLI) -> str:
+    """Run the read-only workflow commands in one CLI session, once per class."""
+    shared_cli.running = True
+    with cli_inputs(*_WORKFLOW_INPUTS) as mock_print:
+        shared_cli.run()
+    return printed_text(mock_print)
+
 
 class TestCLIIntegration:
     """Integration tests for CLI functionality."""
 
-    def setup_method(self) -> None:
-        """Setup for each test method."""
-        self.cli = EternalMathCLI()
-
     def test_main_function_entry_point(self) -> None:
         """Test that main() creates and runs CLI properly."""
         with patch.object(EternalMathCLI, "run") as mock_run:
             main()
             mock_run.assert_called_once()
 
-    def test_cli_startup_sequence(self) -> None:
+    def test_cli_startup_sequence(self, cli: EternalMathCLI) -> None:
         """Test the CLI startup welcome message and initialization."""
-        with patch("builtins.input", side_effect=["quit"]):
-            with patch("builtins.print") as mock_print:
-                self.cli.run()
-
-                # Verify welcome message is displayed
-                print_calls = [call[0][0] for call in mock_print.call_args_list]
-                assert any(
-                    "Welcome to Eternal Math" in str(call) for call in print_calls
-                )
-                assert any(
-                    "Type 'help' for available commands" in str(call)
-                    for call in print_calls
-                )
+        with cli_inputs("quit") as mock_print:
+            cli.run()
+
+        # Verify welcome message is displayed
+        output = printed_text(mock_print)
+        assert "Welcome to Eternal Math" in output
+        assert "Type 'help' for available commands" in output
 
-    def test_help_command_workflow(self) -> None:
+    def test_help_command_workflow(self, session_output: str) -> None:
         """Test complete help command workflow."""
-        with patch("builtins.input", side_effect=["help", "quit"]):
-            with patch("builtins.print") as mock_print:
-                self.cli.run()
-
-                # Verify help content is displayed
-                print_calls = [call[0][0] for call in mock_print.call_args_list]
-                assert any(
-                    "Eternal Math CLI Commands" in str(call) for call in print_calls
-                )
-                assert any("Number Theory" in str(call) for call in print_calls)
-                assert any("Symbolic Mathematics" in str(call) for call in print_calls)
+        # Verify help content is displayed
+        assert "Eternal Math CLI Commands" in session_output
+        assert "Number Theory" in session_output
+        assert "Symbolic Mathematics" in session_output
 
-    def test_mathematical_computation_workflow(self) -> None:
+    def test_mathematical_computation_workflow(self, session_output: str) -> None:
         """Test a complete mathematical computation workflow."""
-        inputs = ["primes 10", "fibonacci 5", "simplify x**2 + 2*x + 1", "quit"]
-
-        with patch("builtins.input", side_effect=inputs):
-            with patch("builtins.print") as mock_print:
-                self.cli.run()
-
-                print_calls = [str(call) for call in mock_print.call_args_list]
-
-                # Verify mathematical results are computed and displayed
-                assert any(
-                    "[2, 3, 5, 7]" in call for call in print_calls
-                )  # Prime results
-                assert any(
-                    "[0, 1, 1, 2, 3]" in call for call in print_calls
-                )  # Fibonacci results
+        # Verify mathematical results are computed and displayed
+        assert "[2, 3, 5, 7]" in session_output  # Prime results
+        assert "[0, 1, 1, 2, 3]" in session_output  # Fibonacci results
 
-    def test_error_handling_workflow(self) -> None:
+    def test_error_handling_workflow(self, cli: EternalMathCLI) -> None:
         """Test CLI error handling in realistic scenarios."""
         inputs = [
             "invalid_command",
@@ -82,159 +141,94 @@ class TestCLIIntegration:
             "quit",
         ]
 
-        with patch("builtins.input", side_effect=inputs):
-            with patch("builtins.print") as mock_print:
-                self.cli.run()
+        with cli_inputs(*inputs) as mock_print:
+            cli.run()
 
-                print_calls = [str(call) for call in mock_print.call_args_list]
+        # Verify error messages are displayed appropriately
+        output = printed_text(mock_print)
+        assert "Unknown command" in output
+        assert "valid integer" in output or "Error" in output
 
-                # Verify error messages are displayed appropriately
-                assert any("Unknown command" in call for call in print_calls)
-                assert any(
-                    "valid integer" in call or "Error" in call for call in print_calls
-                )
-
-    def test_keyboard_interrupt_handling(self) -> None:
+    def test_keyboard_interrupt_handling(self, cli: EternalMathCLI) -> None:
         """Test graceful handling of Ctrl+C."""
-        with patch("builtins.input", side_effect=KeyboardInterrupt):
-            with patch("builtins.print") as mock_print:
-                self.cli.run()
+        with cli_inputs(KeyboardInterrupt) as mock_print:
+            cli.run()
 
-                print_calls = [str(call) for call in mock_print.call_args_list]
-                assert any("Goodbye" in call for call in print_calls)
+        assert "Goodbye" in printed_text(mock_print)
 
-    def test_eof_error_handling(self) -> None:
+    def test_eof_error_handling(self, cli: EternalMathCLI) -> None:
         """Test graceful handling of EOF (Ctrl+D)."""
-        with patch("builtins.input", side_effect=EOFError):
-            with patch("builtins.print") as mock_print:
-                self.cli.run()
+        with cli_inputs(EOFError) as mock_print:
+            cli.run()
 
-                print_calls = [str(call) for call in mock_print.call_args_list]
-                assert any("Goodbye" in call for call in print_calls)
+        assert "Goodbye" in printed_text(mock_print)
 
-    @patch("matplotlib.pyplot.show")
-    def test_visualization_workflow(self, mock_show: MagicMock) -> None:
+    def test_visualization_workflow(self, cli: EternalMathCLI) -> None:
         """Test visualization command integration."""
-        with patch("builtins.input", side_effect=["plot sin(x)", "quit"]):
-            with patch("builtins.print") as mock_print:
-                self.cli.run()
-
-                print_calls = [str(call) for call in mock_print.call_args_list]
-                # Should attempt to plot
-                assert any(
-                    "Plotting function" in call or "Plot" in call
-                    for call in print_calls
-                )
+        # Stub the visualizer so the workflow is checked without rendering
+        with patch.object(cli, "visualizer") as mock_viz:
+            with cli_inputs("plot sin(x)", "quit") as mock_print:
+                cli.run()
+
+        mock_viz.plot_function.assert_called_once()
+        assert mock_viz.plot_function.call_args.args[0] == "sin(x)"
+        assert "Plotting function" in printed_text(mock_print)
 
-    def test_benchmark_workflow(self) -> None:
+    def test_benchmark_workflow(self, session_output: str) -> None:
         """Test benchmark command integration."""
-        with patch("builtins.input", side_effect=["benchmark", "quit"]):
-            with patch("builtins.print") as mock_print:
-                self.cli.run()
-
-                # Verify benchmark output is displayed
-                print_calls = [str(call) for call in mock_print.call_args_list]
-                assert any(
-                    "benchmark" in call.lower() or "performance" in call.lower()
-                    for call in print_calls
-                )
+        # Verify benchmark output is displayed
+        assert "Quick Benchmark" in session_output
 
-    def test_theorem_proof_workflow(self) -> None:
+    def test_theorem_proof_workflow(self, session_output: str) -> None:
         """Test theorem and proof system integration."""
-        with patch("builtins.input", side_effect=["theorem", "quit"]):
-            with patch("builtins.print") as mock_print:
-                self.cli.run()
-
-                print_calls = [str(call) for call in mock_print.call_args_list]
-                # Should display theorem information
-                assert any("integer greater than 1" in call for call in print_calls)
-                assert any("Proven" in call for call in print_calls)
+        # Should display theorem information
+        assert "integer greater than 1" in session_output
+        assert "Proven" in session_output
 
-    def test_examples_command_workflow(self) -> None:
+    def test_examples_command_workflow(self, session_output: str) -> None:
         """Test examples command provides useful information."""
-        with patch("builtins.input", side_effect=["examples", "quit"]):
-            with patch("builtins.print") as mock_print:
-                self.cli.run()
+        assert "Usage Examples" in session_output
+        assert "primes" in session_output
 
-                print_calls = [str(call) for call in mock_print.call_args_list]
-                assert any("Usage Examples" in call for call in print_calls)
-                assert any("primes" in call for call in print_calls)
-
-    def test_command_case_insensitivity(self) -> None:
+    def test_command_case_insensitivity(self, cli: EternalMathCLI) -> None:
         """Test that commands work regardless of case."""
         inputs = ["HELP", "Help", "hElP", "quit"]
 
-        with patch("builtins.input", side_effect=inputs):
-            with patch("builtins.print") as mock_print:
-                self.cli.run()
+        # Count dispatches instead of printing the full help text three times
+        help_command = MagicMock()
+        with patch.dict(cli.commands, {"help": help_command}):
+            with cli_inputs(*inputs):
+                cli.run()
 
-                # Should handle all case variations of help
-                print_calls = [str(call) for call in mock_print.call_args_list]
-                help_calls = [call for call in print_calls if "CLI Commands" in call]
-                assert len(help_calls) >= 3  # Should show help multiple times
+        # Should handle all case variations of help
+        assert help_command.call_count == 3
+        help_command.assert_called_with([])
 
-    def test_empty_input_handling(self) -> None:
+    def test_empty_input_handling(self, cli: EternalMathCLI) -> None:
         """Test handling of empty input."""
-        with patch("builtins.input", side_effect=["", "   ", "\t", "quit"]):
-            with patch("builtins.print") as mock_print:
-                self.cli.run()
+        with cli_inputs("", "   ", "\t", "quit") as mock_print:
+            cli.run()
 
-                # Should not crash on empty inputs
-                print_calls = [str(call) for call in mock_print.call_args_list]
-                assert any("Goodbye" in call for call in print_calls)
+        # Should not crash on empty inputs
+        assert "Goodbye" in printed_text(mock_print)
 
-    def test_cli_state_management(self) -> None:
+    def test_cli_state_management(self, cli: EternalMathCLI) -> None:
         """Test that CLI maintains proper state during execution."""
-        initial_running = self.cli.running
+        initial_running = cli.running
         assert initial_running is True
 
-        with patch("builtins.input", side_effect=["help", "quit"]):
-            self.cli.run()
+        with cli_inputs("help", "quit"):
+            cli.run()
 
         # Running state should be maintained properly
-        assert hasattr(self.cli, "running")
-        assert hasattr(self.cli, "commands")
-        assert isinstance(self.cli.commands, dict)
+        assert hasattr(cli, "running")
+        assert hasattr(cli, "commands")
+        assert isinstance(cli.commands, dict)
 
-    def test_all_declared_commands_exist(self) -> None:
+    def test_all_declared_commands_exist(self, cli: EternalMathCLI) -> None:
         """Test that all commands mentioned in help actually exist."""
-        # Extract all commands from the CLI
-        available_commands = set(self.cli.commands.keys())
-
-        # Commands that should be available based on help text
-        expected_commands = {
-            "help",
-            "primes",
-            "fibonacci",
-            "perfect",
-            "twins",
-            "goldbach",
-            "euler",
-            "collatz",
-            "crt",
-            "theorem",
-            "examples",
-            "simplify",
-            "expand",
-            "factor",
-            "solve",
-            "diff",
-            "integrate",
-            "limit",
-            "taylor",
-            "substitute",
-            "plot",
-            "plotseq",
-            "plotprimes",
-            "plotcollatz",
-            "plotcomp",
-            "benchmark",
-            "quit",
-            "exit",
-        }
-
         # Verify all expected commands are implemented
-        missing_commands = expected_commands - available_commands
+        missing_commands = _EXPECTED_COMMANDS - cli.commands.keys()
         assert (
             not missing_commands
         ), f"Missing command implementations: {missing_commands}"
@@ -243,22 +237,17 @@ class TestCLIIntegration:
 class TestCLISystemIntegration:
     """Test CLI integration with the system and external interfaces."""
 
+    @pytest.mark.filterwarnings("ignore::RuntimeWarning")
     def test_cli_executable_entry_point(self) -> None:
         """Test that the CLI can be executed as a script."""
-        # Test the __main__ block
-        with patch("eternal_math.cli.main") as mock_main:
-            # Simulate running the module as main
-            exec_globals = {"__name__": "__main__"}
-            exec(
-                """
-if __name__ == "__main__":
-    main()
-            """,
-                exec_globals,
-                {"main": mock_main},
-            )
+        # Run the module's __main__ block; the RuntimeWarning is runpy noting
+        # that eternal_math.cli is already imported
+        with cli_inputs("quit") as mock_print:
+            runpy.run_module("eternal_math.cli", run_name="__main__")
 
-            mock_main.assert_called_once()
+        output = printed_text(mock_print)
+        assert "Welcome to Eternal Math" in output
+        assert "Goodbye" in output
 
     def test_import_integration(self) -> None:
         """Test that CLI imports all required modules successfully."""
@@ -271,57 +260,57 @@ if __name__ == "__main__":
         assert hasattr(cli, "commands")
         assert callable(main)
 
-    def test_mathematical_library_integration(self) -> None:
+    def test_mathematical_library_integration(self, cli: EternalMathCLI) -> None:
         """Test CLI integrates properly with mathematical libraries."""
-        cli = EternalMathCLI()
-
         # Test that mathematical functions are accessible
-        with patch("builtins.input", side_effect=["primes 10", "quit"]):
-            with patch("builtins.print"):
-                try:
-                    cli.run()
-                except Exception as e:
-                    pytest.fail(
-                        f"CLI should integrate with math libraries without errors: {e}"
-                    )
+        with cli_inputs("primes 10", "quit"):
+            try:
+                cli.run()
+            except Exception as e:
+                pytest.fail(
+                    f"CLI should integrate with math libraries without errors: {e}"
+                )
 
     @patch("matplotlib.pyplot.show")
     @patch.dict("os.environ", {"MPLBACKEND": "Agg"})
-    def test_visualization_backend_integration(self, mock_show: MagicMock) -> None:
+    def test_visualization_backend_integration(
+        self, mock_show: MagicMock, cli: EternalMathCLI
+    ) -> None:
         """Test CLI works with matplotlib backend configuration."""
-        with patch("builtins.input", side_effect=["plot x**2", "quit"]):
-            with patch("builtins.print"):
-                cli = EternalMathCLI()
-                try:
-                    cli.run()
-                except ImportError as e:
-                    pytest.fail(f"CLI should handle matplotlib backend properly: {e}")
+        with cli_inputs("plot x**2", "quit"):
+            try:
+                cli.run()
+            except ImportError as e:
+                pytest.fail(f"CLI should handle matplotlib backend properly: {e}")
 
     def test_cli_memory_usage(self) -> None:
         """Test CLI doesn't leak memory during normal operation."""
         import gc
+        import tracemalloc
 
-        initial_objects = len(gc.get_objects())
-
-        # Run CLI with several commands
-        with patch(
-            "builtins.input", side_effect=["help", "primes 10", "fibonacci 5", "quit"]
-        ):
-            with patch("builtins.print"):
+        def run_session() -> None:
+            with cli_inputs("help", "primes 10", "fibonacci 5", "quit"):
                 cli = EternalMathCLI()
                 cli.run()
                 del cli
 
-        # Force garbage collection
-        gc.collect()
-
-        final_objects = len(gc.get_objects())
-
-        # Allow some variance but check for major memory leaks
-        object_difference = final_objects - initial_objects
-        assert (
-            object_difference < 1000
-        ), f"Potential memory leak detected: {object_difference} objects"
+        # Fill one-off caches first so only per-session growth is measured
+        run_session()
+
+        tracemalloc.start()
+        try:
+            gc.collect()
+            before = tracemalloc.take_snapshot()
+            for _ in range(10):
+                run_session()
+            gc.collect()
+            after = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+
+        # A retained CLI costs about 4 KiB, so ten leaked sessions exceed this
+        growth = sum(stat.size_diff for stat in after.compare_to(before, "lineno"))
+        assert growth < 16 * 1024, f"Potential memory leak detected: {growth} bytes"
 
 
 if __name__ == "__main__":
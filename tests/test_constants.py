@@ -3,69 +3,73 @@ Test module for mathematical constants.
 """
 
 import math
+from functools import partial
+
+import pytest
 
 from eternal_math.core import Constants, constants
 
+_SQRT_5 = math.sqrt(5)
+
+# Absolute tolerance shared by every floating-point comparison below
+_APPROX = partial(pytest.approx, abs=1e-15)
+
+# Reference values for every finite constant, computed once at import
+_EXPECTED = {
+    "PI": math.pi,
+    "E": math.e,
+    "TAU": 2 * math.pi,
+    "PHI": (1 + _SQRT_5) / 2,
+    "PHI_INVERSE": 2 / (1 + _SQRT_5),
+    "GAMMA": 0.5772156649015329,
+    "SQRT_2": math.sqrt(2),
+    "SQRT_3": math.sqrt(3),
+    "SQRT_5": _SQRT_5,
+    "LN_2": math.log(2),
+    "LN_10": math.log(10),
+}
+
 
 class TestConstants:
     """Test mathematical constants."""
 
+    @pytest.mark.parametrize("name, expected", list(_EXPECTED.items()))
+    def test_constant_values(self, name: str, expected: float) -> None:
+        """Test each constant against its reference value."""
+        assert getattr(constants, name) == _APPROX(expected)
+        assert getattr(Constants, name) == getattr(constants, name)
+
     def test_basic_constants(self) -> None:
         """Test basic mathematical constants."""
-        # Test π
-        assert abs(constants.PI - math.pi) < 1e-15
-        assert abs(Constants.PI - math.pi) < 1e-15
-
-        # Test e
-        assert abs(constants.E - math.e) < 1e-15
-        assert abs(Constants.E - math.e) < 1e-15
-
         # Test τ (tau) = 2π
-        assert abs(constants.TAU - 2 * math.pi) < 1e-15
         assert constants.TAU == 2 * constants.PI
 
     def test_golden_ratio(self) -> None:
         """Test golden ratio and related constants."""
-        # Test φ (golden ratio)
-        expected_phi = (1 + math.sqrt(5)) / 2
-        assert abs(constants.PHI - expected_phi) < 1e-15
-
-        # Test 1/φ
-        expected_phi_inv = 2 / (1 + math.sqrt(5))
-        assert abs(constants.PHI_INVERSE - expected_phi_inv) < 1e-15
-
         # Test mathematical relationship: φ * (1/φ) = 1
-        assert abs(constants.PHI * constants.PHI_INVERSE - 1) < 1e-15
+        assert constants.PHI * constants.PHI_INVERSE == _APPROX(1)
 
         # Test golden ratio property: φ² = φ + 1
-        assert abs(constants.PHI**2 - (constants.PHI + 1)) < 1e-15
+        assert constants.PHI**2 == _APPROX(constants.PHI + 1)
 
     def test_euler_mascheroni_constant(self) -> None:
         """Test Euler-Mascheroni constant."""
         # Verify it's approximately 0.5772...
         assert 0.577 < constants.GAMMA < 0.578
-        assert abs(constants.GAMMA - 0.5772156649015329) < 1e-15
 
     def test_square_roots(self) -> None:
         """Test square root constants."""
-        assert abs(constants.SQRT_2 - math.sqrt(2)) < 1e-15
-        assert abs(constants.SQRT_3 - math.sqrt(3)) < 1e-15
-        assert abs(constants.SQRT_5 - math.sqrt(5)) < 1e-15
-
         # Verify they are indeed square roots
-        assert abs(constants.SQRT_2**2 - 2) < 1e-15
-        assert abs(constants.SQRT_3**2 - 3) < 1e-15
-        assert abs(constants.SQRT_5**2 - 5) < 1e-15
+        assert constants.SQRT_2**2 == _APPROX(2)
+        assert constants.SQRT_3**2 == _APPROX(3)
+        assert constants.SQRT_5**2 == _APPROX(5)
 
     def test_logarithms(self) -> None:
         """Test natural logarithm constants."""
-        assert abs(constants.LN_2 - math.log(2)) < 1e-15
-        assert abs(constants.LN_10 - math.log(10)) < 1e-15
-
         # Verify exponential relationships (use slightly looser tolerance for
         # floating-point precision)
-        assert abs(math.exp(constants.LN_2) - 2) < 1e-14
-        assert abs(math.exp(constants.LN_10) - 10) < 1e-14
+        assert math.exp(constants.LN_2) == pytest.approx(2, abs=1e-14)
+        assert math.exp(constants.LN_10) == pytest.approx(10, abs=1e-14)
 
     def test_infinity_constants(self) -> None:
         """Test infinity constants."""
@@ -101,42 +105,30 @@ class TestConstants:
         # Test logarithm base conversions
         # ln(10) / ln(2) should equal log₂(10)
         log2_10 = constants.LN_10 / constants.LN_2
-        assert abs(log2_10 - math.log2(10)) < 1e-15
+        assert log2_10 == _APPROX(math.log2(10))
 
     def test_precision_and_accuracy(self) -> None:
         """Test that constants have appropriate precision."""
         # All constants should have at least 15 decimal places of accuracy
-        assert abs(constants.PI - 3.141592653589793) < 1e-15
-        assert abs(constants.E - 2.718281828459045) < 1e-15
-        assert abs(constants.PHI - 1.618033988749895) < 1e-15
+        assert constants.PI == _APPROX(3.141592653589793)
+        assert constants.E == _APPROX(2.718281828459045)
+        assert constants.PHI == _APPROX(1.618033988749895)
 
     def test_constants_in_calculations(self) -> None:
         """Test using constants in mathematical calculations."""
         # Area of unit circle: π * r² = π * 1² = π
         unit_circle_area = constants.PI * 1**2
-        assert abs(unit_circle_area - constants.PI) < 1e-15
+        assert unit_circle_area == _APPROX(constants.PI)
 
         # Compound interest: A = P * e^(rt) for continuous compounding
         # For P=1, r=1, t=1: A = e
         compound_result = 1 * math.exp(1 * 1)
-        assert abs(compound_result - constants.E) < 1e-15
+        assert compound_result == _APPROX(constants.E)
 
         # Golden rectangle ratio
         golden_rect_ratio = (1 + constants.SQRT_5) / 2
-        assert abs(golden_rect_ratio - constants.PHI) < 1e-15
+        assert golden_rect_ratio == _APPROX(constants.PHI)
 
 
 if __name__ == "__main__":
-    # Run tests manually if pytest is not available
-    test_instance = TestConstants()
-    test_instance.test_basic_constants()
-    test_instance.test_golden_ratio()
-    test_instance.test_euler_mascheroni_constant()
-    test_instance.test_square_roots()
-    test_instance.test_logarithms()
-    test_instance.test_infinity_constants()
-    test_instance.test_constants_immutability()
-    test_instance.test_mathematical_relationships()
-    test_instance.test_precision_and_accuracy()
-    test_instance.test_constants_in_calculations()
-    print("All constants tests passed!")
+    pytest.main([__file__])
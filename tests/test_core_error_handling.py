@@ -2,35 +2,35 @@
 Tests for error handling in the core module.
 """
 
+from typing import Any, Callable, Tuple, Type
+
 import pytest
 
 from eternal_math.core import Function, Set, gcd, is_prime, lcm, prime_factorization
 
+_NOT_INTEGERS = "Both arguments must be integers"
+_NOT_AN_INTEGER = "Argument must be an integer"
+_NOT_FACTORIZABLE = "Prime factorization is only defined for integers >= 2"
+
 
 class TestGcdErrorHandling:
     """Test error handling for GCD function."""
 
-    def test_gcd_type_error_first_arg(self) -> None:
-        """Test that GCD raises TypeError for non-integer first argument."""
-        with pytest.raises(TypeError, match="Both arguments must be integers"):
-            gcd("a", 5)  # type: ignore
-
-    def test_gcd_type_error_second_arg(self) -> None:
-        """Test that GCD raises TypeError for non-integer second argument."""
-        with pytest.raises(TypeError, match="Both arguments must be integers"):
-            gcd(5, "b")  # type: ignore
-
-    def test_gcd_type_error_both_args(self) -> None:
-        """Test that GCD raises TypeError for non-integer arguments."""
-        with pytest.raises(TypeError, match="Both arguments must be integers"):
-            gcd("a", "b")  # type: ignore
-
-    def test_gcd_value_error_both_zero(self) -> None:
-        """Test that GCD raises ValueError when both arguments are zero."""
-        with pytest.raises(
-            ValueError, match="GCD is undefined when both arguments are zero"
-        ):
-            gcd(0, 0)
+    @pytest.mark.parametrize(
+        "args, exc, msg",
+        [
+            (("a", 5), TypeError, _NOT_INTEGERS),
+            ((5, "b"), TypeError, _NOT_INTEGERS),
+            (("a", "b"), TypeError, _NOT_INTEGERS),
+            ((0, 0), ValueError, "GCD is undefined when both arguments are zero"),
+        ],
+    )
+    def test_gcd_errors(
+        self, args: Tuple[Any, Any], exc: Type[Exception], msg: str
+    ) -> None:
+        """Test that GCD rejects non-integer and all-zero arguments."""
+        with pytest.raises(exc, match=msg):
+            gcd(*args)
 
     def test_gcd_valid_with_one_zero(self) -> None:
         """Test that GCD works correctly with one zero argument."""
@@ -41,59 +41,41 @@ class TestGcdErrorHandling:
 class TestLcmErrorHandling:
     """Test error handling for LCM function."""
 
-    def test_lcm_type_error_first_arg(self) -> None:
-        """Test that LCM raises TypeError for non-integer first argument."""
-        with pytest.raises(TypeError, match="Both arguments must be integers"):
-            lcm("a", 5)  # type: ignore
-
-    def test_lcm_type_error_second_arg(self) -> None:
-        """Test that LCM raises TypeError for non-integer second argument."""
-        with pytest.raises(TypeError, match="Both arguments must be integers"):
-            lcm(5, "b")  # type: ignore
+    @pytest.mark.parametrize("args", [("a", 5), (5, "b")])
+    def test_lcm_type_errors(self, args: Tuple[Any, Any]) -> None:
+        """Test that LCM raises TypeError for non-integer arguments."""
+        with pytest.raises(TypeError, match=_NOT_INTEGERS):
+            lcm(*args)
 
 
 class TestIsPrimeErrorHandling:
     """Test error handling for is_prime function."""
 
-    def test_is_prime_type_error(self) -> None:
-        """Test that is_prime raises TypeError for non-integer argument."""
-        with pytest.raises(TypeError, match="Argument must be an integer"):
-            is_prime("5")  # type: ignore
-
-    def test_is_prime_type_error_float(self) -> None:
-        """Test that is_prime raises TypeError for float argument."""
-        with pytest.raises(TypeError, match="Argument must be an integer"):
-            is_prime(5.0)  # type: ignore
+    @pytest.mark.parametrize("value", ["5", 5.0])
+    def test_is_prime_type_errors(self, value: Any) -> None:
+        """Test that is_prime raises TypeError for non-integer arguments."""
+        with pytest.raises(TypeError, match=_NOT_AN_INTEGER):
+            is_prime(value)
 
 
 class TestPrimeFactorizationErrorHandling:
     """Test error handling for prime_factorization function."""
 
-    def test_prime_factorization_type_error(self) -> None:
-        """Test that prime_factorization raises TypeError for non-integer argument."""
-        with pytest.raises(TypeError, match="Argument must be an integer"):
-            prime_factorization("10")  # type: ignore
-
-    def test_prime_factorization_value_error_negative(self) -> None:
-        """Test that prime_factorization raises ValueError for negative numbers."""
-        with pytest.raises(
-            ValueError, match="Prime factorization is only defined for integers >= 2"
-        ):
-            prime_factorization(-5)
-
-    def test_prime_factorization_value_error_zero(self) -> None:
-        """Test that prime_factorization raises ValueError for zero."""
-        with pytest.raises(
-            ValueError, match="Prime factorization is only defined for integers >= 2"
-        ):
-            prime_factorization(0)
-
-    def test_prime_factorization_value_error_one(self) -> None:
-        """Test that prime_factorization raises ValueError for one."""
-        with pytest.raises(
-            ValueError, match="Prime factorization is only defined for integers >= 2"
-        ):
-            prime_factorization(1)
+    @pytest.mark.parametrize(
+        "value, exc, msg",
+        [
+            ("10", TypeError, _NOT_AN_INTEGER),
+            (-5, ValueError, _NOT_FACTORIZABLE),
+            (0, ValueError, _NOT_FACTORIZABLE),
+            (1, ValueError, _NOT_FACTORIZABLE),
+        ],
+    )
+    def test_prime_factorization_errors(
+        self, value: Any, exc: Type[Exception], msg: str
+    ) -> None:
+        """Test that prime_factorization rejects non-integers and values < 2."""
+        with pytest.raises(exc, match=msg):
+            prime_factorization(value)
 
 
 class TestSetErrorHandling:
@@ -110,23 +92,14 @@ class TestSetErrorHandling:
         Set([1, 2, 3])  # list
         Set()  # empty/None
 
-    def test_set_union_type_error(self) -> None:
-        """Test that Set.union raises TypeError for non-Set argument."""
-        s = Set([1, 2, 3])
-        with pytest.raises(TypeError, match="Argument must be a Set instance"):
-            s.union([4, 5, 6])  # type: ignore
-
-    def test_set_intersection_type_error(self) -> None:
-        """Test that Set.intersection raises TypeError for non-Set argument."""
-        s = Set([1, 2, 3])
-        with pytest.raises(TypeError, match="Argument must be a Set instance"):
-            s.intersection([2, 3, 4])  # type: ignore
-
-    def test_set_difference_type_error(self) -> None:
-        """Test that Set.difference raises TypeError for non-Set argument."""
+    @pytest.mark.parametrize("operation", [Set.union, Set.intersection, Set.difference])
+    def test_set_operation_type_errors(
+        self, operation: Callable[[Set, Any], Set]
+    ) -> None:
+        """Test that Set operations raise TypeError for non-Set arguments."""
         s = Set([1, 2, 3])
         with pytest.raises(TypeError, match="Argument must be a Set instance"):
-            s.difference([2, 3])  # type: ignore
+            operation(s, [2, 3, 4])
 
 
 class TestFunctionErrorHandling:
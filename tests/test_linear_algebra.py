@@ -2,13 +2,28 @@
 Tests for linear algebra module.
 """
 
+import math
 from typing import List, Union
+from unittest.mock import patch
 
+import numpy as np
 import pytest
 import sympy as sp
 from sympy import Matrix
 
-from eternal_math.linear_algebra import LinearAlgebra, MatrixOperations, Vector
+from eternal_math.linear_algebra import (
+    LinearAlgebra,
+    MatrixOperations,
+    Vector,
+    VectorBatch,
+    _rational_lu,
+)
+
+# Shared integer literals, built once and passed straight to Vector/Matrix
+_V123 = np.array([1, 2, 3])
+_A22 = np.array([[1, 2], [3, 4]])
+_A33 = np.array([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+_SINGULAR22 = np.array([[1, 2], [2, 4]])
 
 
 class TestVector:
@@ -16,7 +31,7 @@ class TestVector:
 
     def test_vector_creation(self) -> None:
         """Test vector creation and basic properties."""
-        v = Vector([1, 2, 3])
+        v = Vector(_V123)
         assert len(v) == 3
         assert v.dimension == 3
         assert v[0] == 1
@@ -30,7 +45,7 @@ class TestVector:
 
     def test_vector_addition(self) -> None:
         """Test vector addition."""
-        v1 = Vector([1, 2, 3])
+        v1 = Vector(_V123)
         v2 = Vector([4, 5, 6])
         result = v1 + v2
         assert result.components == [5, 7, 9]
@@ -47,13 +62,13 @@ class TestVector:
     def test_vector_subtraction(self) -> None:
         """Test vector subtraction."""
         v1 = Vector([5, 7, 9])
-        v2 = Vector([1, 2, 3])
+        v2 = Vector(_V123)
         result = v1 - v2
         assert result.components == [4, 5, 6]
 
     def test_vector_scalar_multiplication(self) -> None:
         """Test scalar multiplication."""
-        v = Vector([1, 2, 3])
+        v = Vector(_V123)
         result = 2 * v
         assert result.components == [2, 4, 6]
 
@@ -62,7 +77,7 @@ class TestVector:
 
     def test_vector_dot_product(self) -> None:
         """Test dot product."""
-        v1 = Vector([1, 2, 3])
+        v1 = Vector(_V123)
         v2 = Vector([4, 5, 6])
         result = v1.dot(v2)
         assert result == 32  # 1*4 + 2*5 + 3*6 = 4 + 10 + 18 = 32
@@ -83,11 +98,28 @@ class TestVector:
         ):
             v1.cross(v2)
 
+    def test_vector_perp_dot(self) -> None:
+        """Test the 2D perp-dot product for exact, float and invalid input."""
+        assert Vector([1, 2]).perp_dot(Vector([3, 4])) == -2
+        assert Vector([3, 4]).perp_dot(Vector([1, 2])) == 2
+        assert Vector([1.5, 0.5]).perp_dot(Vector([2.0, 4.0])) == 5.0
+
+        with pytest.raises(ValueError, match="only defined for 2D vectors"):
+            Vector(_V123).perp_dot(Vector([4, 5, 6]))
+
     def test_vector_magnitude(self) -> None:
         """Test vector magnitude computation."""
         v = Vector([3, 4])
         assert v.magnitude() == 5  # sqrt(3^2 + 4^2) = 5
 
+    def test_vector_magnitude_f(self) -> None:
+        """Test float magnitude for exact, float and symbolic vectors."""
+        assert Vector([3, 4]).magnitude_f() == 5.0
+        assert Vector([sp.Rational(1, 2), 0]).magnitude_f() == 0.5
+        assert Vector([3.0, 4.0]).magnitude_f() == 5.0
+        with pytest.raises(TypeError):
+            Vector([sp.Symbol("x"), 1]).magnitude_f()
+
     def test_vector_normalize(self) -> None:
         """Test vector normalization."""
         v = Vector([3, 4])
@@ -101,9 +133,63 @@ class TestVector:
         with pytest.raises(ValueError, match="Cannot normalize zero vector"):
             v.normalize()
 
+    def test_float_vector_operations(self) -> None:
+        """Test that float vectors use the array path with matching results."""
+        v1 = Vector([1.5, 2.0, -0.5])
+        v2 = Vector([0.25, 4.0, 1.0])
+        assert v1._array is not None and v2._array is not None
+        assert Vector(_V123)._array is None
+
+        assert (v1 + v2).components == [1.75, 6.0, 0.5]
+        assert (v1 - v2).components == [1.25, -2.0, -1.5]
+        assert (2 * v1).components == [3.0, 4.0, -1.0]
+        assert v1.dot(v2) == 7.875
+        assert v1.cross(v2).components == [4.0, -1.625, 5.5]
+        assert Vector([3.0, 4.0]).magnitude() == 5.0
+        assert Vector([3.0, 4.0]).normalize().components == [0.6, 0.8]
+        assert all(isinstance(c, sp.Float) for c in (v1 + v2).components)
+        assert str(v1 + v2) == str(Vector([sp.Float(1.75), 6.0, 0.5]))
+
+    def test_small_float_vectors_match_array_path(self) -> None:
+        """Test that the closed forms for small float vectors agree with NumPy."""
+        a = np.array([1.5, -2.25, 3.0])
+        b = np.array([0.5, 4.0, -1.75])
+        v, w = Vector(a), Vector(b)
+        assert float(v.dot(w)) == pytest.approx(float(a @ b))
+        assert v.magnitude_f() == pytest.approx(float(np.linalg.norm(a)))
+        assert float(v.magnitude()) == v.magnitude_f()
+        assert float(Vector([3.0, 4.0]).dot(Vector([1.0, 2.0]))) == 11.0
+
+    def test_vector_from_ndarray(self) -> None:
+        """Test that float arrays back a vector directly and int arrays stay exact."""
+        v = Vector(np.arange(6, dtype=np.float64)[::2])
+        assert v._array is not None and v._array.flags.c_contiguous
+        assert v.components == [0.0, 2.0, 4.0]
+
+        exact = Vector(np.array([1, 2, 3]))
+        assert exact._array is None
+        assert exact.components == [1, 2, 3]
+        assert all(isinstance(c, sp.Integer) for c in exact.components)
+
+        with pytest.raises(ValueError, match="one-dimensional"):
+            Vector(np.ones((2, 2)))
+        with pytest.raises(ValueError, match="at least one component"):
+            Vector(np.array([], dtype=np.float64))
+
+    def test_mixed_exact_and_float_vectors_stay_exact(self) -> None:
+        """Test that exact entries next to a Float are not rounded to float64."""
+        v1 = Vector([sp.Rational(1, 3), 0.5])
+        v2 = Vector([sp.Rational(2, 3), 0.5])
+        assert v1._array is None
+
+        total = (v1 + v2).components
+        assert total == [1, 1.0]
+        assert isinstance(total[0], sp.Integer)
+        assert Vector([2**60, 0.5])._array is None
+
     def test_vector_to_sympy_matrix(self) -> None:
         """Test conversion to SymPy Matrix."""
-        v = Vector([1, 2, 3])
+        v = Vector(_V123)
         matrix = v.to_sympy_matrix()
         expected = Matrix([1, 2, 3])
         assert matrix == expected
@@ -116,9 +202,16 @@ class TestMatrixOperations:
         """Test matrix creation."""
         data: List[List[Union[int, float, sp.Expr]]] = [[1, 2], [3, 4]]
         matrix = MatrixOperations.create_matrix(data)
-        expected = Matrix([[1, 2], [3, 4]])
+        expected = Matrix(_A22)
         assert matrix == expected
 
+    def test_create_matrix_mixed_numeric(self) -> None:
+        """Test matrix creation from mixed int and float entries."""
+        matrix = MatrixOperations.create_matrix([[1.5, 2], [3, 4]])
+        assert matrix == Matrix([[1.5, 2], [3, 4]])
+        assert matrix[0, 0].is_Float
+        assert matrix[0, 1].is_Integer
+
     def test_create_matrix_empty(self) -> None:
         """Test creating empty matrix raises error."""
         with pytest.raises(ValueError, match="Matrix data cannot be empty"):
@@ -149,12 +242,41 @@ class TestMatrixOperations:
         expected = Matrix([[1, 4], [2, 5], [3, 6]])
         assert transposed == expected
 
+    def test_multiply(self) -> None:
+        """Test matrix multiplication for exact and float matrices."""
+        a = Matrix(_A22)
+        b = Matrix([[5, 6], [7, 8]])
+        assert MatrixOperations.multiply(a, b) == Matrix([[19, 22], [43, 50]])
+
+        a_float = MatrixOperations.create_matrix([[1.5, 2.0], [3.0, 4.0]])
+        product = MatrixOperations.multiply(a_float, b)
+        assert product == Matrix([[21.5, 25.0], [43.0, 50.0]])
+        assert all(entry.is_Float for entry in product)
+
+    def test_multiply_incompatible(self) -> None:
+        """Test multiplying matrices with incompatible shapes."""
+        with pytest.raises(ValueError, match="incompatible for multiplication"):
+            MatrixOperations.multiply(Matrix([[1, 2]]), Matrix([[1, 2]]))
+
     def test_determinant(self) -> None:
         """Test matrix determinant."""
-        matrix = Matrix([[1, 2], [3, 4]])
+        matrix = Matrix(_A22)
         det = MatrixOperations.determinant(matrix)
         assert det == -2  # 1*4 - 2*3 = -2
 
+    def test_determinant_small_closed_forms(self) -> None:
+        """Test the 2x2/3x3 closed forms against SymPy's elimination."""
+        exact = Matrix([[2, -1, 0], [sp.Rational(1, 2), 3, 1], [4, 0, -2]])
+        assert MatrixOperations.determinant(exact) == exact.det()
+
+        inexact = Matrix([[1.5, 2.0], [3.0, 5.0]])
+        assert MatrixOperations.determinant(inexact) == 1.5
+        assert MatrixOperations.determinant(Matrix(_A33)) == 0
+
+        x = sp.Symbol("x")
+        symbolic = Matrix([[x, 1], [2, x]])
+        assert sp.expand(MatrixOperations.determinant(symbolic) - (x**2 - 2)) == 0
+
     def test_determinant_non_square(self) -> None:
         """Test determinant of non-square matrix raises error."""
         matrix = Matrix([[1, 2, 3], [4, 5, 6]])
@@ -165,30 +287,59 @@ class TestMatrixOperations:
 
     def test_inverse(self) -> None:
         """Test matrix inverse."""
-        matrix = Matrix([[1, 2], [3, 4]])
+        matrix = Matrix(_A22)
         inverse = MatrixOperations.inverse(matrix)
-        # Check that A * A^-1 = I
-        identity = matrix * inverse
-        expected_identity = Matrix([[1, 0], [0, 1]])
-        # Use simplify to handle floating point precision
-        simplified_identity = sp.simplify(identity)
-        assert simplified_identity == expected_identity
+        # Integer matrices are inverted exactly, so A * A^-1 = I holds as-is
+        assert matrix * inverse == Matrix([[1, 0], [0, 1]])
 
     def test_inverse_singular_matrix(self) -> None:
         """Test inverse of singular matrix raises error."""
-        matrix = Matrix([[1, 2], [2, 4]])  # Determinant is 0
+        matrix = Matrix(_SINGULAR22)  # Determinant is 0
         with pytest.raises(ValueError, match="Matrix is singular"):
             MatrixOperations.inverse(matrix)
 
+    def test_inverse_float(self) -> None:
+        """Test the LAPACK path for floating-point matrices."""
+        matrix = Matrix([[4.0, 7.0], [2.0, 6.0]])
+        inverse = MatrixOperations.inverse(matrix)
+
+        assert all(isinstance(x, sp.Float) for x in inverse)
+        assert [float(x) for x in inverse] == pytest.approx([0.6, -0.7, -0.2, 0.4])
+
+        with pytest.raises(ValueError, match="Matrix is singular"):
+            MatrixOperations.inverse(Matrix([[1.0, 2.0], [2.0, 4.0]]))
+
+        # A LAPACK result failing the residual check falls back to SymPy
+        with patch("numpy.linalg.solve", return_value=np.zeros((2, 2))):
+            inverse = MatrixOperations.inverse(Matrix([[4.0, 7.0], [2.0, 6.0]]))
+        assert [float(x) for x in inverse] == pytest.approx([0.6, -0.7, -0.2, 0.4])
+
     def test_rank(self) -> None:
         """Test matrix rank computation."""
-        matrix = Matrix([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+        matrix = Matrix(_A33)
         rank = MatrixOperations.rank(matrix)
         assert rank == 2  # This matrix has rank 2
 
+    def test_rank_integer(self) -> None:
+        """Test the exact integer elimination against SymPy's rank."""
+        matrices = [
+            Matrix([[0, 0], [0, 0]]),
+            Matrix([[0, 3, 6], [0, 1, 2]]),
+            Matrix([[2, 4, 1, 0], [1, 2, 3, 5], [3, 6, 4, 5]]),
+            Matrix(5, 5, lambda i, j: (i * 7 + j * 3) % 11 - 5),
+        ]
+        for matrix in matrices:
+            assert MatrixOperations.rank(matrix) == matrix.rank()
+
+    def test_rank_float(self) -> None:
+        """Test the SVD path for floating-point matrices."""
+        matrix = Matrix([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0], [7.0, 8.0, 9.0]])
+        assert MatrixOperations.rank(matrix) == 2
+        assert MatrixOperations.rank(Matrix([[0.5, 0.0], [0.0, 0.25]])) == 2
+
     def test_trace(self) -> None:
         """Test matrix trace computation."""
-        matrix = Matrix([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+        matrix = Matrix(_A33)
         trace = MatrixOperations.trace(matrix)
         assert trace == 15  # 1 + 5 + 9 = 15
 
@@ -199,6 +350,36 @@ class TestMatrixOperations:
         # Should be [1, 2] (diagonal elements)
         assert set(eigenvals) == {1, 2}
 
+    def test_eigenvalues_repeated(self) -> None:
+        """Test repeated eigenvalues are listed once per multiplicity."""
+        matrix = Matrix([[2, 0], [0, 2]])
+        assert MatrixOperations.eigenvalues(matrix) == [2, 2]
+
+    def test_eigenvalues_general_float(self) -> None:
+        """Test the LAPACK QR path for non-symmetric floating-point matrices."""
+        triangular = Matrix([[3.0, 1.0], [0.0, 2.0]])
+        assert MatrixOperations.eigenvalues(triangular) == [2.0, 3.0]
+
+        rotation = Matrix([[0.0, -1.0], [1.0, 0.0]])
+        eigenvals = MatrixOperations.eigenvalues(rotation)
+        assert [complex(w) for w in eigenvals] == pytest.approx([-1j, 1j])
+
+    def test_eigen_symmetric_float(self) -> None:
+        """Test the LAPACK path for symmetric floating-point matrices."""
+        matrix = Matrix([[2.0, 1.0, 0.0], [1.0, 2.0, 0.0], [0.0, 0.0, 3.0]])
+
+        eigenvals = MatrixOperations.eigenvalues(matrix)
+        assert [float(w) for w in eigenvals] == pytest.approx([1.0, 3.0, 3.0])
+
+        eigenvects = MatrixOperations.eigenvectors(matrix)
+        assert [(float(w), m) for w, m, _ in eigenvects] == pytest.approx(
+            [(1.0, 1), (3.0, 2)]
+        )
+        for eigenval, _, vects in eigenvects:
+            for vect in vects:
+                residual = matrix * vect - eigenval * vect
+                assert max(abs(float(r)) for r in residual) < 1e-12
+
     def test_solve_system(self) -> None:
         """Test solving linear system Ax = b."""
         A = Matrix([[2, 1], [1, 1]])
@@ -209,9 +390,36 @@ class TestMatrixOperations:
         result = A * solution
         assert result == b
 
+    def test_rational_lu_cache(self) -> None:
+        """Test that exact operations on one matrix share its cached LU factors."""
+        _rational_lu.cache_clear()
+        matrix = Matrix([[0, 2, 1, 0], [3, 4, 0, 1], [1, 0, 5, 2], [2, 1, 0, 3]])
+
+        assert MatrixOperations.determinant(matrix) == matrix.det()
+        assert MatrixOperations.inverse(matrix) == matrix.inv()
+        b = Matrix([1, 2, 3, 4])
+        assert MatrixOperations.solve_system(matrix, b) == matrix.LUsolve(b)
+
+        info = _rational_lu.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
+
+        with pytest.raises(ValueError, match="not invertible"):
+            MatrixOperations.solve_system(Matrix(_SINGULAR22), Matrix([1, 2]))
+
+    def test_solve_system_float(self) -> None:
+        """Test the LAPACK path for floating-point systems."""
+        A = Matrix([[2.0, 1.0], [1.0, 1.0]])
+        b = Matrix([3.0, 2.0])
+        solution = MatrixOperations.solve_system(A, b)
+
+        assert [float(x) for x in solution] == pytest.approx([1.0, 1.0])
+
+        with pytest.raises(ValueError, match="not invertible"):
+            MatrixOperations.solve_system(Matrix([[1.0, 2.0], [2.0, 4.0]]), b)
+
     def test_row_echelon_form(self) -> None:
         """Test row echelon form computation."""
-        matrix = Matrix([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+        matrix = Matrix(_A33)
         rref = MatrixOperations.row_echelon_form(matrix)
 
         # The result should be in reduced row echelon form
@@ -220,6 +428,19 @@ class TestMatrixOperations:
         assert rref[1, 0] == 0
         assert rref[2, 0] == 0
 
+    def test_row_echelon_form_float(self) -> None:
+        """Test the NumPy path for floating-point matrices."""
+        matrix = Matrix([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0], [7.0, 8.0, 9.0]])
+        rref = MatrixOperations.row_echelon_form(matrix)
+
+        expected = [1.0, 0.0, -1.0, 0.0, 1.0, 2.0, 0.0, 0.0, 0.0]
+        assert [float(x) for x in rref] == pytest.approx(expected, abs=1e-12)
+        assert [float(x) for x in rref[:, 0]] == [1.0, 0.0, 0.0]
+
+        wide = Matrix([[0.0, 2.0, 4.0], [0.0, 1.0, 3.0]])
+        rref = MatrixOperations.row_echelon_form(wide)
+        assert [float(x) for x in rref] == [0.0, 1.0, 0.0, 0.0, 0.0, 1.0]
+
 
 class TestLinearAlgebra:
     """Test the main LinearAlgebra class."""
@@ -233,7 +454,7 @@ class TestLinearAlgebra:
     def test_create_matrix(self) -> None:
         """Test matrix creation through LinearAlgebra."""
         matrix = LinearAlgebra.create_matrix([[1, 2], [3, 4]])
-        expected = Matrix([[1, 2], [3, 4]])
+        expected = Matrix(_A22)
         assert matrix == expected
 
     def test_vector_angle(self) -> None:
@@ -241,9 +462,19 @@ class TestLinearAlgebra:
         v1 = Vector([1, 0])
         v2 = Vector([0, 1])
         angle = LinearAlgebra.vector_angle(v1, v2)
-        # Angle should be π/2 (90 degrees)
-        expected = sp.pi / 2
-        assert sp.simplify(angle - expected) == 0
+        # Exact input gives exactly π/2 (90 degrees), no simplification needed
+        assert angle == sp.pi / 2
+
+    def test_vector_angle_float(self) -> None:
+        """Test the Gram-matrix path for float vectors."""
+        angle = LinearAlgebra.vector_angle(Vector([1.0, 0.0]), Vector([1.0, 1.0]))
+        assert isinstance(angle, sp.Float)
+        assert float(angle) == pytest.approx(math.pi / 4)
+
+        v = Vector([0.1, 0.2, 0.3])
+        assert float(LinearAlgebra.vector_angle(v, 3 * v)) == pytest.approx(0, abs=1e-7)
+        with pytest.raises(ValueError, match="zero vector"):
+            LinearAlgebra.vector_angle(v, Vector([0.0, 0.0, 0.0]))
 
     def test_are_orthogonal(self) -> None:
         """Test orthogonality check."""
@@ -254,6 +485,14 @@ class TestLinearAlgebra:
         v3 = Vector([1, 1])
         assert LinearAlgebra.are_orthogonal(v1, v3) is False
 
+    def test_are_orthogonal_float(self) -> None:
+        """Test that float orthogonality tolerates rounding in the dot product."""
+        assert LinearAlgebra.are_orthogonal(Vector([1.0, 0.0]), Vector([0.0, 1.0]))
+        assert LinearAlgebra.are_orthogonal(
+            Vector([0.1, 0.2, 0.3]), Vector([0.3, 0.0, -0.1])
+        )
+        assert not LinearAlgebra.are_orthogonal(Vector([1.0, 0.0]), Vector([1e-6, 1.0]))
+
     def test_are_parallel(self) -> None:
         """Test parallelism check."""
         v1 = Vector([1, 2])
@@ -263,6 +502,17 @@ class TestLinearAlgebra:
         v3 = Vector([1, 3])
         assert LinearAlgebra.are_parallel(v1, v3) is False
 
+    def test_are_parallel_numeric_paths(self) -> None:
+        """Test the Cauchy-Schwarz check for exact and float vectors."""
+        assert LinearAlgebra.are_parallel(Vector([1, -2, 3]), Vector([-2, 4, -6]))
+        assert not LinearAlgebra.are_parallel(Vector([1, 0]), Vector([0, 0]))
+        assert LinearAlgebra.are_parallel(Vector([0, 0]), Vector([1, 0]))
+
+        # Component ratios 0.1/0.3 and 0.7/2.1 differ in the last bit
+        assert LinearAlgebra.are_parallel(Vector([0.1, 0.7]), Vector([0.3, 2.1]))
+        assert not LinearAlgebra.are_parallel(Vector([1.0, 2.0]), Vector([1.0, 2.001]))
+        assert not LinearAlgebra.are_parallel(Vector([1.0, 0.0]), Vector([0.0, 0.0]))
+
     def test_gram_schmidt(self) -> None:
         """Test Gram-Schmidt orthogonalization."""
         v1 = Vector([1, 1, 0])
@@ -275,7 +525,76 @@ class TestLinearAlgebra:
         assert len(orthogonal) == 2
         # Orthogonal vectors should have zero dot product
         dot_product = orthogonal[0].dot(orthogonal[1])
-        assert sp.simplify(dot_product) == 0
+        assert dot_product == 0
+
+    def test_gram_schmidt_float_vectors(self) -> None:
+        """Test Gram-Schmidt on float vectors, dropping dependent ones."""
+        vectors = [
+            Vector([1.0, 1.0, 0.0]),
+            Vector([2.0, 2.0, 0.0]),  # Dependent on the first vector
+            Vector([1.0, 0.0, 1.0]),
+        ]
+
+        orthogonal = LinearAlgebra.gram_schmidt(vectors)
+
+        assert len(orthogonal) == 2
+        assert abs(float(orthogonal[0].dot(orthogonal[1]))) < 1e-12
+        assert [float(c) for c in orthogonal[1].components] == pytest.approx(
+            [0.5, -0.5, 1.0]
+        )
+
+    def test_gram_schmidt_nearly_dependent_floats(self) -> None:
+        """Test that the float path stays orthogonal for ill-conditioned input."""
+        eps = 1e-7
+        batch = VectorBatch(
+            [[1.0, eps, 0.0, 0.0], [1.0, 0.0, eps, 0.0], [1.0, 0.0, 0.0, eps]]
+        )
+        basis = LinearAlgebra.gram_schmidt(batch).array
+        assert len(basis) == 3
+
+        q = basis / np.linalg.norm(basis, axis=1)[:, None]
+        assert np.abs(q @ q.T - np.eye(3)).max() < 1e-12
+
+    def test_gram_schmidt_vector_batch(self) -> None:
+        """Test Gram-Schmidt on a VectorBatch returns an orthogonal batch."""
+        batch = VectorBatch.from_vectors(
+            [Vector([1, 1, 0]), Vector([2, 2, 0]), Vector([1, 0, 1])]
+        )
+
+        orthogonal = LinearAlgebra.gram_schmidt(batch)
+
+        assert isinstance(orthogonal, VectorBatch)
+        assert len(orthogonal) == 2
+        assert orthogonal.dimension == 3
+        assert abs(float(orthogonal[0].dot(orthogonal[1]))) < 1e-12
+        assert [float(c) for c in orthogonal[1].components] == pytest.approx(
+            [0.5, -0.5, 1.0]
+        )
+
+    def test_vector_batch_validation(self) -> None:
+        """Test VectorBatch rejects mismatched or symbolic vectors."""
+        with pytest.raises(ValueError, match="same dimension"):
+            VectorBatch.from_vectors([Vector([1, 2]), Vector(_V123)])
+        with pytest.raises(ValueError, match="at least one vector"):
+            VectorBatch.from_vectors([])
+        with pytest.raises(TypeError):
+            VectorBatch.from_vectors([Vector([sp.Symbol("x"), 1])])
+
+    def test_vector_batch_dot_and_normalize(self) -> None:
+        """Test row-wise batch operations against the single-vector methods."""
+        a = VectorBatch([[3.0, 4.0, 0.0], [1.0, 2.0, 2.0]])
+        b = VectorBatch([[1.0, 0.0, 0.0], [2.0, -1.0, 0.5]])
+
+        assert a.dot(b).tolist() == [3.0, 1.0]
+        assert a.magnitudes().tolist() == [5.0, 3.0]
+        unit = a.normalize()
+        assert unit[0].components == Vector([3.0, 4.0, 0.0]).normalize().components
+        assert np.allclose(unit.magnitudes(), 1.0)
+
+        with pytest.raises(ValueError, match="same shape"):
+            a.dot(VectorBatch([[1.0, 2.0, 3.0]]))
+        with pytest.raises(ValueError, match="zero vector"):
+            VectorBatch([[1.0, 0.0], [0.0, 0.0]]).normalize()
 
     def test_project_vector(self) -> None:
         """Test vector projection."""
@@ -294,6 +613,16 @@ class TestLinearAlgebra:
 
         with pytest.raises(ValueError, match="Cannot project onto zero vector"):
             LinearAlgebra.project_vector(v, onto)
+        with pytest.raises(ValueError, match="Cannot project onto zero vector"):
+            LinearAlgebra.project_vector(Vector([1.0, 1.0]), Vector([0.0, 0.0]))
+
+    def test_project_vector_float(self) -> None:
+        """Test that float projections stay on the array path."""
+        projection = LinearAlgebra.project_vector(
+            Vector([2.0, 1.0]), Vector([1.0, 1.0])
+        )
+        assert projection._array is not None
+        assert projection.components == [1.5, 1.5]
 
 
 class TestIntegration:
@@ -301,7 +630,7 @@ class TestIntegration:
 
     def test_vector_matrix_multiplication(self) -> None:
         """Test multiplying a matrix by a vector."""
-        matrix = Matrix([[1, 2], [3, 4]])
+        matrix = Matrix(_A22)
         vector = Vector([1, 2])
         vector_matrix = vector.to_sympy_matrix()
 
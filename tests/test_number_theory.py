@@ -2,14 +2,22 @@
 Tests for the number theory module.
 """
 
+import pytest
+
+from eternal_math import number_theory
 from eternal_math.number_theory import (
     NumberTheoryUtils,
+    _is_prime,
+    _segmented_sieve,
+    collatz_iter,
+    collatz_lengths,
     collatz_sequence,
     euler_totient,
     fibonacci,
     fibonacci_sequence,
     is_perfect_number,
     sieve_of_eratosthenes,
+    totient_sieve,
     twin_primes,
     verify_goldbach_conjecture,
 )
@@ -25,6 +33,30 @@ def test_sieve_of_eratosthenes() -> None:
     assert sieve_of_eratosthenes(1) == []
     assert sieve_of_eratosthenes(2) == [2]
 
+    # Array mode returns the same primes without building a list
+    assert sieve_of_eratosthenes(30, as_array=True).tolist() == expected
+    assert sieve_of_eratosthenes(1, as_array=True).size == 0
+
+
+def test_segmented_sieve_matches_standard_sieve() -> None:
+    """Test that the segmented sieve agrees with the standard sieve."""
+    assert _segmented_sieve(200_000).tolist() == sieve_of_eratosthenes(200_000)
+    assert len(sieve_of_eratosthenes(1_000_001)) == 78498
+
+
+def test_segmented_sieve_threaded(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that sieving segments on a thread pool gives the same primes."""
+    expected = _segmented_sieve(3_000_000).tolist()
+    monkeypatch.setattr("eternal_math.number_theory.os.cpu_count", lambda: 4)
+    assert _segmented_sieve(3_000_000).tolist() == expected
+
+
+def test_is_prime_miller_rabin() -> None:
+    """Test the Miller-Rabin primality helper."""
+    assert [n for n in range(100) if _is_prime(n)] == sieve_of_eratosthenes(99)
+    assert _is_prime(2**61 - 1) is True  # Mersenne prime
+    assert _is_prime(3_215_031_751) is False  # Strong pseudoprime to bases 2-7
+
 
 def test_fibonacci() -> None:
     """Test Fibonacci number calculation."""
@@ -37,6 +69,21 @@ def test_fibonacci() -> None:
     seq = fibonacci_sequence(8)
     expected = [0, 1, 1, 2, 3, 5, 8, 13]
     assert seq == expected
+    assert fibonacci_sequence(1) == [0]
+    assert fibonacci_sequence(0) == []
+
+    # Results are cached internally; callers must get independent lists
+    seq.append(-1)
+    assert fibonacci_sequence(8) == expected
+
+
+def test_fibonacci_sequence_beyond_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test terms past the cached prefix are computed without being stored."""
+    monkeypatch.setattr(number_theory, "_FIBONACCI_CACHE_LIMIT", 5)
+    monkeypatch.setattr(number_theory, "_FIBONACCI", [0, 1])
+
+    assert fibonacci_sequence(10) == [0, 1, 1, 2, 3, 5, 8, 13, 21, 34]
+    assert number_theory._FIBONACCI == [0, 1, 1, 2, 3]
 
 
 def test_perfect_numbers() -> None:
@@ -45,6 +92,13 @@ def test_perfect_numbers() -> None:
     assert is_perfect_number(28) is True  # 1 + 2 + 4 + 7 + 14 = 28
     assert is_perfect_number(12) is False
     assert is_perfect_number(1) is False
+    assert is_perfect_number(496) is True
+    assert is_perfect_number(2**60 * (2**61 - 1)) is True
+
+    # Perfect squares count their root only once
+    assert is_perfect_number(4) is False
+    assert is_perfect_number(36) is False
+    assert is_perfect_number(945) is False
 
 
 def test_euler_totient() -> None:
@@ -52,6 +106,16 @@ def test_euler_totient() -> None:
     assert euler_totient(1) == 1
     assert euler_totient(9) == 6  # φ(9) = 9 * (1 - 1/3) = 6
     assert euler_totient(10) == 4  # φ(10) = 10 * (1 - 1/2) * (1 - 1/5) = 4
+    assert euler_totient(72) == 24  # Repeated factors 2^3 * 3^2 counted once
+    assert euler_totient(97) == 96
+
+
+def test_totient_sieve() -> None:
+    """Test the sieve-based totient table against euler_totient."""
+    phi = totient_sieve(100)
+    assert phi[1:].tolist() == [euler_totient(n) for n in range(1, 101)]
+    assert phi[0] == 0
+    assert totient_sieve(1).tolist() == [0, 1]
 
 
 def test_collatz_sequence() -> None:
@@ -64,17 +128,42 @@ def test_collatz_sequence() -> None:
     assert collatz_sequence(0) == []
 
 
+def test_collatz_iter() -> None:
+    """Test lazy Collatz sequence generation."""
+    assert list(collatz_iter(3)) == collatz_sequence(3)
+    assert sum(1 for _ in collatz_iter(27)) == 112
+    assert list(collatz_iter(0)) == []
+
+
+def test_collatz_lengths() -> None:
+    """Test batched Collatz sequence lengths."""
+    starts = list(range(-1, 200))
+    expected = [len(collatz_sequence(n)) for n in starts]
+    assert collatz_lengths(starts).tolist() == expected
+
+    # Starts whose 3n + 1 step would overflow int64 fall back to Python ints
+    big = 2**62 + 1
+    assert collatz_lengths([big]).tolist() == [len(collatz_sequence(big))]
+
+
 def test_twin_primes() -> None:
     """Test twin prime detection."""
     twins = twin_primes(20)
     expected = [(3, 5), (5, 7), (11, 13), (17, 19)]
     assert twins == expected
 
+    # A precomputed sieve reaching past the limit is reused and truncated
+    primes = sieve_of_eratosthenes(50)
+    assert twin_primes(20, primes=primes) == expected
+    assert twin_primes(20, primes=sieve_of_eratosthenes(50, as_array=True)) == expected
+    assert twin_primes(2) == []
+
 
 def test_goldbach_conjecture() -> None:
     """Test Goldbach conjecture verification for small numbers."""
     # This should be true for small limits
     assert verify_goldbach_conjecture(100) is True
+    assert verify_goldbach_conjecture(100, primes=sieve_of_eratosthenes(100)) is True
 
 
 def test_chinese_remainder_theorem() -> None:
@@ -88,10 +177,15 @@ def test_chinese_remainder_theorem() -> None:
 if __name__ == "__main__":
     # Run tests manually
     test_sieve_of_eratosthenes()
+    test_segmented_sieve_matches_standard_sieve()
+    test_is_prime_miller_rabin()
     test_fibonacci()
     test_perfect_numbers()
     test_euler_totient()
+    test_totient_sieve()
     test_collatz_sequence()
+    test_collatz_iter()
+    test_collatz_lengths()
     test_twin_primes()
     test_goldbach_conjecture()
     test_chinese_remainder_theorem()
@@ -6,7 +6,14 @@ import unittest
 from typing import Any
 from unittest.mock import patch
 
-from eternal_math.visualization import MathVisualizer, create_output_directory
+import numpy as np
+
+from eternal_math.visualization import (
+    MathVisualizer,
+    _compile_expression,
+    _evaluate_expression,
+    create_output_directory,
+)
 
 
 class TestMathVisualizer(unittest.TestCase):
@@ -39,6 +46,30 @@ class TestMathVisualizer(unittest.TestCase):
         mock_show.assert_called_once()
         mock_close.assert_called_once()
 
+    @patch("matplotlib.pyplot.show")
+    @patch("matplotlib.pyplot.close")
+    def test_plot_function_reuses_compiled_expression(
+        self, mock_close: Any, mock_show: Any
+    ) -> None:
+        """Test that repeated plots of one expression compile it only once."""
+        _compile_expression.cache_clear()
+        self.assertTrue(self.visualizer.plot_function("x**3 - x"))
+        self.assertTrue(self.visualizer.plot_function("x**3 - x", x_range=(0, 1)))
+        info = _compile_expression.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 1))
+
+    def test_evaluate_expression_fallbacks(self) -> None:
+        """Test expression evaluation with and without the numexpr backend."""
+        x_vals = np.array([1.0, 2.0, 5.0])
+        # Max lowers to a Python conditional that numexpr rejects
+        np.testing.assert_allclose(
+            _evaluate_expression("Max(x, 2)", x_vals), [2.0, 2.0, 5.0]
+        )
+        with patch("eternal_math.visualization.numexpr", None):
+            np.testing.assert_allclose(
+                _evaluate_expression("x**3 - 3*x + 1", x_vals), [-1.0, 3.0, 111.0]
+            )
+
     def test_plot_function_invalid_expression(self) -> None:
         """Test plotting with invalid expression."""
         result = self.visualizer.plot_function("invalid_func(x)")
@@ -107,16 +138,12 @@ class TestMathVisualizer(unittest.TestCase):
     def test_create_output_directory(self) -> None:
         """Test output directory creation."""
         # Test with mock to avoid creating actual directory
-        with (
-            patch("os.path.exists") as mock_exists,
-            patch("os.makedirs") as mock_makedirs,
-        ):
-
-            mock_exists.return_value = False
+        with patch("os.makedirs") as mock_makedirs:
             result = create_output_directory()
 
             self.assertEqual(result, "math_plots")
-            mock_makedirs.assert_called_once_with("math_plots")
+            # exist_ok keeps concurrent test workers from racing on creation
+            mock_makedirs.assert_called_once_with("math_plots", exist_ok=True)
 
 
 class TestVisualizationIntegration(unittest.TestCase):